@@ -0,0 +1,10 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmarks for some PyGeodesy hot paths, run each as
+#  python -m benchmarks.bench...  from the top-level directory.
+# Compare the hot paths against a saved baseline with
+#  python -m benchmarks.run  and save a new baseline with option -update.
+
+__all__ = ()
+__version__ = '17.05.16'
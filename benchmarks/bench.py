@@ -0,0 +1,145 @@
+
+# -*- coding: utf-8 -*-
+
+# Base class for the PyGeodesy benchmarks.
+
+from os.path import basename, dirname
+import sys
+try:
+    import pygeodesy as _  # PYCHOK expected
+except ImportError:
+    # extend sys.path to ../.. directory
+    sys.path.insert(0, dirname(dirname(__file__)))
+from pygeodesy import version as geodesy_version
+
+from json import dump
+from platform import architecture
+from timeit import default_timer as _timer
+try:
+    import tracemalloc  # Python 3.4+
+except ImportError:
+    tracemalloc = None
+
+__all__ = ('Bench', 'secs2str', 'versions')
+__version__ = '17.05.16'
+
+versions = ' '.join(('PyGeodesy', geodesy_version,
+                     'Python', sys.version.split()[0], architecture()[0]))
+
+
+def secs2str(secs):
+    unit = ['sec', 'ms', 'us', 'ns']
+    while secs < 1 and len(unit) > 1:
+        secs *= 1000.0
+        unit.pop(0)
+    return '%.3f %s' % (secs, unit[0])
+
+
+class Bench(object):
+    '''Time functions, compare their results and print both.
+    '''
+    _prefix = '    '
+
+    number = 1000  # calls per repeat
+    repeat = 5  # best of ...
+
+    def __init__(self, file, version, number=0, repeat=0):
+        self._name = basename(file)
+        self._version = version
+        if number > 0:
+            self.number = number
+        if repeat > 0:
+            self.repeat = repeat
+        self.results = {}  # by name
+        self.printf('benchmark %s version %s (%s)', self._name, version, versions, nl=1)
+
+    def allocs(self, name, count, func, *args, **kwds):
+        '''Print and return the peak number of bytes allocated and
+           the number of memory blocks retained per operation by
+           one call of func(*args, **kwds) for count operations,
+           or None if tracemalloc is not available.
+        '''
+        if tracemalloc is None:
+            self.printf('allocs %s: n/a', name)
+            return None
+
+        tracemalloc.start()
+        try:
+            s = tracemalloc.take_snapshot()
+            if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+                tracemalloc.reset_peak()
+            c = tracemalloc.get_traced_memory()[0]
+            r = func(*args, **kwds)  # PYCHOK keep result alive
+            p = tracemalloc.get_traced_memory()[1] - c
+            d = tracemalloc.take_snapshot().compare_to(s, 'filename')
+        finally:
+            tracemalloc.stop()
+        del r
+
+        n = float(max(count, 1))
+        p = max(p, 0) / n
+        b = sum(t.count_diff for t in d if t.count_diff > 0) / n
+        self.printf('allocs %s: %.1f bytes peak, %.2f blocks per op', name, p, b)
+        self._result(name, bytes=p, blocks=b)
+        return p, b
+
+    def delta(self, name, values, others):
+        '''Print and return the max. absolute difference between
+           two lists, sequences or tuples of scalars.
+        '''
+        d = max(abs(a - b) for a, b in zip(values, others))
+        self.printf('delta %s: %.3e', name, d)
+        return d
+
+    def json(self, path, **extra):
+        '''Write all results to a JSON file, with any extra items.
+        '''
+        d = dict(benchmark=self._name, version=self._version,
+                 versions=versions, number=self.number,
+                 repeat=self.repeat, results=self.results)
+        d.update(extra)
+        with open(path, 'w') as f:
+            dump(d, f, indent=1, sort_keys=True)
+        self.printf('results %s: %s', self._name, path)
+
+    def ops(self, name, count, func, *args, **kwds):
+        '''Print and return the number of operations per second
+           for func(*args, **kwds) performing count operations.
+        '''
+        t = self.time(name, func, *args, **kwds)
+        x = (count / t) if t > 0 else 0
+        self.printf('ops %s: %.0f per second', name, x)
+        self._result(name, count=count, ops=x)
+        return x
+
+    def printf(self, fmt, *args, **kwds):  # nl=0
+        nl = '\n' * kwds.get('nl', 0)
+        print((nl + self._prefix + (fmt % args)))
+
+    def time(self, name, func, *args, **kwds):
+        '''Print and return the best time per call (secs) of
+           func(*args, **kwds) for the given number and repeat.
+        '''
+        n, ts = self.number, []
+        r = range(n)
+        for _ in range(self.repeat):
+            s = _timer()
+            for _ in r:
+                func(*args, **kwds)
+            ts.append((_timer() - s) / n)
+        ts.sort()
+        b = ts[0]
+        m = ts[len(ts) // 2]  # median, upper if even
+        self.printf('time %s: %s per call', name, secs2str(b))
+        self._result(name, best=b, median=m)
+        return b
+
+    def _result(self, name, **kwds):
+        self.results.setdefault(name, {}).update(kwds)
+
+    def speedup(self, name, slow, fast):
+        '''Print and return the speedup factor.
+        '''
+        x = (slow / fast) if fast > 0 else 0
+        self.printf('speedup %s: %.2fx', name, x)
+        return x
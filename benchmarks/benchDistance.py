@@ -0,0 +1,55 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the ellipsoidalVincenty LatLon distanceTo versus
+# distanceTo2 with tolerances selecting the equirectangular,
+# haversine and Andoyer-Lambert formulas.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import ellipsoidalVincenty
+
+from random import random, seed
+
+
+def _corpus(n, r):
+    seed(48)  # repeatable
+    LatLon = ellipsoidalVincenty.LatLon
+    ps, qs = [], []
+    for _ in range(n):
+        a, b = random() * 160 - 80, random() * 360 - 180
+        ps.append(LatLon(a, b))
+        qs.append(LatLon(a + random() * r, b + random() * r))
+    return ps, qs
+
+
+def _distances(ps, qs):
+    return [p.distanceTo(q) for p, q in zip(ps, qs)]
+
+
+def _distance2s(ps, qs, tolerance):
+    return [p.distanceTo2(q, tolerance)[0] for p, q in zip(ps, qs)]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    for r in (0.1, 10.0):  # degrees
+        ps, qs = _corpus(n, r)
+        b.printf('corpus of %s point pairs within %s degrees', n, r, nl=1)
+
+        t0 = b.time('distanceTo', _distances, ps, qs)
+        ds = _distances(ps, qs)
+        for t in (0.01, 0.006, 0.001):
+            k = 'distanceTo2 %s' % (t,)
+            t1 = b.time(k, _distance2s, ps, qs, t)
+            b.speedup(k, t0, t1)
+            x = max(abs(a - d) / d for a, d in zip(_distance2s(ps, qs, t), ds))
+            b.printf('max relative error %s: %.3e', k, x)
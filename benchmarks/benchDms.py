@@ -0,0 +1,74 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark parseDMS versus the bulk parseDMSs on a corpus of mixed
+# DMS forms, with and without symbols, suffixes and blanks and the
+# DMS and compass formatters versus their bulk counterparts.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import F_D, F_DM, F_DMS, F_RAD, \
+                      bearingDMS, bearingDMSs, compassPoint, compassPoints, \
+                      latDMS, latDMSs, lonDMS, lonDMSs, \
+                      parseDMS, parseDMSs, toDMS, toDMSs
+
+from random import choice, random, seed
+
+
+def _corpus(n):
+    seed(31)  # repeatable
+    fs = (lambda d: '%.6f' % (d,),
+          lambda d: toDMS(d, form=F_D, prec=4),
+          lambda d: toDMS(d, form=F_DM, prec=3),
+          lambda d: toDMS(d, form=F_DMS, prec=2),
+          lambda d: latDMS(d, form=F_DMS, prec=1),
+          lambda d: lonDMS(d, form=F_DM, prec=2),
+          lambda d: toDMS(d, form=F_DMS).replace('′', "'").replace('″', '"'),
+          lambda d: toDMS(d, form=F_DMS).replace('°', '° ').replace('′', '′ '))
+    return [choice(fs)(random() * 180 - 90) for _ in range(n)]
+
+
+def _parses(parse, strs):
+    return [parse(t) for t in strs]
+
+
+def _formats(fmt, degs, *args):
+    return [fmt(d, *args) for d in degs]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    strs = _corpus(n)
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('corpus of %s mixed DMS strings, e.g. %r', n, strs[:4])
+
+    t0 = b.time('parseDMS', _parses, parseDMS, strs)
+    t1 = b.time('parseDMSs', parseDMSs, strs)
+    b.speedup('parseDMSs', t0, t1)
+
+    ds, ms = parseDMSs(strs)
+    b.delta('degrees', _parses(parseDMS, strs), ds)
+    b.printf('%s of %s strings invalid', sum(ms), len(ms))
+
+    degs = ds
+    for f in (F_D, F_DM, F_DMS, F_RAD):
+        for n, fmt, fmts in (('toDMS',      toDMS,      toDMSs),
+                             ('latDMS',     latDMS,     latDMSs),
+                             ('lonDMS',     lonDMS,     lonDMSs),
+                             ('bearingDMS', bearingDMS, bearingDMSs)):
+            t0 = b.time('%s %s' % (n, f), _formats, fmt, degs, f, 2)
+            t1 = b.time('%ss %s' % (n, f), fmts, degs, f, 2)
+            b.speedup('%ss %s' % (n, f), t0, t1)
+            if fmts(degs, f, 2) != _formats(fmt, degs, f, 2):
+                b.printf('%ss %s mismatch', n, f)
+
+    t0 = b.time('compassPoint', _formats, compassPoint, degs)
+    t1 = b.time('compassPoints', compassPoints, degs)
+    b.speedup('compassPoints', t0, t1)
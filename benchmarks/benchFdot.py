@@ -0,0 +1,77 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the fast versus precise dot products fdot and fdot3
+# and the accuracy delta of some of their callers.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import fdot, fdot3, fprecise, Datums, Transforms, \
+                      ellipsoidalVincenty, osgr, toUtm
+
+_xyz = 3980581.0, -9.0, 4966825.0
+_lls = [(a * 0.5, b * 0.5) for a in range(100, 120) for b in range(-10, 4)]
+
+
+def _osgrs():
+    LatLon = ellipsoidalVincenty.LatLon
+    r = []
+    for a, b in _lls:
+        p = LatLon(a, b, datum=Datums.OSGB36)
+        g = osgr.toOsgr(p)
+        r.extend((g.easting, g.northing))
+        q = g.toLatLon(LatLon)
+        r.extend((q.lat, q.lon))
+    return r
+
+
+def _transforms():
+    r = []
+    for T in Transforms.values():
+        r.extend(T.transform(*_xyz))
+        r.extend(T.transform(*_xyz, inverse=True))
+    return r
+
+
+def _utms():
+    LatLon = ellipsoidalVincenty.LatLon
+    r = []
+    for a, b in _lls:
+        u = toUtm(LatLon(a, b))
+        r.extend((u.easting, u.northing, u.convergence, u.scale))
+        q = u.toLatLon(LatLon)
+        r.extend((q.lat, q.lon))
+    return r
+
+
+def _both(b, name, func, *args, **kwds):
+    p = fprecise(True)
+    s = b.time(name + ' precise', func, *args, **kwds)
+    x = func(*args, **kwds)
+    fprecise(False)
+    f = b.time(name + ' fast', func, *args, **kwds)
+    y = func(*args, **kwds)
+    fprecise(p)
+    b.speedup(name, s, f)
+    if not isinstance(x, float):
+        b.delta(name, x, y)
+
+
+if __name__ == '__main__':
+
+    b = Bench(__file__, __version__, number=10000)
+
+    a3, b3, c3 = (1.5, 2.5, 3.5), (4.5, 5.5, 6.5), (7.5, 8.5, 9.5)
+    a4, b4 = (1.5, 2.5, 3.5, 4.5), (5.5, 6.5, 7.5, 8.5)
+    a6 = a3 + c3
+    _both(b, 'fdot[3]', fdot, a3, *b3)
+    _both(b, 'fdot[4]', fdot, a4, *b4)
+    _both(b, 'fdot3[6]', fdot3, a6, a6, a6, start=1.0)
+
+    b.number = 10
+    _both(b, 'Transform.transform', _transforms)
+    _both(b, 'toUtm/toLatLon', _utms)
+    _both(b, 'toOsgr/toLatLon', _osgrs)
@@ -0,0 +1,54 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the ellipsoidalNvector LatLon methods deltaTo and
+# destinationNed versus a prepared LocalFrame on many points.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import ellipsoidalNvector
+
+from random import random, seed
+
+
+def _deltas(home, ps):
+    return [home.deltaTo(p) for p in ps]
+
+
+def _destinations(home, ds):
+    return [home.destinationNed(d) for d in ds]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    LatLon = ellipsoidalNvector.LatLon
+    Ned = ellipsoidalNvector.Ned
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('corpus of %s points', n)
+
+    seed(41)  # repeatable, within 10 Km of home
+    home = LatLon(47.6, -122.3, height=50)
+    lats = [home.lat + random() * 0.2 - 0.1 for _ in range(n)]
+    lons = [home.lon + random() * 0.2 - 0.1 for _ in range(n)]
+    hs = [random() * 120 for _ in range(n)]
+    ps = [LatLon(a, b, height=h) for a, b, h in zip(lats, lons, hs)]
+
+    f = ellipsoidalNvector.LocalFrame(home)
+    t0 = b.time('deltaTo', _deltas, home, ps)
+    t1 = b.time('toNeds', f.toNeds, lats, lons, hs)
+    b.speedup('toNeds', t0, t1)
+    b.printf('toNeds: %.0f points per second', n / t1)
+
+    ns = f.toNeds(lats, lons, hs)
+    ds = [Ned(*t) for t in ns]
+    t0 = b.time('destinationNed', _destinations, home, ds)
+    t1 = b.time('fromNeds', f.fromNeds, ns)
+    b.speedup('fromNeds', t0, t1)
+    b.printf('fromNeds: %.0f points per second', n / t1)
@@ -0,0 +1,40 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the time to import pygeodesy in a new Python process,
+# importing sub-modules lazily, on demand versus all sub-modules
+# and instantiating registered datums, ellipsoids, etc. on demand.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from os.path import dirname
+from subprocess import call
+import sys
+
+_imports = (('import pygeodesy', 'import pygeodesy'),
+            ('Datums.WGS84', 'import pygeodesy; pygeodesy.Datums.WGS84'),
+            ('all Datums', 'import pygeodesy; pygeodesy.Datums.values()'),
+            ('lcc', 'from pygeodesy import lcc'),
+            ('ellipsoidalVincenty', 'from pygeodesy import ellipsoidalVincenty'),
+            ('all sub-modules', 'import pygeodesy as p; '
+                                '[getattr(p, n) for n in p.__all__]'))
+
+
+def _python(code, cwd):
+    return call((sys.executable, '-c', code), cwd=cwd)
+
+
+if __name__ == '__main__':
+
+    cwd = dirname(dirname(__file__)) or '.'
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('new Python process, including its startup')
+
+    t0 = b.time('python', _python, 'pass', cwd)
+    for n, c in _imports:
+        t = b.time(n, _python, c, cwd)
+        b.printf('%s: %.1f ms', n, (t - t0) * 1000)
@@ -0,0 +1,114 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the sphericalTrigonometry LatLon methods versus
+# the sphericalKernels functions on columns of lat-/longitudes.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import sphericalKernels, sphericalTrigonometry
+
+from random import random, seed
+
+
+def _corpus(n):
+    seed(36)  # repeatable
+    lats = [random() * 160 - 80 for _ in range(n)]
+    lons = [random() * 360 - 180 for _ in range(n)]
+    return lats, lons
+
+
+def _pairs(method, ps, qs):
+    return [method(p, q) for p, q in zip(ps, qs)]
+
+
+def _destinations(ps, ds, bs):
+    return [p.destination(d, b) for p, d, b in zip(ps, ds, bs)]
+
+
+def _intermediates(ps, qs, fs):
+    return [p.intermediateTo(q, f) for p, q, f in zip(ps, qs, fs)]
+
+
+def _intersections(ps, bs, qs, cs):
+    ts = []
+    for p, b, q, c in zip(ps, bs, qs, cs):
+        try:
+            ts.append(p.intersection(b, q, c))
+        except ValueError:
+            ts.append(None)
+    return ts
+
+
+def _crossTracks(ps, s, e):
+    return [p.crossTrackDistanceTo(s, e) for p in ps]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    lats1, lons1 = _corpus(n)
+    lats2, lons2 = lats1[::-1], lons1[::-1]
+    LatLon = sphericalTrigonometry.LatLon
+    K = sphericalKernels
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('corpus of %s point pairs', n)
+
+    ps = [LatLon(a, b) for a, b in zip(lats1, lons1)]
+    qs = [LatLon(a, b) for a, b in zip(lats2, lons2)]
+
+    for m, k in (('distanceTo',       'haversines'),
+                 ('initialBearingTo', 'initialBearings'),
+                 ('finalBearingTo',   'finalBearings')):
+        t0 = b.time(m, _pairs, getattr(LatLon, m), ps, qs)
+        t1 = b.time(k, getattr(K, k), lats1, lons1, lats2, lons2)
+        b.speedup(k, t0, t1)
+        b.delta(k, _pairs(getattr(LatLon, m), ps, qs),
+                   getattr(K, k)(lats1, lons1, lats2, lons2))
+
+    t = b.time('haversines origin', K.haversines, 51.127, 1.338, lats2, lons2)
+    b.printf('haversines origin: %.0f per second', n / t)
+
+    rs = [(a + random() * 0.5, b + random() * 0.5) for a, b in zip(lats1, lons1)]
+    lats3, lons3 = [r[0] for r in rs], [r[1] for r in rs]
+    t0 = b.time('haversines short', K.haversines, lats1, lons1, lats3, lons3)
+    t1 = b.time('equirectangulars', K.equirectangulars, lats1, lons1, lats3, lons3)
+    b.speedup('equirectangulars', t0, t1)
+    lats4 = [51.127 + random() - 0.5 for _ in range(n)]
+    lons4 = [1.338 + random() - 0.5 for _ in range(n)]
+    t0 = b.time('haversines short origin', K.haversines, 51.127, 1.338, lats4, lons4)
+    t1 = b.time('equirectangulars origin', K.equirectangulars, 51.127, 1.338, lats4, lons4)
+    b.speedup('equirectangulars origin', t0, t1)
+    qs3 = [LatLon(a, b) for a, b in rs]
+    t0 = b.time('distanceTo short', _pairs, LatLon.distanceTo, ps, qs3)
+    t1 = b.time('equirectangularTo', _pairs, LatLon.equirectangularTo, ps, qs3)
+    b.speedup('equirectangularTo', t0, t1)
+
+    ds = [random() * 1e7 for _ in range(n)]
+    bs = [random() * 360 for _ in range(n)]
+    t0 = b.time('destination', _destinations, ps, ds, bs)
+    t1 = b.time('destinations', K.destinations, lats1, lons1, ds, bs)
+    b.speedup('destinations', t0, t1)
+
+    fs = [random() for _ in range(n)]
+    t0 = b.time('intermediateTo', _intermediates, ps, qs, fs)
+    t1 = b.time('intermediates', K.intermediates, lats1, lons1, lats2, lons2, fs)
+    b.speedup('intermediates', t0, t1)
+
+    s, e = LatLon(53.3206, -1.7297), LatLon(53.1887, 0.1334)
+    t0 = b.time('crossTrackDistanceTo', _crossTracks, ps, s, e)
+    t1 = b.time('crossTrackDistances', K.crossTrackDistances, lats1, lons1,
+                                       s.lat, s.lon, e.lat, e.lon)
+    b.speedup('crossTrackDistances', t0, t1)
+
+    cs = [random() * 360 for _ in range(n)]
+    t0 = b.time('intersection', _intersections, ps, bs, qs, cs)
+    t1 = b.time('intersections', K.intersections, lats1, lons1, bs,
+                                                  lats2, lons2, cs)
+    b.speedup('intersections', t0, t1)
@@ -0,0 +1,68 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark LatLon instantiation from floats, with and without the
+# parseDMS bypass, and some methods returning new LatLon instances.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import ellipsoidalVincenty, sphericalNvector, \
+                      sphericalTrigonometry
+
+from random import random, seed
+
+
+def _corpus(n):
+    seed(32)  # repeatable
+    return [(random() * 160 - 80, random() * 360 - 180) for _ in range(n)]
+
+
+def _news(LatLon, lls):
+    return [LatLon(a, b, height=1) for a, b in lls]
+
+
+def _topsubs(p, lls):
+    return [p._topsub(a, b, height=1) for a, b in lls]
+
+
+def _destinations(ps):
+    return [p.destination(1e6, 45) for p in ps]
+
+
+def _intermediateTos(ps, q):
+    return [p.intermediateTo(q, 0.5) for p in ps]
+
+
+def _latlons(ps):
+    return [p.lat + p.lon for p in ps]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    lls = _corpus(n)
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('corpus of %s lat-/longitudes', n)
+
+    for m in (sphericalTrigonometry, sphericalNvector, ellipsoidalVincenty):
+        LatLon = m.LatLon
+        t = m.__name__.split('.')[-1] + '.LatLon'
+        p = LatLon(0, 0)
+        t0 = b.time(t + '()', _news, LatLon, lls)
+        t1 = b.time(t + '._topsub', _topsubs, p, lls)
+        b.speedup(t + '._topsub', t0, t1)
+        b.delta(t + '._topsub', _latlons(_news(LatLon, lls)),
+                                _latlons(_topsubs(p, lls)))
+
+    ps = _news(sphericalTrigonometry.LatLon, lls)
+    q = sphericalTrigonometry.LatLon(0, 0)
+    b.time('sphericalTrigonometry destination', _destinations, ps)
+    b.time('sphericalTrigonometry intermediateTo', _intermediateTos, ps, q)
+    ps = _news(ellipsoidalVincenty.LatLon, lls[:n // 10])
+    b.time('ellipsoidalVincenty destination', _destinations, ps)
@@ -0,0 +1,64 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the bulk LCC conversions versus toLcc and Lcc.toLatLon.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import Conics, latLonsToLccs, lccsToLatLons, \
+                      toLcc, ellipsoidalVincenty
+
+from random import random, seed
+
+
+def _corpus(n, c):
+    seed(30)  # repeatable, WRF-like grid around the origin
+    lats = [random() * 30 + c.lat0 - 15 for _ in range(n)]
+    lons = [random() * 50 + c.lon0 - 25 for _ in range(n)]
+    return lats, lons
+
+
+def _toLccs(lats, lons, LatLon, c):
+    return [toLcc(LatLon(a, b, datum=c.datum), conic=c) for a, b in zip(lats, lons)]
+
+
+def _toLatLons(lbs, LatLon):
+    return [lb.toLatLon(LatLon) for lb in lbs]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    c = Conics.WRF_Lb
+    lats, lons = _corpus(n, c)
+
+    b = Bench(__file__, __version__, number=1, repeat=3)
+    b.printf('corpus of %s lat-/longitudes, conic %s', n, c.name2)
+
+    LatLon = ellipsoidalVincenty.LatLon
+    t0 = b.time('toLcc', _toLccs, lats, lons, LatLon, c)
+    t1 = b.time('latLonsToLccs', latLonsToLccs, lats, lons, conic=c)
+    b.speedup('latLonsToLccs', t0, t1)
+
+    lbs = _toLccs(lats, lons, LatLon, c)
+    ens = latLonsToLccs(lats, lons, conic=c)
+    b.delta('easting',  [lb.easting  for lb in lbs], [en[0] for en in ens])
+    b.delta('northing', [lb.northing for lb in lbs], [en[1] for en in ens])
+
+    es, ns = zip(*ens)
+    t0 = b.time('Lcc.toLatLon', _toLatLons, lbs, LatLon)
+    t1 = b.time('lccsToLatLons', lccsToLatLons, es, ns, conic=c)
+    b.speedup('lccsToLatLons', t0, t1)
+    for trips in (3, 4):
+        t = 'lccsToLatLons trips=%s' % (trips,)
+        t2 = b.time(t, lccsToLatLons, es, ns, conic=c, trips=trips)
+        b.speedup(t, t0, t2)
+
+    lls = lccsToLatLons(es, ns, conic=c, trips=4)
+    b.delta('lat trips=4', lats, [ll[0] for ll in lls])
+    b.delta('lon trips=4', lons, [ll[1] for ll in lls])
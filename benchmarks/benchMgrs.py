@@ -0,0 +1,86 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark Mgrs.toUtm and toLatLon before and after the band base
+# northing and 100 km grid letter tables and the bulk MGRS functions.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import Utm, decodeMGRS, encodeMGRS, parseMGRS, toUtm, \
+                      ellipsoidalVincenty
+
+from random import random, seed
+
+_100km  =  100e3
+_2000km = 2000e3
+
+
+def _corpus(n):
+    seed(17)  # repeatable
+    lats = [random() * 160 - 79.5 for _ in range(n)]
+    lons = [random() * 360 - 180 for _ in range(n)]
+    return encodeMGRS(lats, lons)
+
+
+def _toUtm_before(m):
+    # Mgrs.toUtm as before, with the full UTM projection of
+    # the band latitude and the 100 km grid letter searches
+    n = toUtm(m._bandLat, 0, datum=m._datum).northing
+    nb = int(n / _100km) * _100km
+
+    z = m._zone - 1
+    e = float('ABCDEFGH JKLMNPQR STUVWXYZ'.split()[z % 3].index(m._en100k[0]) + 1) * _100km
+    n = float(('ABCDEFGHJKLMNPQRSTUV', 'FGHJKLMNPQRSTUVABCDE')[z % 2].index(m._en100k[1])) * _100km
+    e += m._easting
+    n += m._northing
+    while n < nb:
+        n += _2000km
+
+    h = 'S' if m._bandLat < 0 else 'N'
+    return Utm(m._zone, h, e, n, band=m._band, datum=m._datum)
+
+
+def _toUtms(ms, toUtm):
+    return [toUtm(m) for m in ms]
+
+
+def _toLatLons(us, LatLon):
+    return [u.toLatLon(LatLon) for u in us]
+
+
+def _parses(ss):
+    return [parseMGRS(s).toUtm() for s in ss]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    ss = _corpus(n)
+    ms = [parseMGRS(s) for s in ss]
+
+    b = Bench(__file__, __version__, number=1, repeat=3)
+    b.printf('corpus of %s grid references', n)
+
+    t0 = b.time('Mgrs.toUtm before', _toUtms, ms, _toUtm_before)
+    t1 = b.time('Mgrs.toUtm after', _toUtms, ms, lambda m: m.toUtm())
+    b.speedup('Mgrs.toUtm', t0, t1)
+
+    LatLon = ellipsoidalVincenty.LatLon
+    t0 = b.time('toUtm.toLatLon before', lambda: _toLatLons(_toUtms(ms, _toUtm_before), LatLon))
+    t1 = b.time('toUtm.toLatLon after', lambda: _toLatLons(_toUtms(ms, lambda m: m.toUtm()), LatLon))
+    b.speedup('toUtm.toLatLon', t0, t1)
+
+    t0 = b.time('parseMGRS.toUtm', _parses, ss)
+    t1 = b.time('decodeMGRS', decodeMGRS, ss)
+    b.speedup('decodeMGRS', t0, t1)
+
+    us = _toUtms(ms, lambda m: m.toUtm())
+    b.delta('toUtm easting', [u.easting for u in us],
+                             [u.easting for u in _toUtms(ms, _toUtm_before)])
+    b.delta('toUtm northing', [u.northing for u in us],
+                              [u.northing for u in _toUtms(ms, _toUtm_before)])
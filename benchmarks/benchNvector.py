@@ -0,0 +1,119 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the sphericalNvector LatLon methods versus
+# the nvectorKernels functions on blocks of n-vectors and
+# a prepared Polyline versus a loop over its segments.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import nvectorKernels, sphericalNvector
+
+from random import random, seed
+
+
+def _corpus(n):
+    seed(37)  # repeatable
+    lats = [random() * 160 - 80 for _ in range(n)]
+    lons = [random() * 360 - 180 for _ in range(n)]
+    return lats, lons
+
+
+def _distances(ps, qs):
+    return [p.distanceTo(q) for p, q in zip(ps, qs)]
+
+
+def _tracks(method, ps, s, e):
+    return [method(p, s, e) for p in ps]
+
+
+def _nearestOns(route, qs):
+    ns = []
+    for q in qs:
+        d, n = None, None
+        for i in range(len(route) - 1):
+            t = q.nearestOn(route[i], route[i + 1]).distanceTo(q)
+            if d is None or t < d:
+                d, n = t, i
+        ns.append(n)
+    return ns
+
+
+def _triangulates(ps, bs, qs, cs):
+    return [p.triangulate(b, q, c) for p, b, q, c in zip(ps, bs, qs, cs)]
+
+
+def _nearests(polyline, qs):
+    return [polyline.nearest(q)[0] for q in qs]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    lats, lons = _corpus(n)
+    LatLon = sphericalNvector.LatLon
+    K = nvectorKernels
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('corpus of %s points', n)
+
+    ps = [LatLon(a, b) for a, b in zip(lats, lons)]
+    qs = ps[::-1]
+    for p in ps:  # cache the n-vectors
+        p.toNvector()
+
+    b.time('nvectors', K.nvectors, lats, lons)
+    nvs = K.nvectors(lats, lons)
+
+    t0 = b.time('distanceTo', _distances, ps, qs)
+    t1 = b.time('distances', K.distances, nvs, nvs[::-1])
+    b.speedup('distances', t0, t1)
+
+    s, e = LatLon(53.3206, -1.7297), LatLon(53.1887, 0.1334)
+    ns, ne = s.toNvector().to3xyz(), e.toNvector().to3xyz()
+    for m, k in (('crossTrackDistanceTo', 'crossTrackDistances'),
+                 ('alongTrackDistanceTo', 'alongTrackDistances')):
+        t0 = b.time(m, _tracks, getattr(LatLon, m), ps, s, e)
+        t1 = b.time(k, getattr(K, k), nvs, ns, ne)
+        b.speedup(k, t0, t1)
+
+    s, e = LatLon(51.0, 1.0), LatLon(51.0, 2.0)
+    t0 = b.time('nearestOn', _tracks, LatLon.nearestOn, ps, s, e)
+    t1 = b.time('nearestOns', K.nearestOns, lats, lons, s.lat, s.lon, e.lat, e.lon)
+    b.speedup('nearestOns', t0, t1)
+
+    bs = [random() * 360 for _ in range(n)]
+    cs = [random() * 360 for _ in range(n)]
+    t0 = b.time('triangulate', _triangulates, ps, bs, ps[::-1], cs)
+    t1 = b.time('triangulates', K.triangulates, nvs, bs, nvs[::-1], cs)
+    b.speedup('triangulates', t0, t1)
+
+    # fixes of 20 ranges each, within about 100 Km
+    fs, ds = [], []
+    for _ in range(n // 20):
+        x = LatLon(random() * 100 - 50, random() * 300 - 150)
+        t = [LatLon(x.lat + random() - 0.5, x.lon + random() - 0.5) for _ in range(20)]
+        fs.append([q.toNvector().to3xyz() for q in t])
+        ds.append([q.distanceTo(x) + random() * 10 - 5 for q in t])
+    t = b.time('multilaterates', K.multilaterates, fs, ds)
+    b.printf('multilaterates: %.0f fixes per second', len(fs) / t)
+
+    # random walk route and points nearby
+    route = [LatLon(40, -100)]
+    for _ in range(1000):
+        p = route[-1]
+        route.append(LatLon(p.lat + random() * 0.1 - 0.05,
+                            p.lon + random() * 0.1 - 0.02))
+    qs = [LatLon(p.lat + random() * 0.2 - 0.1,
+                 p.lon + random() * 0.2 - 0.1) for p in route[::20]]
+
+    t0 = b.time('nearestOn segments', _nearestOns, route, qs)
+    b.time('Polyline', sphericalNvector.Polyline, route)
+    p = sphericalNvector.Polyline(route)
+    t1 = b.time('Polyline.nearest', _nearests, p, qs)
+    b.speedup('Polyline.nearest', t0, t1)
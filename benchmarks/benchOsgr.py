@@ -0,0 +1,55 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the bulk OSGR conversions versus Osgr.toLatLon and toOsgr.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import Datums, Osgr, latLonsToOsgrs, osgrsToLatLons, \
+                      toOsgr, ellipsoidalVincenty
+
+from random import random, seed
+
+
+def _corpus(n):
+    seed(29)  # repeatable
+    es = [random() * 600e3 + 50e3 for _ in range(n)]
+    ns = [random() * 1100e3 + 10e3 for _ in range(n)]
+    return es, ns
+
+
+def _toLatLons(es, ns, LatLon, datum):
+    return [Osgr(e, n).toLatLon(LatLon, datum=datum) for e, n in zip(es, ns)]
+
+
+def _toOsgrs(lls, LatLon, datum):
+    return [toOsgr(LatLon(a, b, datum=datum)) for a, b in lls]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    es, ns = _corpus(n)
+
+    b = Bench(__file__, __version__, number=1, repeat=3)
+    b.printf('corpus of %s OSGR coordinates', n)
+
+    LatLon = ellipsoidalVincenty.LatLon
+    for d in (Datums.OSGB36, Datums.WGS84):
+        t0 = b.time('Osgr.toLatLon ' + d.name, _toLatLons, es, ns, LatLon, d)
+        t1 = b.time('osgrsToLatLons ' + d.name, osgrsToLatLons, es, ns, d)
+        b.speedup('osgrsToLatLons ' + d.name, t0, t1)
+
+        lls = osgrsToLatLons(es, ns, d)
+        t0 = b.time('toOsgr ' + d.name, _toOsgrs, lls, LatLon, d)
+        t1 = b.time('latLonsToOsgrs ' + d.name, latLonsToOsgrs, *zip(*lls), datum=d)
+        b.speedup('latLonsToOsgrs ' + d.name, t0, t1)
+
+        ps = _toLatLons(es, ns, LatLon, d)
+        b.delta('lat ' + d.name, [p.lat for p in ps], [ll[0] for ll in lls])
+        b.delta('lon ' + d.name, [p.lon for p in ps], [ll[1] for ll in lls])
@@ -0,0 +1,74 @@
+
+# -*- coding: utf-8 -*-
+
+# Benchmark the spherical rhumb methods versus their bulk
+# counterparts from one origin to many other points and the
+# ellipsoidal rhumb methods with and without a cached origin.
+
+__all__ = ()
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import ellipsoidalVincenty, sphericalTrigonometry
+
+from random import random, seed
+
+
+def _corpus(n):
+    seed(34)  # repeatable
+    lats = [random() * 160 - 80 for _ in range(n)]
+    lons = [random() * 360 - 180 for _ in range(n)]
+    return lats, lons
+
+
+def _rhumbs(method, qs):
+    return [method(q) for q in qs]
+
+
+def _uncached(method, p, qs):
+    return [method(p.copy(), q) for q in qs]
+
+
+def _destinations(p, ds, bs):
+    return [p.rhumbDestination(d, b) for d, b in zip(ds, bs)]
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    lats, lons = _corpus(n)
+    LatLon = sphericalTrigonometry.LatLon
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    b.printf('corpus of %s points', n)
+
+    p = LatLon(51.127, 1.338)
+    qs = [LatLon(a, b) for a, b in zip(lats, lons)]
+
+    for m, ms in (('rhumbBearingTo',  'rhumbBearingsTo'),
+                  ('rhumbDistanceTo', 'rhumbDistancesTo'),
+                  ('rhumbMidpointTo', 'rhumbMidpointsTo')):
+        t0 = b.time(m, _rhumbs, getattr(p, m), qs)
+        t1 = b.time(ms, getattr(p, ms), lats, lons)
+        b.speedup(ms, t0, t1)
+
+    ds = [random() * 1e7 for _ in range(n)]
+    bs = [random() * 360 for _ in range(n)]
+    t0 = b.time('rhumbDestination', _destinations, p, ds, bs)
+    t1 = b.time('rhumbDestinations', p.rhumbDestinations, ds, bs)
+    b.speedup('rhumbDestinations', t0, t1)
+    b.delta('rhumbDestinations lat', [d.lat for d in _destinations(p, ds, bs)],
+                                     [d[0] for d in p.rhumbDestinations(ds, bs)])
+
+    # ellipsoidal, the origin's rhumb terms are cached
+    LatLon = ellipsoidalVincenty.LatLon
+    p = LatLon(51.127, 1.338)
+    qs = [LatLon(a, b) for a, b in zip(lats, lons)]
+    for m in ('rhumbBearingTo', 'rhumbDistanceTo'):
+        t0 = b.time(m + ' uncached', _uncached, getattr(LatLon, m), p, qs)
+        t1 = b.time(m + ' cached', _rhumbs, getattr(p, m), qs)
+        b.speedup(m + ' cached', t0, t1)
+    b.time('rhumbDestination ellipsoidal', _destinations, p, ds, bs)
@@ -0,0 +1,146 @@
+
+# -*- coding: utf-8 -*-
+
+# Microbenchmarks for the PyGeodesy hot paths, reporting operations
+# per second and allocations per operation and optionally saving the
+# results as JSON for comparison across releases, run as
+#
+#  python -m benchmarks.benchSuite [-json file] [-noallocs] [n]
+
+__all__ = ('hotPaths', 'suite')
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import Datums, ellipsoidalNvector, ellipsoidalVincenty, \
+                      geohash, parseDMS, parseMGRS, simplify1, simplify2, \
+                      simplifyRDP, simplifyRDPm, simplifyVW, simplifyVWm, \
+                      sphericalNvector, sphericalTrigonometry, \
+                      toLcc, toMgrs, toOsgr, toUtm, toDMS
+
+from random import random, seed
+
+
+def _corpus(n, lat0=-60, lat1=60, lon0=-180, lon1=180):
+    seed(44)  # repeatable
+    return [(random() * (lat1 - lat0) + lat0,
+             random() * (lon1 - lon0) + lon0) for _ in range(n)]
+
+
+def _deltas(ps, qs):  # ellipsoidalNvector has no distanceTo
+    return [p.deltaTo(q).length for p, q in zip(ps, qs)]
+
+
+def _distances(ps, qs):
+    return [p.distanceTo(q) for p, q in zip(ps, qs)]
+
+
+def _map(func, xs, *args, **kwds):
+    return [func(x, *args, **kwds) for x in xs]
+
+
+def _methods(name, xs, *args, **kwds):
+    return [getattr(x, name)(*args, **kwds) for x in xs]
+
+
+def _decodes(hs):
+    return [geohash.decode(h) for h in hs]
+
+
+def _encodes(lls):
+    return [geohash.encode(a, b) for a, b in lls]
+
+
+def hotPaths(n=1000):
+    '''Return the hot-path operations as a list of 4-tuples
+       (name, count, func, args), each call func(*args)
+       performing count operations.
+    '''
+    lls = _corpus(n)
+    # neighbors within 10 degrees, avoiding near-antipodal,
+    # non-converging Vincenty pairs
+    nbs = [(a + random() * 20 - 10, b + random() * 20 - 10) for a, b in lls]
+    uks = _corpus(n, 50, 58, -6, 2)  # Great Britain
+    ops = []
+
+    for m, t, f in ((sphericalTrigonometry, 'distanceTo', _distances),
+                    (sphericalNvector,      'distanceTo', _distances),
+                    (ellipsoidalVincenty,   'distanceTo', _distances),
+                    (ellipsoidalNvector,    'deltaTo',    _deltas)):
+        ps = [m.LatLon(a, b) for a, b in lls]
+        qs = [m.LatLon(a, b) for a, b in nbs]
+        t = '%s.%s' % (m.__name__.split('.')[-1], t)
+        ops.append((t, n, f, (ps, qs)))
+
+    LatLon = ellipsoidalVincenty.LatLon
+    ps = [LatLon(a, b) for a, b in lls]
+    us = [toUtm(p) for p in ps]
+    ops.append(('toUtm', n, _map, (toUtm, ps)))
+    ops.append(('Utm.toLatLon', n, _methods, ('toLatLon', us, LatLon)))
+    ops.append(('toMgrs', n, _map, (toMgrs, us)))
+    ms = [str(toMgrs(u)) for u in us]
+    ops.append(('parseMGRS', n, _map, (parseMGRS, ms)))
+
+    gs = [LatLon(a, b) for a, b in uks]
+    ops.append(('toOsgr', n, _map, (toOsgr, gs)))
+    ops.append(('toLcc', n, _map, (toLcc, ps)))
+    ops.append(('convertDatum', n, _methods, ('convertDatum', gs, Datums.OSGB36)))
+
+    hs = _encodes(lls)
+    ops.append(('geohash.encode', n, _encodes, (lls,)))
+    ops.append(('geohash.decode', n, _decodes, (hs,)))
+
+    ds = [toDMS(a, prec=4) for a, _ in lls]
+    ops.append(('parseDMS', n, _map, (parseDMS, ds)))
+
+    from tests.testRoutes import Pts
+    # simplifyRDP and -VW are quadratic, use fewer points
+    for f, ps in ((simplify1,    Pts),
+                  (simplify2,    Pts),
+                  (simplifyRDPm, Pts),
+                  (simplifyVWm,  Pts),
+                  (simplifyRDP,  Pts[:400]),
+                  (simplifyVW,   Pts[:1600])):
+        ops.append((f.__name__, len(ps), f, (ps, 100)))  # meter
+    return ops
+
+
+def suite(bench, n=1000, allocs=True, names=()):
+    '''Run the hot-path operations, optionally only those
+       with the given names and return the bench results.
+    '''
+    bench.printf('corpus of %s points', n)
+    for name, count, func, args in hotPaths(n):
+        if names and name not in names:
+            continue
+        bench.ops(name, count, func, *args)
+        if allocs:
+            bench.allocs(name, count, func, *args)
+    return bench.results
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    argv0, args = sys.argv[0], sys.argv[1:]
+    allocs, json = True, None
+    while args and args[0].startswith('-'):
+        arg = args.pop(0)
+        if '-help'.startswith(arg):
+            print(('usage: %s [-json file] [-noallocs] [n]' % (argv0,)))
+            sys.exit(0)
+        elif '-json'.startswith(arg) and args:
+            json = args.pop(0)
+        elif '-noallocs'.startswith(arg):
+            allocs = False
+        else:
+            print(('%s invalid option: %s' % (argv0, arg)))
+            sys.exit(1)
+
+    n = int(args[0]) if args else 1000
+
+    b = Bench(__file__, __version__, number=1, repeat=5)
+    suite(b, n=n, allocs=allocs)
+    if json:
+        b.json(json, corpus=n)
@@ -0,0 +1,86 @@
+
+# -*- coding: utf-8 -*-
+
+# Report the Vincenty iteration histograms, non-convergence, speed and
+# distance errors for a range of epsilon settings, to help pick the
+# ellipsoidalVincenty LatLon epsilon and iterations for a corpus, run as
+#
+#  python -m benchmarks.benchVincenty [n] [iterations]
+
+__all__ = ('report',)
+__version__ = '17.05.16'
+
+from .bench import Bench
+
+from pygeodesy import ellipsoidalVincenty, instrumented, \
+                      instrumentHistograms, instrumentReset
+
+from random import random, seed
+
+_epsilons = 1e-12, 1e-10, 1e-8, 1e-6  # first is the reference
+
+
+def _corpus(n, iterations):
+    seed(47)  # repeatable, including some near-antipodal pairs
+    LatLon = ellipsoidalVincenty.LatLon
+    ps = [LatLon(random() * 160 - 80, random() * 360 - 180) for _ in range(n)]
+    qs = [LatLon(random() * 160 - 80, random() * 360 - 180) for _ in range(n)]
+    for p in ps:
+        p.iterations = iterations
+    return ps, qs
+
+
+def _distances(ps, qs):
+    ds = []
+    for p, q in zip(ps, qs):
+        try:
+            ds.append(p.distanceTo(q))
+        except ellipsoidalVincenty.VincentyError:
+            ds.append(None)
+    return ds
+
+
+def report(bench, h, name='Vincenty.inverse'):
+    '''Print an iteration histogram as percentages, cumulative
+       percentages and the mean number of iterations.
+    '''
+    n = float(sum(h)) or 1
+    c = m = 0
+    for i, k in enumerate(h):
+        if i and k:
+            c += k
+            m += i * k
+            bench.printf('%s %3d iterations: %6d %6.2f%% %7.3f%%', name, i, k, k * 100 / n, c * 100 / n)
+    bench.printf('%s mean: %.2f iterations, %d no convergence', name, m / (c or 1), h[0] if h else 0)
+
+
+if __name__ == '__main__':
+
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    i = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    ps, qs = _corpus(n, i)
+
+    b = Bench(__file__, __version__, number=1, repeat=3)
+    b.printf('corpus of %s random point pairs, iterations limit %s', n, i)
+
+    e = instrumented(True)
+    r = None
+    for eps in _epsilons:
+        for p in ps:
+            p.epsilon = eps
+        instrumentReset()
+        ds = _distances(ps, qs)
+        report(b, instrumentHistograms().get('Vincenty.inverse', []),
+                  name='epsilon %.0e' % (eps,))
+        if r is None:
+            r = ds
+        else:
+            d = max([abs(a - b) for a, b in zip(r, ds) if a is not None
+                                                      and b is not None] or [0])
+            b.printf('epsilon %.0e: max distance error %.3e meter', eps, d)
+        instrumented(False)
+        b.time('epsilon %.0e' % (eps,), _distances, ps, qs)
+        instrumented(True)
+    instrumented(e)
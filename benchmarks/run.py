@@ -0,0 +1,118 @@
+
+# -*- coding: utf-8 -*-
+
+# Script to run the PyGeodesy hot-path microbenchmarks and compare
+# the median times per operation against a baseline, typically one
+# saved earlier on the same machine with option -update.  The exit
+# status is 1 if any operation is slower than the baseline by more
+# than the threshold percentage or missing from the results, else 0.
+
+# python -m benchmarks.run [-baseline file] [-threshold percent]
+#                          [-repeat n] [-update] [operation ...]
+
+from os.path import dirname, join
+import sys
+
+from .bench import Bench
+from .benchSuite import suite
+
+from json import load
+
+__all__ = ('compare',)
+__version__ = '17.05.16'
+
+_baseline  = join(dirname(__file__), 'baseline.json')
+_corpus    = 1000  # points, see benchSuite.hotPaths
+_number    = 5     # calls per run
+_repeat    = 7     # runs per operation, median of
+_threshold = 25.0  # percent
+
+
+def _secs(r):
+    # median seconds per operation
+    return r['median'] / r['count']
+
+
+def compare(baseline, results, threshold=_threshold):
+    '''Compare results against baseline results and return
+       a list of 5-tuples (name, baseline, current, percent,
+       status) and the number of failures, regressed or
+       missing operations.
+    '''
+    t, x = [], 0
+    for n in sorted(set(baseline.keys()) | set(results.keys())):
+        if n not in results:
+            t.append((n, _secs(baseline[n]), None, None, 'MISSING'))
+            x += 1
+        elif n not in baseline:
+            t.append((n, None, _secs(results[n]), None, 'new'))
+        else:
+            b, r = _secs(baseline[n]), _secs(results[n])
+            p = (r - b) * 100.0 / b
+            if p > threshold:
+                s, x = 'REGRESSED', x + 1
+            elif p < -threshold:
+                s = 'improved'
+            else:
+                s = 'ok'
+            t.append((n, b, r, p, s))
+    return t, x
+
+
+def _us(secs):
+    return '-' if secs is None else ('%.3f' % (secs * 1e6,))
+
+
+def _table(rows, printf):
+    w = max([len(r[0]) for r in rows] + [9])
+    f = '%-*s %12s %12s %9s  %s'
+    printf(f, w, 'operation', 'baseline us', 'current us', 'change', 'status', nl=1)
+    for n, b, r, p, s in rows:
+        p = '-' if p is None else ('%+.1f%%' % (p,))
+        printf(f, w, n, _us(b), _us(r), p, s)
+
+
+if __name__ == '__main__':  # MCCABE expected
+
+    argv0, args = sys.argv[0], sys.argv[1:]
+    baseline, repeat, threshold, update = _baseline, _repeat, _threshold, False
+    try:
+        while args and args[0].startswith('-'):
+            arg = args.pop(0)
+            if '-help'.startswith(arg):
+                print(('usage: %s [-baseline file] [-threshold percent] [-repeat n] [-update] [operation ...]' % (argv0,)))
+                sys.exit(0)
+            elif '-baseline'.startswith(arg) and args:
+                baseline = args.pop(0)
+            elif '-repeat'.startswith(arg) and args:
+                repeat = int(args.pop(0))
+            elif '-threshold'.startswith(arg) and args:
+                threshold = float(args.pop(0))
+            elif '-update'.startswith(arg):
+                update = True
+            else:
+                raise ValueError
+    except ValueError:
+        print(('%s invalid option: %s' % (argv0, arg)))
+        sys.exit(1)
+
+    b = Bench(__file__, __version__, number=_number, repeat=repeat)
+    results = suite(b, n=_corpus, allocs=False, names=args)
+
+    if update:
+        b.json(baseline, corpus=_corpus)
+        sys.exit(0)
+
+    with open(baseline, 'r') as f:
+        base = load(f)['results']
+    if args:  # only the given operations
+        base = dict((n, r) for n, r in base.items() if n in args)
+
+    rows, x = compare(base, results, threshold=threshold)
+    _table(rows, b.printf)
+    if x:
+        t = '%d REGRESSED or MISSING' % (x,)
+    else:
+        t = 'all OK'
+    b.printf('%s %s (threshold %g%%, baseline %s)', argv0, t, threshold, baseline, nl=1)
+    sys.exit(1 if x else 0)
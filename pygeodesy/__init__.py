@@ -12,7 +12,12 @@ There are two modules for ellipsoidal earth models, I{ellipsoidalVincenty}
 and I{-Nvector} and two for spherical ones, I{sphericalTrigonometry} and
 I{-Nvector}.  Each module provides a I{LatLon} class with methods to
 compute distance, initial and final bearing, intermediate points and
-conversions, among other things.  For more information and further
+conversions, among other things.  Module I{sphericalKernels} offers
+the great circle formulas of I{sphericalTrigonometry} as functions on
+columns of lat- and longitudes and module I{nvectorKernels} those of
+I{sphericalNvector} on blocks of n-vectors.  With Python 3.7 and newer, all
+sub-modules are imported lazily, on first access of the module or any of
+its public names lifted into this package.  For more information and further
 details see the U{documentation<https://pythonhosted.org/PyGeodesy/>}
 and some of the original descriptions:
 
@@ -45,6 +50,9 @@ and Visvalingam-Whyatt algorithms and modified versions of both:
  - U{http://hydra.hull.ac.uk/resources/hull:8338}
  - U{http://bost.ocks.org/mike/simplify/}
 
+Module I{instrument} optionally counts and times calls of the Vincenty,
+UTM, MGRS and OSGR conversion, datum conversion and simplify functions.
+
 All modules have been statically checked* with
 U{PyChecker<https://pypi.python.org/pypi/pychecker>},
 U{PyFlakes<https://pypi.python.org/pypi/pyflakes>},
@@ -104,7 +112,7 @@ _
 '''
 
 try:
-    from . import bases  # PYCHOK expected
+    from . import utils  # PYCHOK expected
 except ImportError:
     # extend sys.path to include this very directory
     # such that all public and private sub-modules can
@@ -113,56 +121,79 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(__file__))  # XXX __path__[0]
     del os, sys
 
-# keep ellipsoidal and spherical modules as modules
-from . import ellipsoidalNvector  # PYCHOK false
-from . import ellipsoidalVincenty  # PYCHOK false
-from . import sphericalNvector  # PYCHOK false
-from . import sphericalTrigonometry  # PYCHOK false
-from . import nvector  # PYCHOK false
-from . import vector3d  # PYCHOK false
-from . import geohash
-
-Geohash       = geohash.Geohash
-VincentyError = ellipsoidalVincenty.VincentyError
+# the sub-modules and their lifted names, generated
+# from each sub-module's __all__, see module lazily
+from .lazily import _lazy_modules  # PYCHOK expected
+
+import sys as _sys  # PYCHOK expected
+
+# map each lifted name to its sub-module, the last one
+# listed wins as with C{from .module import *} before
+_lazy_names = {}
+__all__ = ['version']
+for _m, _ns in _lazy_modules:
+    _lazy_names[_m] = None
+    if _m != 'bases':  # private module
+        __all__.append(_m)
+    for _n in _ns:
+        if _n not in _lazy_names:
+            __all__.append(_n)
+        _lazy_names[_n] = _m
+del _m, _ns, _n
 
 # all public contants, classes and functions
-__all__ = ('ellipsoidalNvector', 'ellipsoidalVincenty',
-           'sphericalNvector', 'sphericalTrigonometry',
-           'Geohash', 'VincentyError',
-           'geohash', 'nvector', 'vector3d', 'version',
-           'isclockwise')  # extended below
+__all__ = tuple(__all__)  # see above
 __version__ = '17.05.15'
 
 # see setup.py for similar logic
 version = '.'.join(map(str, list(map(int, __version__.split('.')))))
 
-# lift all public classes, constants, functions, etc. but
-# only from the following sub-modules ... (see also David
-# Beazley's <http://dabeaz.com/modulepackage/index.html>)
-from .bases    import isclockwise  # PYCHOK expected
-from .datum    import *  # PYCHOK __all__
-from .dms      import *  # PYCHOK __all__
-from .lcc      import *  # PYCHOK __all__
-from .mgrs     import *  # PYCHOK __all__
-from .osgr     import *  # PYCHOK __all__
-from .simplify import *  # PYCHOK __all__
-from .utils    import *  # PYCHOK __all__
-from .utm      import *  # PYCHOK __all__
-
-from . import datum     # PYCHOK expected
-from . import dms       # PYCHOK expected
-from . import lcc       # PYCHOK expected
-from . import mgrs      # PYCHOK expected
-from . import osgr      # PYCHOK expected
-from . import simplify  # PYCHOK expected
-from . import utils     # PYCHOK expected
-from . import utm       # PYCHOK expected
-
-# concat __all__ with the public classes, constants,
-# functions, etc. from the sub-modules mentioned above
-for m in (datum, dms, lcc, mgrs, osgr, simplify, utils, utm):
-    __all__ += tuple(m.__all__)
-del m
+
+def _lazy_import(name):
+    '''(INTERNAL) Import a sub-module or the sub-module of
+       a lifted name and cache the result in this package.
+
+       @param name: The sub-module or lifted name (string).
+
+       @return: The sub-module or the named attribute.
+
+       @raise AttributeError: No such sub-module or name.
+
+       @raise ImportError: Importing the sub-module failed.
+    '''
+    m = _lazy_names.get(name, None) or name
+    n = '%s.%s' % (__name__, m)
+    try:
+        __import__(n)
+    except ImportError as x:
+        if getattr(x, 'name', None) != n:  # failed inside the sub-module
+            raise
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    t = _sys.modules[n]
+    if m != name:
+        t = getattr(t, name)
+    globals()[name] = t
+    return t
+
+
+if _sys.version_info[:2] >= (3, 7):  # import sub-modules on first
+    # access, since module __getattr__ is supported (PEP 562)
+
+    def __getattr__(name):
+        '''Import sub-modules and lifted names lazily, on demand.
+        '''
+        if name.startswith('__'):  # __path__, __file__, etc.
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+        return _lazy_import(name)
+
+    def __dir__():
+        return sorted(set(globals()).union(__all__))
+
+else:  # import all sub-modules now
+    for _n in __all__[1:]:
+        _lazy_import(_n)
+    _lazy_import('bases')
+    del _n
 
 # try:  # remove private, INTERNAL modules
 #     del bases, ellipsoidalBase, sphericalBase  # PYCHOK expected
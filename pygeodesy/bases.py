@@ -18,7 +18,7 @@ from math import asin, cos, degrees, radians, sin
 # Epydoc to include class and method documentation
 __all__ = ('Base', 'LatLonHeightBase', 'Named', 'VectorBase',
            'isclockwise')
-__version__ = '17.05.08'
+__version__ = '17.05.16'
 
 
 class Base(object):
@@ -106,6 +106,7 @@ class LatLonHeightBase(Base):
     _height = 0   #: (INTERNAL) Height (meter)
     _lat    = 0   #: (INTERNAL) Latitude (degrees)
     _lon    = 0   #: (INTERNAL) Longitude (degrees)
+    _sc4    = ()  #: (INTERNAL) Cache (lat, lon) sines and cosines (4-tuple)
 
     def __init__(self, lat, lon, height=0):
         '''New LatLon.
@@ -147,11 +148,42 @@ class LatLonHeightBase(Base):
         '''
         return favg(self.height, other.height, f=f)
 
+    def _sincos4(self):
+        '''(INTERNAL) Return the cached sines and cosines of
+           this point's lat- and longitude.
+
+           @return: 4-Tuple (sin(lat), cos(lat), sin(lon), cos(lon)).
+        '''
+        if not self._sc4:
+            a, b = self.to2ab()
+            self._sc4 = sin(a), cos(a), sin(b), cos(b)
+        return self._sc4
+
+    def _topsub(self, lat, lon, height=0):
+        '''(INTERNAL) New instance of this "top- or sub-most" class
+           from lat- and longitude floats, bypassing L{parseDMS}.
+
+           @param lat: Latitude (degrees float).
+           @param lon: Longitude (degrees float).
+           @keyword height: Optional height (meter).
+
+           @return: New instance (LatLon).
+        '''
+        c = self.__class__
+        if c.__init__ != LatLonHeightBase.__init__:  # overloaded
+            return c(lat, lon, height=height)
+        p = c.__new__(c)
+        p._lat = lat
+        p._lon = lon
+        if height:
+            p._height = float(height)
+        return p
+
     def _update(self, updated):
         '''(INTERNAL) Reset caches if updated.
         '''
         if updated:  # reset caches
-            self._ab = None
+            self._ab = self._sc4 = None
 
     def bounds(self, wide, high, radius=R_M):
         '''Returns the SE and NW lat-/longitude of a great circle
@@ -165,8 +197,7 @@ class LatLonHeightBase(Base):
 
            @see: U{http://www.movable-type.co.uk/scripts/latlong-db.html}
         '''
-        a, _ = self.to2ab()
-        ca = cos(a)
+        _, ca, _, _ = self._sincos4()
 
         if ca > EPS:
             w = abs(degrees(asin(wide * 0.5 / radius) / ca))
@@ -174,15 +205,15 @@ class LatLonHeightBase(Base):
             w = 0  # XXX
         h = abs(degrees(high * 0.5 / radius))
 
-        return self.topsub(self.lat - h, self.lon - w, height=self.height), \
-               self.topsub(self.lat + h, self.lon + w, height=self.height)
+        return self._topsub(self.lat - h, self.lon - w, height=self.height), \
+               self._topsub(self.lat + h, self.lon + w, height=self.height)
 
     def copy(self):
         '''Copy this point.
 
            @return: A copy of this point (LatLon).
         '''
-        return self.topsub(self.lat, self.lon, height=self.height)  # XXX
+        return self._topsub(self.lat, self.lon, height=self.height)  # XXX
 
     def equals(self, other, eps=None):
         '''Compares this point with an other point.
@@ -347,9 +378,8 @@ class LatLonHeightBase(Base):
         '''
         # Kenneth Gade eqn 3, but using right-handed
         # vector x -> 0°E,0°N, y -> 90°E,0°N, z -> 90°N
-        a, b = self.to2ab()
-        ca = cos(a)
-        return ca * cos(b), ca * sin(b), sin(a)
+        sa, ca, sb, cb = self._sincos4()
+        return ca * cb, ca * sb, sa
 
     def toStr(self, form=F_DMS, prec=None, m='m', sep=', '):  # PYCHOK expected
         '''Convert this point to a "lat, lon [+/-height]" string,
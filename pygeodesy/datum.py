@@ -57,7 +57,7 @@ __version__ = '17.05.08'
 
 
 class _Enum(dict, Named):
-    '''(INTERNAL) Enum-like dict sub-class.
+    '''(INTERNAL) Enum-like dict sub-class, populated lazily.
     '''
     def __init__(self, name):
         '''New Enum.
@@ -65,13 +65,37 @@ class _Enum(dict, Named):
            @param name: Name (string).
         '''
         self._name = name
+        self._pending = {}  # registered, not instantiated
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self._pending
 
     def __getattr__(self, attr):
+        if attr.startswith('_'):  # _pending, __getstate__, etc.
+            raise AttributeError("%s.%s doesn't exist" % (self._name, attr))
         try:
             return self[attr]
         except KeyError:
             raise AttributeError("%s.%s doesn't exist" % (self._name, attr))
 
+    def __getitem__(self, name):
+        try:
+            return dict.__getitem__(self, name)
+        except KeyError:
+            if name not in self._pending:
+                raise
+        # instantiate on first access
+        v = self._pending.pop(name)()
+        if dict.get(self, name) is not v:
+            raise AssertionError('%s.%s vs %r' % (self._name, name, v))
+        return v
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._pending)
+
     def __repr__(self):
         return '\n'.join('%s.%s: %r' % (self._name, n, v) for n, v in sorted(self.items()))
 
@@ -84,6 +108,50 @@ class _Enum(dict, Named):
         for a, v in list(kwds.items()):
             assert getattr(self, a) is v
 
+    def _lazy(self, **kwds):
+        '''(INTERNAL) Register names with a callable to
+           instantiate each on first access.
+        '''
+        for a, v in list(kwds.items()):
+            if a in self:
+                raise NameError('%s.%s exists' % (self._name, a))
+            self._pending[a] = v
+
+    def _resolve(self):
+        '''(INTERNAL) Instantiate all pending names.
+        '''
+        for a in sorted(self._pending.keys()):
+            if a in self._pending:  # not yet
+                self[a]
+
+    def get(self, name, *default):
+        '''Gets a registered item (or default).
+        '''
+        try:
+            return self[name]
+        except KeyError:
+            if default:
+                return default[0]
+            return None
+
+    def items(self):
+        '''Gets all registered (name, item) pairs.
+        '''
+        self._resolve()
+        return dict.items(self)
+
+    def keys(self):
+        '''Gets all registered names.
+        '''
+        self._resolve()
+        return dict.keys(self)
+
+    def values(self):
+        '''Gets all registered items.
+        '''
+        self._resolve()
+        return dict.values(self)
+
 
 Datums     = _Enum('Datums')      #: Registered datums (L{_Enum}).
 Ellipsoids = _Enum('Ellipsoids')  #: Registered ellipsoids (L{_Enum}).
@@ -117,7 +185,7 @@ class _Based(Base, Named):
             if name[:1].isalpha():
                 if name in enum:
                     raise NameError('%s.%s exists' % (enum.name, name))
-                enum[name] = self
+                dict.__setitem__(enum, name, self)
 
 
 class Ellipsoid(_Based):
@@ -139,15 +207,17 @@ class Ellipsoid(_Based):
     n    = 0  #: 3rd Flattening: f / (2 - f) = (a - b) / (a + b) (float).
     # radii from <https://en.wikipedia.org/wiki/Earth_radius>
     R    = 0  #: Mean radius: (2 * a + b) / 3 per IUGG definition (meter).
-    Rm   = 0  #: Mean radius: sqrt(a * b) (meter).
-    R2   = 0  #: Authalic radius: sqrt((a**2 + b**2 * atanh(e) / e) / 2) (meter).
-    R3   = 0  #: Volumetric radius: cbrt(a * a * b) (meter).
-    Rr   = 0  #: Rectifying radius: ((a**3/2 + b**3/2) / 2)**2/3 (meter).
 
     _A      = None  #: (INTERNAL) meridian radius
+    _Rm     = None  #: (INTERNAL) mean radius
+    _R2     = None  #: (INTERNAL) authalic radius
+    _R3     = None  #: (INTERNAL) volumetric radius
+    _Rr     = None  #: (INTERNAL) rectifying radius
     _Alpha6 = None  #: (INTERNAL) 6th-order Krüger Alpha series
     _Beta6  = None  #: (INTERNAL) 6th-order Krüger Beta series
     _Mabcd  = None  #: (INTERNAL) OSGB meridional coefficients
+    _Mu4    = None  #: (INTERNAL) 4th-order rectifying series
+    _Phi4   = None  #: (INTERNAL) 4th-order inverse rectifying series
 
     def __init__(self, a, b, f_, name=''):
         '''New ellipsoid.
@@ -177,12 +247,9 @@ class Ellipsoid(_Based):
             self.e22 = e2 / (1 - e2)  # 2nd eccentricity squared
             self.a2b2 = (a / b) ** 2  # for Nvector.toCartesian
             self.R = (2 * a + b) / 3  # per IUGG definition for WGS84
-            self.Rm = sqrt(a * b)  # mean radius
-            self.R2 = sqrt((a * a + b * b * atanh(self.e) / self.e) * 0.5)  # authalic radius
-            self.R3 = cbrt(a * a * b)  # volumetric radius
-            self.Rr = cbrt2((pow(a, 1.5) + pow(b, 1.5)) * 0.5)  # rectifying radius
+            # Rm, R2, R3 and Rr computed on first access
         else:
-            self.R = self.Rm = self.R2 = self.R3 = self.Rr = self.b = b = a
+            self.R = self._Rm = self._R2 = self._R3 = self._Rr = self.b = b = a
             f_ = f = n = 0
         self.a2 = 1 / (a * a)  # for Nvector.Cartesian.toNvector
 
@@ -321,6 +388,75 @@ class Ellipsoid(_Based):
                                    35/24 * n3)
         return self._Mabcd
 
+    @property
+    def Mu4(self):
+        '''Gets the 4th-order series of the rectifying latitude from
+           the latitude, in 3rd flattening n, the coefficients for
+           sin(2*lat), sin(4*lat), sin(6*lat) and sin(8*lat) (4-tuple).
+        '''
+        if self._Mu4 is None:
+            n = self.n
+            n2 = n * n
+            n3 = n * n2
+            n4 = n * n3
+            # XXX i/i quotients require  from __future__ import division
+            self._Mu4 = (-3/2 * n + 9/16 * n3,
+                         15/16 * n2 - 15/32 * n4,
+                        -35/48 * n3,
+                         315/512 * n4)
+        return self._Mu4
+
+    @property
+    def Phi4(self):
+        '''Gets the 4th-order series of the latitude from the rectifying
+           latitude, in 3rd flattening n, the coefficients for sin(2*mu),
+           sin(4*mu), sin(6*mu) and sin(8*mu) (4-tuple).
+        '''
+        if self._Phi4 is None:
+            n = self.n
+            n2 = n * n
+            n3 = n * n2
+            n4 = n * n3
+            # XXX i/i quotients require  from __future__ import division
+            self._Phi4 = (3/2 * n - 27/32 * n3,
+                          21/16 * n2 - 55/32 * n4,
+                          151/96 * n3,
+                          1097/512 * n4)
+        return self._Phi4
+
+    @property
+    def Rm(self):
+        '''Gets the mean radius: sqrt(a * b) (meter).
+        '''
+        if self._Rm is None:
+            self._Rm = sqrt(self.a * self.b)
+        return self._Rm
+
+    @property
+    def R2(self):
+        '''Gets the authalic radius: sqrt((a**2 + b**2 * atanh(e) / e) / 2) (meter).
+        '''
+        if self._R2 is None:
+            a, b, e = self.a, self.b, self.e
+            self._R2 = sqrt((a * a + b * b * atanh(e) / e) * 0.5)
+        return self._R2
+
+    @property
+    def R3(self):
+        '''Gets the volumetric radius: cbrt(a * a * b) (meter).
+        '''
+        if self._R3 is None:
+            self._R3 = cbrt(self.a * self.a * self.b)
+        return self._R3
+
+    @property
+    def Rr(self):
+        '''Gets the rectifying radius: ((a**3/2 + b**3/2) / 2)**2/3 (meter).
+        '''
+        if self._Rr is None:
+            self._Rr = cbrt2((pow(self.a, 1.5) + pow(self.b, 1.5)) * 0.5)
+        return self._Rr
+
     def radiusAt(self, lat):
         '''Approximates the ellipsoid radius at the given
            latitude in degrees by trivial interpolation.
@@ -344,35 +480,35 @@ class Ellipsoid(_Based):
 
 
 # <https://www.gnu.org/software/gama/manual/html_node/Supported-ellipsoids.html>
-Ellipsoids._assert(  # <https://en.wikipedia.org/wiki/Earth_ellipsoid>
-    Airy1830       = Ellipsoid(6377563.396, 6356256.909,       299.3249646,   'Airy1830'),
-    AiryModified   = Ellipsoid(6377340.189, 6356034.448,       299.3249646,   'AiryModified'),
-    Australia1966  = Ellipsoid(6378160.0,   6356774.719,       298.25,        'Australia1966'),
-    Bessel1841     = Ellipsoid(6377397.155, 6356078.963,       299.152815351, 'Bessel1841'),  # XXX 299.1528128
-    Clarke1866     = Ellipsoid(6378206.4,   6356583.8,         294.978698214, 'Clarke1866'),
-    Clarke1880IGN  = Ellipsoid(6378249.2,   6356515.0,         293.466021294, 'Clarke1880IGN'),  # XXX confirm
-    CPM1799        = Ellipsoid(6375738.7,   6356671.92557493,  334.39,        'CPM1799'),  # Comm. des Poids et Mesures
-    Delambre1810   = Ellipsoid(6376428.0,   6355957.92616372,  311.5,         'Delambre1810'),  # Belgium
-    Engelis1985    = Ellipsoid(6378136.05,  6356751.32272154,  298.2566,      'Engelis1985'),
-    Everest1969    = Ellipsoid(6377295.664, 6356094.667915,    300.8017,      'Everest1969'),
-    Fisher1968     = Ellipsoid(6378150.0,   6356768.33724438,  298.3,         'Fisher1968'),
-    GRS67          = Ellipsoid(6378160.0,   6356774.516,       298.247167427, 'GRS67'),  # Lucerne
-    GRS80          = Ellipsoid(6378137.0,   6356752.314140347, 298.257222101, 'GRS80'),  # ITRS, ETRS89
-    Helmert1906    = Ellipsoid(6378200.0,   6356818.16962789,  298.3,         'Helmert1906'),
-    IERS1989       = Ellipsoid(6378136.0,   6356751.302,       298.257,       'IERS1989'),
-    IERS2003       = Ellipsoid(6378136.6,   6356751.85797165,  298.25642,     'IERS2003'),
-    Intl1924       = Ellipsoid(6378388.0,   6356911.946,       297.0,         'Intl1924'),  # aka Hayford
-    Intl1967       = Ellipsoid(6378157.5,   6356772.2,         298.24961539,  'Intl1967'),  # New Int'l
-    Krassovsky1940 = Ellipsoid(6378245.0,   6356863.019,       298.3,         'Krassovsky1940'),
-    Maupertuis1738 = Ellipsoid(6397300.0,   6363806.28272251,  191.0,         'Maupertuis1738'),  # France
-    NWL1965        = Ellipsoid(6378145.0,   6356759.76948868,  298.25,        'NWL1965'),  # Naval Weapons Lab.
-    Plessis1817    = Ellipsoid(6397523.0,   6355863.0,         153.56512242,  'Plessis1817'),  # France
-    SGS85          = Ellipsoid(6378136.0,   6356751.30156878,  298.257,       'SGS85'),  # Soviet Geodetic System
-    WGS60          = Ellipsoid(6378165.0,   6356783.28695944,  298.3,         'WGS60'),
-    WGS66          = Ellipsoid(6378145.0,   6356759.76948868,  298.25,        'WGS66'),
-    WGS72          = Ellipsoid(6378135.0,   6356750.52,        298.26,        'WGS72'),
-    WGS84          = Ellipsoid(6378137.0,   6356752.31425,     298.257223563, 'WGS84'),  # GPS
-    Sphere         = Ellipsoid(R_M,         R_M,                 0.0,         'Sphere'),  # pseudo
+Ellipsoids._lazy(  # <https://en.wikipedia.org/wiki/Earth_ellipsoid>
+    Airy1830       = lambda: Ellipsoid(6377563.396, 6356256.909,       299.3249646,   'Airy1830'),
+    AiryModified   = lambda: Ellipsoid(6377340.189, 6356034.448,       299.3249646,   'AiryModified'),
+    Australia1966  = lambda: Ellipsoid(6378160.0,   6356774.719,       298.25,        'Australia1966'),
+    Bessel1841     = lambda: Ellipsoid(6377397.155, 6356078.963,       299.152815351, 'Bessel1841'),  # XXX 299.1528128
+    Clarke1866     = lambda: Ellipsoid(6378206.4,   6356583.8,         294.978698214, 'Clarke1866'),
+    Clarke1880IGN  = lambda: Ellipsoid(6378249.2,   6356515.0,         293.466021294, 'Clarke1880IGN'),  # XXX confirm
+    CPM1799        = lambda: Ellipsoid(6375738.7,   6356671.92557493,  334.39,        'CPM1799'),  # Comm. des Poids et Mesures
+    Delambre1810   = lambda: Ellipsoid(6376428.0,   6355957.92616372,  311.5,         'Delambre1810'),  # Belgium
+    Engelis1985    = lambda: Ellipsoid(6378136.05,  6356751.32272154,  298.2566,      'Engelis1985'),
+    Everest1969    = lambda: Ellipsoid(6377295.664, 6356094.667915,    300.8017,      'Everest1969'),
+    Fisher1968     = lambda: Ellipsoid(6378150.0,   6356768.33724438,  298.3,         'Fisher1968'),
+    GRS67          = lambda: Ellipsoid(6378160.0,   6356774.516,       298.247167427, 'GRS67'),  # Lucerne
+    GRS80          = lambda: Ellipsoid(6378137.0,   6356752.314140347, 298.257222101, 'GRS80'),  # ITRS, ETRS89
+    Helmert1906    = lambda: Ellipsoid(6378200.0,   6356818.16962789,  298.3,         'Helmert1906'),
+    IERS1989       = lambda: Ellipsoid(6378136.0,   6356751.302,       298.257,       'IERS1989'),
+    IERS2003       = lambda: Ellipsoid(6378136.6,   6356751.85797165,  298.25642,     'IERS2003'),
+    Intl1924       = lambda: Ellipsoid(6378388.0,   6356911.946,       297.0,         'Intl1924'),  # aka Hayford
+    Intl1967       = lambda: Ellipsoid(6378157.5,   6356772.2,         298.24961539,  'Intl1967'),  # New Int'l
+    Krassovsky1940 = lambda: Ellipsoid(6378245.0,   6356863.019,       298.3,         'Krassovsky1940'),
+    Maupertuis1738 = lambda: Ellipsoid(6397300.0,   6363806.28272251,  191.0,         'Maupertuis1738'),  # France
+    NWL1965        = lambda: Ellipsoid(6378145.0,   6356759.76948868,  298.25,        'NWL1965'),  # Naval Weapons Lab.
+    Plessis1817    = lambda: Ellipsoid(6397523.0,   6355863.0,         153.56512242,  'Plessis1817'),  # France
+    SGS85          = lambda: Ellipsoid(6378136.0,   6356751.30156878,  298.257,       'SGS85'),  # Soviet Geodetic System
+    WGS60          = lambda: Ellipsoid(6378165.0,   6356783.28695944,  298.3,         'WGS60'),
+    WGS66          = lambda: Ellipsoid(6378145.0,   6356759.76948868,  298.25,        'WGS66'),
+    WGS72          = lambda: Ellipsoid(6378135.0,   6356750.52,        298.26,        'WGS72'),
+    WGS84          = lambda: Ellipsoid(6378137.0,   6356752.31425,     298.257223563, 'WGS84'),  # GPS
+    Sphere         = lambda: Ellipsoid(R_M,         R_M,                 0.0,         'Sphere'),  # pseudo
 )
 
 
@@ -495,48 +631,48 @@ class Transform(_Based):
 
 
 # <https://en.wikipedia.org/wiki/Helmert_transformation> from WGS84
-Transforms._assert(
-    BD72           = Transform('BD72', tx=106.868628, ty=-52.297783, tz=103.723893,
-                     # <http://www.ngi.be/FR/FR4-4.shtm> ETRS89 == WG84
-                     # <http://georepository.com/transformation_15929/BD72-to-WGS-84-3.html>
-                                       sx=-0.33657,   sy= -0.456955, sz= -1.84218,
-                                        s= 1.2727),
-    Bessel1841     = Transform('Bessel1841', tx=-582.0,  ty=-105.0, tz=-414.0,
-                                             sx=  -1.04, sy= -0.35, sz=   3.08,
-                                              s=  -8.3),
-    Clarke1866     = Transform('Clarke1866', tx=8, ty=-160, tz=-176),
-    DHDN           = Transform('DHDN', tx=-591.28,  ty=-81.35,   tz=-396.39,
-                                       sx=   1.477, sy= -0.0736, sz=  -1.458,
-                                        s=  -9.82),  # Germany
-    ED50           = Transform('ED50', tx=89.5, ty=93.8, tz=123.1,
-                     # <https://geonet.esri.com/thread/36583> sz=-0.156
-                     # <https://github.com/chrisveness/geodesy/blob/master/latlon-ellipsoidal.js>
-                     # <https://www.gov.uk/guidance/oil-and-gas-petroleum-operations-notices#pon-4>
-                                                         sz=  0.156, s=-1.2),
-    Irl1965        = Transform('Irl1965', tx=-482.530, ty=130.596, tz=-564.557,
-                                          sx=   1.042, sy=  0.214, sz=   0.631,
-                                           s=  -8.15),
-    Irl1975        = Transform('Irl1975', tx=-482.530, ty=130.596, tz=-564.557,
-                     # XXX rotation signs may be opposite, to be checked
-                                          sx=  -1.042, sy= -0.214, sz=  -0.631,
-                                           s=  -1.1),
-    Krassovsky1940 = Transform('Krassovsky1940', tx=-24.0,  ty=123.0,  tz=94.0,
-                                                 sx= -0.02, sy=  0.26, sz= 0.13,
-                                                  s= -2.423),
-    MGI            = Transform('MGI', tx=-577.326, ty=-90.129, tz=-463.920,
-                                      sx=   5.137, sy=  1.474, sz=   5.297,
-                                       s=  -2.423),  # Austria
-    NAD27          = Transform('NAD27', tx=8, ty=-160, tz=-176),
-    NAD83          = Transform('NAD83', tx= 1.004,  ty=-1.910,   tz=-0.515,
-                                        sx= 0.0267, sy= 0.00034, sz= 0.011,
-                                         s=-0.0015),
-    NTF            = Transform('NTF', tx=-168, ty= -60, tz=320),  # XXX verify
-    OSGB36         = Transform('OSGB36', tx=-446.448,  ty=125.157,  tz=-542.060,
-                                         sx=  -0.1502, sy= -0.2470, sz=  -0.8421,
-                                          s=  20.4894),
-    TokyoJapan     = Transform('TokyoJapan', tx=148, ty=-507, tz=-685),
-    WGS72          = Transform('WGS72', tz=-4.5, sz=0.554, s=-0.22),
-    WGS84          = Transform('WGS84'),  # unity
+Transforms._lazy(
+    BD72           = lambda: Transform('BD72', tx=106.868628, ty=-52.297783, tz=103.723893,
+                             # <http://www.ngi.be/FR/FR4-4.shtm> ETRS89 == WG84
+                             # <http://georepository.com/transformation_15929/BD72-to-WGS-84-3.html>
+                                               sx=-0.33657,   sy= -0.456955, sz= -1.84218,
+                                                s= 1.2727),
+    Bessel1841     = lambda: Transform('Bessel1841', tx=-582.0,  ty=-105.0, tz=-414.0,
+                                                     sx=  -1.04, sy= -0.35, sz=   3.08,
+                                                      s=  -8.3),
+    Clarke1866     = lambda: Transform('Clarke1866', tx=8, ty=-160, tz=-176),
+    DHDN           = lambda: Transform('DHDN', tx=-591.28,  ty=-81.35,   tz=-396.39,
+                                               sx=   1.477, sy= -0.0736, sz=  -1.458,
+                                                s=  -9.82),  # Germany
+    ED50           = lambda: Transform('ED50', tx=89.5, ty=93.8, tz=123.1,
+                             # <https://geonet.esri.com/thread/36583> sz=-0.156
+                             # <https://github.com/chrisveness/geodesy/blob/master/latlon-ellipsoidal.js>
+                             # <https://www.gov.uk/guidance/oil-and-gas-petroleum-operations-notices#pon-4>
+                                                                 sz=  0.156, s=-1.2),
+    Irl1965        = lambda: Transform('Irl1965', tx=-482.530, ty=130.596, tz=-564.557,
+                                                  sx=   1.042, sy=  0.214, sz=   0.631,
+                                                   s=  -8.15),
+    Irl1975        = lambda: Transform('Irl1975', tx=-482.530, ty=130.596, tz=-564.557,
+                             # XXX rotation signs may be opposite, to be checked
+                                                  sx=  -1.042, sy= -0.214, sz=  -0.631,
+                                                   s=  -1.1),
+    Krassovsky1940 = lambda: Transform('Krassovsky1940', tx=-24.0,  ty=123.0,  tz=94.0,
+                                                         sx= -0.02, sy=  0.26, sz= 0.13,
+                                                          s= -2.423),
+    MGI            = lambda: Transform('MGI', tx=-577.326, ty=-90.129, tz=-463.920,
+                                              sx=   5.137, sy=  1.474, sz=   5.297,
+                                               s=  -2.423),  # Austria
+    NAD27          = lambda: Transform('NAD27', tx=8, ty=-160, tz=-176),
+    NAD83          = lambda: Transform('NAD83', tx= 1.004,  ty=-1.910,   tz=-0.515,
+                                                sx= 0.0267, sy= 0.00034, sz= 0.011,
+                                                 s=-0.0015),
+    NTF            = lambda: Transform('NTF', tx=-168, ty= -60, tz=320),  # XXX verify
+    OSGB36         = lambda: Transform('OSGB36', tx=-446.448,  ty=125.157,  tz=-542.060,
+                                                 sx=  -0.1502, sy= -0.2470, sz=  -0.8421,
+                                                  s=  20.4894),
+    TokyoJapan     = lambda: Transform('TokyoJapan', tx=148, ty=-507, tz=-685),
+    WGS72          = lambda: Transform('WGS72', tz=-4.5, sz=0.554, s=-0.22),
+    WGS84          = lambda: Transform('WGS84'),  # unity
 )
 
 
@@ -619,57 +755,57 @@ class Datum(_Based):
 # to convert from WGS84 into the given datum.  More are available at
 # <http://earth-info.nga.mil/GandG/coordsys/datums/NATO_DT.pdf> and
 # <http://www.fieldenmaps.info/cconv/web/cconv_params.js>.
-Datums._assert(
+Datums._lazy(
     # Belgian Datum 1972, based on Hayford ellipsoid.
     # <https://nl.m.wikipedia.org/wiki/Belgian_Datum_1972>
     # <http://spatialreference.org/ref/sr-org/belge-1972-belgian-
     #         lambert-72-corrected-transformation-parameters/>
-    BD72           = Datum(Ellipsoids.Intl1924, Transforms.BD72),
+    BD72           = lambda: Datum(Ellipsoids.Intl1924, Transforms.BD72),
     # Germany <https://de.wikipedia.org/wiki/Bessel-Ellipsoid>
     #         <https://en.wikipedia.org/wiki/Helmert_transformation>
-    DHDN           = Datum(Ellipsoids.Bessel1841, Transforms.DHDN),
+    DHDN           = lambda: Datum(Ellipsoids.Bessel1841, Transforms.DHDN),
 
     # <http://www.gov.uk/guidance/oil-and-gas-petroleum-operations-notices#pon-4>
-    ED50           = Datum(Ellipsoids.Intl1924, Transforms.ED50),
+    ED50           = lambda: Datum(Ellipsoids.Intl1924, Transforms.ED50),
 
     # <http://en.wikipedia.org/wiki/GRS_80>
-    GRS80          = Datum(Ellipsoids.GRS80, Transforms.WGS84, name='GRS80'),
+    GRS80          = lambda: Datum(Ellipsoids.GRS80, Transforms.WGS84, name='GRS80'),
 
     # <http://osi.ie/OSI/media/OSI/Content/Publications/transformations_booklet.pdf>
-    Irl1975        = Datum(Ellipsoids.AiryModified, Transforms.Irl1975),
+    Irl1975        = lambda: Datum(Ellipsoids.AiryModified, Transforms.Irl1975),
 
     # Germany <https://en.wikipedia.org/wiki/Helmert_transformation>
-    Krassovsky1940 = Datum(Ellipsoids.Krassovsky1940, Transforms.Krassovsky1940),
+    Krassovsky1940 = lambda: Datum(Ellipsoids.Krassovsky1940, Transforms.Krassovsky1940),
 
     # Austria <https://de.wikipedia.org/wiki/Datum_Austria>
-    MGI            = Datum(Ellipsoids.Bessel1841, Transforms.MGI),
+    MGI            = lambda: Datum(Ellipsoids.Bessel1841, Transforms.MGI),
 
     # <http://en.wikipedia.org/wiki/Helmert_transformation>
-    NAD27          = Datum(Ellipsoids.Clarke1866, Transforms.NAD27),
+    NAD27          = lambda: Datum(Ellipsoids.Clarke1866, Transforms.NAD27),
 
     # NAD83 (2009) == WGS84 - <http://www.uvm.edu/giv/resources/WGS84_NAD83.pdf>
     # (If you *really* must convert WGS84<->NAD83, you need more than this!)
-    NAD83          = Datum(Ellipsoids.GRS80, Transforms.NAD83),
+    NAD83          = lambda: Datum(Ellipsoids.GRS80, Transforms.NAD83),
 
     #  Nouvelle Triangulation Francaise (Paris)  XXX verify
-    NTF            = Datum(Ellipsoids.Clarke1880IGN, Transforms.NTF),
+    NTF            = lambda: Datum(Ellipsoids.Clarke1880IGN, Transforms.NTF),
 
     # <http://www.ordnancesurvey.co.uk/docs/support/guide-coordinate-systems-great-britain.pdf>
-    OSGB36         = Datum(Ellipsoids.Airy1830, Transforms.OSGB36),
+    OSGB36         = lambda: Datum(Ellipsoids.Airy1830, Transforms.OSGB36),
 
     # Germany <https://en.wikipedia.org/wiki/Helmert_transformation>
-    Potsdam        = Datum(Ellipsoids.Bessel1841, Transforms.Bessel1841, name='Potsdam'),
+    Potsdam        = lambda: Datum(Ellipsoids.Bessel1841, Transforms.Bessel1841, name='Potsdam'),
 
     # XXX psuedo-ellipsoids for spherical LatLon
-    Sphere         = Datum(Ellipsoids.Sphere, Transforms.WGS84, name='Sphere'),
+    Sphere         = lambda: Datum(Ellipsoids.Sphere, Transforms.WGS84, name='Sphere'),
 
     # <http://www.geocachingtoolbox.com?page=datumEllipsoidDetails>
-    TokyoJapan     = Datum(Ellipsoids.Bessel1841, Transforms.TokyoJapan),
+    TokyoJapan     = lambda: Datum(Ellipsoids.Bessel1841, Transforms.TokyoJapan),
 
     # <http://www.icao.int/safety/pbn/documentation/eurocontrol/eurocontrol wgs 84 implementation manual.pdf>
-    WGS72          = Datum(Ellipsoids.WGS72, Transforms.WGS72),
+    WGS72          = lambda: Datum(Ellipsoids.WGS72, Transforms.WGS72),
 
-    WGS84          = Datum(Ellipsoids.WGS84, Transforms.WGS84),
+    WGS84          = lambda: Datum(Ellipsoids.WGS84, Transforms.WGS84),
 )
 
 
@@ -12,18 +12,19 @@ and <http://www.movable-type.co.uk/scripts/latlong-vectors.html>
 '''
 
 from math import radians
-try:
-    from string import letters as LETTERS
-except ImportError:  # Python 3+
-    from string import ascii_letters as LETTERS
+
+# string.ascii_letters, without importing modules string and re
+LETTERS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
 # all public contants, classes and functions
 __all__ = ('F_D', 'F_DM', 'F_DMS', 'F_RAD',  # format contants
            'S_DEG', 'S_MIN', 'S_SEC', 'S_SEP',  # symbols
-           'bearingDMS', 'compassDMS', 'compassPoint',  # functions
-           'latDMS', 'lonDMS', 'normDMS',
-           'parseDMS', 'parse3llh', 'precision', 'toDMS')
-__version__ = '17.03.24'
+           'bearingDMS', 'bearingDMSs',  # functions
+           'compassDMS', 'compassPoint', 'compassPoints',
+           'latDMS', 'latDMSs', 'lonDMS', 'lonDMSs', 'normDMS',
+           'parseDMS', 'parseDMSs', 'parse3llh', 'precision',
+           'toDMS', 'toDMSs')
+__version__ = '17.05.16'
 
 F_D   = 'd'    #: Format degrees as deg° (string).
 F_DM  = 'dm'   #: Format degrees as deg°min′ (string).
@@ -35,12 +36,17 @@ S_MIN = '′'  #: Minutes′ symbol (string).
 S_SEC = '″'  #: Seconds″ symbol (string).
 S_SEP = ''   #: Separator between deg, min and sec (string).
 
+_NAN = float('nan')  #: (INTERNAL) Not-a-number (float).
+
 _F_prec = {F_D: 6, F_DM: 4, F_DMS: 2, F_RAD: 5}  #: (INTERNAL) default precs.
 
 _S_norm = {'^': S_DEG, '˚': S_DEG,  #: (INTERNAL) normalized DMS.
            "'": S_MIN, '’': S_MIN, '′': S_MIN,
            '"': S_SEC, '″': S_SEC, '”': S_SEC}
 _S_ALL  = (S_DEG, S_MIN, S_SEC) + tuple(_S_norm.keys())  #: (INTERNAL) alternates.
+_S_NUL  = '\x00'  #: (INTERNAL) Symbol placeholder in L{parseDMSs}.
+
+_CHUNK = 4096  #: (INTERNAL) Strings per L{parseDMSs} pass (int).
 
 
 def _toDMS(deg, form, prec, ddd):
@@ -88,6 +94,67 @@ def _toDMS(deg, form, prec, ddd):
     return t + s
 
 
+def _toDMSs(degs, form, prec, ddd, pres=('', ''), sufs=('', '')):
+    '''(INTERNAL) Converts many degrees to strings, like L{_toDMS}
+       but with the format template precomputed once and with
+       prefix pres[deg < 0] and suffix sufs[deg < 0].
+    '''
+    if prec is None:
+        z = _F_prec.get(form, 6)
+    else:
+        z = int(prec)
+    p = abs(z)
+    w = p + (1 if p else 0)
+
+    f = form.lower()
+    if f in (F_D, 'deg'):
+        x, t = 0, '%%0%d.%df' % (ddd + w, p)
+        s = S_DEG
+
+    elif f in (F_RAD, 'radians'):
+        x, t = 1, '%%.%df' % (p,)
+        s = ''
+
+    elif f in (F_DM, 'deg+min'):
+        x, t = 2, '%%0%dd%s%s%%0%d.%df' % (ddd, S_DEG, S_SEP, w + 2, p)
+        s = S_MIN
+
+    else:  # F_DMS, 'deg+min+sec'
+        x, t = 3, '%%0%dd%s%s%%02d%s%s%%0%d.%df' % (ddd, S_DEG, S_SEP,
+                                                         S_MIN, S_SEP, w + 2, p)
+        s = S_SEC
+
+    z = (z - 1) if z > 1 else 0  # strip trailing decimal zeros, except one
+
+    r = []
+    _r = r.append
+    for deg in degs:
+        try:
+            d = abs(float(deg))
+        except ValueError:
+            raise ValueError('%s invalid: %r' % ('deg', deg))
+
+        if x > 2:
+            d, m = divmod(d * 3600, 3600)
+            m, d3 = divmod(m, 60)
+            u = t % (d, m, d3)  # %d truncates like int()
+        elif x > 1:
+            d, m = divmod(d * 60, 60)
+            u = t % (d, m)
+        elif x > 0:
+            u = t % (radians(d),)
+        else:
+            u = t % (d,)
+
+        if z and u.endswith('0'):
+            n = len(u) - z
+            u = u[:n] + u[n:].rstrip('0')
+
+        n = deg < 0
+        _r(pres[n] + u + s + sufs[n])
+    return r
+
+
 def bearingDMS(bearing, form=F_D, prec=None):
     '''Converts bearing to string.
 
@@ -102,6 +169,21 @@ def bearingDMS(bearing, form=F_D, prec=None):
     return _toDMS(bearing % 360, form, prec, 1)
 
 
+def bearingDMSs(bearings, form=F_D, prec=None):
+    '''Converts many bearings to strings.
+
+       Like L{bearingDMS} for each bearing, but with the format
+       template precomputed once.
+
+       @param bearings: Bearings from North (compass degrees).
+       @keyword form: Use F_D, F_DM, F_DMS or F_RAD for deg°, deg°min′, deg°min′sec″ or radians.
+       @keyword prec: Optional, number of decimal digits (0..9 or None).
+
+       @return: Compass degrees per the specified form (list of strings).
+    '''
+    return _toDMSs([b % 360 for b in bearings], form, prec, 1)
+
+
 _COMPASS = ('N', 'NNE', 'NE', 'ENE',
             'E', 'ESE', 'SE', 'SSE',
             'S', 'SSW', 'SW', 'WSW',
@@ -148,6 +230,28 @@ def compassPoint(bearing, prec=3):
     return _COMPASS[q * x]
 
 
+def compassPoints(bearings, prec=3):
+    '''Converts many bearings to compass points.
+
+       Like L{compassPoint} for each bearing.
+
+       @param bearings: Bearings from North (compass degrees).
+       @keyword prec: Optional precision (1 for cardinal, 2 for
+                      intercardinal or 3 for secondary-intercardinal).
+
+       @return: Compass points (list of 1-, 2- or 3-letter strings).
+
+       @raise ValueError: Invalid prec.
+    '''
+    try:
+        m, x = _M_X[prec]
+    except KeyError:
+        raise ValueError('%s invalid: %r' % ('prec', prec))
+
+    return [_COMPASS[(int(round((b % 360) * m / 360.0)) % m) * x]
+            for b in bearings]
+
+
 def latDMS(deg, form=F_DMS, prec=2):
     '''Converts latitude to string suffixed with N or S.
 
@@ -162,6 +266,21 @@ def latDMS(deg, form=F_DMS, prec=2):
     return _toDMS(deg, form, prec, 2) + ('S' if deg < 0 else 'N')
 
 
+def latDMSs(degs, form=F_DMS, prec=2):
+    '''Converts many latitudes to strings suffixed with N or S.
+
+       Like L{latDMS} for each latitude, but with the format
+       template precomputed once.
+
+       @param degs: Latitudes to be formatted (degrees).
+       @keyword form: Use F_D, F_DM, F_DMS or F_RAD for deg°, deg°min′, deg°min′sec″ or radians.
+       @keyword prec: Optional, number of decimal digits (0..9 or None).
+
+       @return: Degrees per the specified form (list of strings).
+    '''
+    return _toDMSs(degs, form, prec, 2, sufs=('N', 'S'))
+
+
 def lonDMS(deg, form=F_DMS, prec=2):
     '''Converts longitude to string suffixed with E or W.
 
@@ -179,6 +298,21 @@ def lonDMS(deg, form=F_DMS, prec=2):
 toLon = lonDMS  # XXX original name
 
 
+def lonDMSs(degs, form=F_DMS, prec=2):
+    '''Converts many longitudes to strings suffixed with E or W.
+
+       Like L{lonDMS} for each longitude, but with the format
+       template precomputed once.
+
+       @param degs: Longitudes to be formatted (degrees).
+       @keyword form: Use F_D, F_DM, F_DMS or F_RAD for deg°, deg°min′, deg°min′sec″ or radians.
+       @keyword prec: Optional, number of decimal digits (0..9 or None).
+
+       @return: Degrees per the specified form (list of strings).
+    '''
+    return _toDMSs(degs, form, prec, 3, sufs=('E', 'W'))
+
+
 def normDMS(strDMS, norm=''):
     '''Normalizes all degrees ˚, minutes ' and seconds " symbols
        in a string to the defaults %s, %s and %s.
@@ -285,6 +419,83 @@ def parseDMS(strDMS, suffix='NSEW'):
     return d
 
 
+def _parseDMS3(strDMS, suffix, ds, ms):
+    '''(INTERNAL) Parse one string, appending degrees and mask.
+    '''
+    try:
+        d, m = parseDMS(strDMS, suffix=suffix), False
+    except (AttributeError, TypeError, ValueError):
+        d, m = _NAN, True
+    ds.append(d)
+    ms.append(m)
+
+
+def _parseDMSs(strDMSs, suffix, ds, ms):
+    '''(INTERNAL) Parse a chunk of strings, replacing each symbol
+       once in all strings joined, appending degrees and mask.
+    '''
+    try:
+        t = '\n'.join(strDMSs)
+        if S_SEP or _S_NUL in t or t.count('\n') != len(strDMSs) - 1:
+            raise TypeError
+    except TypeError:  # non-string or unusual strings
+        for s in strDMSs:
+            _parseDMS3(s, suffix, ds, ms)
+        return
+
+    for s in _S_ALL:
+        t = t.replace(s, _S_NUL)
+
+    S = suffix.upper()
+    for t, s in zip(t.split('\n'), strDMSs):
+        try:  # like parseDMS, with _S_NUL for any symbol
+            t = t.strip()
+            d = t.lstrip('-+').rstrip(S).replace(_S_NUL, ' ').split()
+            n = len(d)
+            if n == 3:
+                d = float(d[0]) + (float(d[1]) + float(d[2]) / 60.0) / 60.0
+            elif n == 2:
+                d = float(d[0]) + float(d[1]) / 60.0
+            elif n == 1:
+                d = float(d[0])
+            else:
+                raise ValueError
+            if t[:1] == '-' or t[-1:] in 'SW':
+                d = -d
+            ds.append(d)
+            ms.append(False)
+        except ValueError:  # let parseDMS decide
+            _parseDMS3(s, suffix, ds, ms)
+
+
+def parseDMSs(strDMSs, suffix='NSEW'):
+    '''Parses many strings representing deg°min′sec″ to degrees.
+
+       Like L{parseDMS} for each string, except invalid strings
+       are flagged in the returned mask instead of raising an
+       exception.  Each symbol is replaced once in several
+       thousand strings at a time.
+
+       @param strDMSs: Degrees in any of several forms (strings).
+       @keyword suffix: Optional, valid compass directions (NEWS).
+
+       @return: 2-Tuple (degrees, mask) of two lists with the degrees
+                (float) respectively the invalid flag (bool) for each
+                string.  The degrees for invalid strings are NAN.
+
+       @example:
+
+       >>> t = parseDMSs(('51°28′40.12″N', '-0.0015', 'x'))
+       >>> # ([51.4778, -0.0015, nan], [False, False, True])
+    '''
+    ds, ms = [], []
+    if not isinstance(strDMSs, (list, tuple)):
+        strDMSs = list(strDMSs)
+    for i in range(0, len(strDMSs), _CHUNK):
+        _parseDMSs(strDMSs[i:i + _CHUNK], suffix, ds, ms)
+    return ds, ms
+
+
 def precision(form, prec=None):
     '''Sets the default precison for a given F_ form.
 
@@ -322,6 +533,28 @@ def toDMS(deg, form=F_DMS, prec=2, ddd=2, neg='-', pos=''):
     s = neg if deg < 0 else pos
     return s + t
 
+
+def toDMSs(degs, form=F_DMS, prec=2, ddd=2, neg='-', pos=''):
+    '''Converts many signed degrees to strings, without suffix.
+
+       Like L{toDMS} for each of the degrees, but with the format
+       template precomputed once.
+
+       @param degs: Degrees to be formatted (scalars).
+       @keyword form: F_D, F_DM, F_DMS or F_RAD for deg°, deg°min′, deg°min′sec″ or radians.
+       @keyword prec: Optional, number of decimal digits (0..9 or None).
+       @keyword ddd: Optional, number of digits for deg° (2 or 3).
+       @keyword neg: Optional, sign for negative degrees ('-').
+       @keyword pos: Optional, sign for positive degrees ('').
+
+       @return: Degrees per the specified form (list of strings).
+
+       @example:
+
+       >>> t = toDMSs((45.7626, -0.0015), F_D, 4)  # ['45.7626°', '-00.0015°']
+    '''
+    return _toDMSs(degs, form, prec, ddd, pres=(pos, neg))
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
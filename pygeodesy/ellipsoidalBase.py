@@ -14,15 +14,20 @@ U{http://www.movable-type.co.uk/scripts/geodesy/docs/latlon-ellipsoidal.js.html}
 from .bases import LatLonHeightBase
 from .datum import Datum, Datums
 from .dms import parse3llh
-from .utils import EPS, degrees90, degrees180, hypot1
+from .instrument import _timed
+from .utils import EPS, PI, PI_2, degrees90, degrees180, degrees360, \
+                   hypot1, wrapPI
 from .vector3d import Vector3d
 
-from math import atan2, copysign, cos, hypot, sin, sqrt
+from math import asinh, atan2, atanh, copysign, cos, hypot, radians, \
+                 sin, sqrt, tan
 
 # XXX the following classes are listed only to get
 # Epydoc to include class and method documentation
 __all__ = ('CartesianBase', 'LatLonEllipsoidalBase')
-__version__ = '17.05.08'
+__version__ = '17.05.16'
+
+_TOL = 1e-6  #: (INTERNAL) Isometric latitude tolerance (radians).
 
 
 class CartesianBase(Vector3d):
@@ -64,38 +69,8 @@ class CartesianBase(Vector3d):
            @return: 3-Tuple (lat, lon, heigth) in (degrees90,
                     degrees180, meter).
         '''
-        E = datum.ellipsoid
         x, y, z = self.to3xyz()
-
-        p = hypot(x, y)  # distance from minor axis
-        r = hypot(p, z)  # polar radius
-
-        if min(p, r) > EPS:
-            # parametric latitude (Bowring eqn 17, replaced)
-            t = (E.b * z) / (E.a * p) * (1 + E.e22 * E.b / r)
-            c = 1 / hypot1(t)
-            s = t * c
-
-            # geodetic latitude (Bowring eqn 18)
-            a = atan2(z + E.e22 * E.b * s * s * s,
-                      p - E.e2  * E.a * c * c * c)
-            b = atan2(y, x)  # ... and longitude
-
-            # height above ellipsoid (Bowring eqn 7)
-            ca, sa = cos(a), sin(a)
-#           r = E.a / E.e2s2(sa)  # length of normal terminated by minor axis
-#           h = p * ca + z * sa - (E.a * E.a / r)
-            h = p * ca + z * sa - (E.a * E.e2s2(sa))
-
-            a, b = degrees90(a), degrees180(b)
-
-        # see <http://GIS.StackExchange.com/questions/28446/>
-        elif p > EPS:  # latitude arbitrarily zero
-            a, b, h = 0.0, degrees180(atan2(y, x)), p - E.a
-        else:  # polar latitude, longitude arbitrarily zero
-            a, b, h = copysign(90.0, z), 0.0, abs(z) - E.b
-
-        return a, b, h
+        return _xyz2llh(x, y, z, datum.ellipsoid)
 
     def toStr(self, prec=3, fmt='[%s]', sep=', '):  # PYCHOK expected
         '''String representation of this cartesion.
@@ -114,6 +89,7 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
     '''
     _datum = Datums.WGS84  #: (INTERNAL) Datum (L{Datum}).
     _osgr  = None  #: (INTERNAL) cache toOsgr ({Osgr}).
+    _rhumb = None  #: (INTERNAL) cache _rhumb4 (4-tuple).
     _utm   = None  #: (INTERNAL) cache toUtm (L{Utm}).
 
     def __init__(self, lat, lon, height=0, datum=None):
@@ -134,11 +110,35 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
         if datum:  # check datum
             self.datum = datum
 
+    def _topsub(self, lat, lon, height=0, datum=None):
+        '''(INTERNAL) New instance of this "top- or sub-most" class
+           from lat- and longitude floats, bypassing L{parseDMS}.
+
+           @param lat: Latitude (degrees float).
+           @param lon: Longitude (degrees float).
+           @keyword height: Optional height (meter).
+           @keyword datum: Optional datum (L{Datum}).
+
+           @return: New instance (L{LatLonEllipsoidalBase}).
+        '''
+        c = self.__class__
+        if c.__init__ != LatLonEllipsoidalBase.__init__:  # overloaded
+            return c(lat, lon, height=height, datum=datum)
+        p = c.__new__(c)
+        p._lat = lat
+        p._lon = lon
+        if height:
+            p._height = float(height)
+        if datum:  # check datum
+            p.datum = datum
+        return p
+
     def _update(self, updated):
         if updated:  # reset caches
-            self._osgr = self._utm = None
+            self._osgr = self._rhumb = self._utm = None
             LatLonHeightBase._update(self, updated)
 
+    @_timed('LatLon.convertDatum')
     def convertDatum(self, toDatum):
         '''Converts this point to a new coordinate system.
 
@@ -272,7 +272,117 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
            @raise ValueError: Invalid strll.
         '''
         a, b, h = parse3llh(strll, height=height, sep=sep)
-        return self.topsub(a, b, height=h, datum=datum or self.datum)
+        return self._topsub(a, b, height=h, datum=datum or self.datum)
+
+    def _rhumb4(self, E):
+        '''(INTERNAL) Get this point's lat-, longitude, isometric
+           latitude and meridian distance, cached.
+
+           @param E: This point's ellipsoid (L{Ellipsoid}).
+
+           @return: 4-Tuple (lat, lon, psi, m) in (radians,
+                    radians, radians, meter).
+        '''
+        r = self._rhumb
+        if r is None:
+            a, b = self.to2ab()
+            r = self._rhumb = a, b, _psi(a, E), _meridian(a, E)
+        return r
+
+    def rhumbBearingTo(self, other):
+        '''Returns the initial bearing (forward azimuth) from this
+           to an other point along an ellipsoidal rhumb (loxodrome)
+           line.
+
+           @param other: The other point (L{LatLonEllipsoidalBase}).
+
+           @return: Initial bearing (compass degrees).
+
+           @raise TypeError: The other point is not L{LatLon}.
+
+           @raise ValueError: If datum ellipsoids are incompatible.
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> q = LatLon(50.964, 1.853)
+           >>> b = p.rhumbBearingTo(q)  # 116.66
+        '''
+        E = self.ellipsoids(other)
+        _, b1, p1, _ = self._rhumb4(E)
+        _, b2, p2, _ = other._rhumb4(E)
+        # if |db| > 180 take shorter rhumb
+        # line across the anti-meridian
+        return degrees360(atan2(wrapPI(b2 - b1), p2 - p1))
+
+    def rhumbDestination(self, distance, bearing, height=None):
+        '''Returns the destination point having travelled along an
+           ellipsoidal rhumb (loxodrome) line from this point the
+           given distance on the given bearing.
+
+           @param distance: Distance travelled (meter).
+           @param bearing: Bearing from this point (compass degrees).
+           @keyword height: Optional height, overriding the default
+                            height (meter).
+
+           @return: The destination point (L{LatLonEllipsoidalBase}).
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> q = p.rhumbDestination(40300, 116.7)  # 50.964234°N, 001.851383°E
+        '''
+        E = self.ellipsoid()
+        a1, b1, p1, m1 = self._rhumb4(E)
+
+        d = float(distance)
+        t = radians(bearing)
+
+        dm = d * cos(t)
+        # rectifying latitude, normalized if past pole
+        m2 = (m1 + dm) / E.A
+        if m2 > PI_2:
+            m2 =  PI - m2
+        elif m2 < -PI_2:
+            m2 = -PI - m2
+        a2 = _rectifying(m2, E)
+
+        q = _q(a1, a2, p1, _psi(a2, E), dm, E)
+        if abs(q) > EPS:
+            b2 = b1 + d * sin(t) / q
+        else:
+            b2 = b1
+
+        h = self.height if height is None else height
+        return self._topsub(degrees90(a2), degrees180(b2),
+                            height=h, datum=self.datum)
+
+    def rhumbDistanceTo(self, other):
+        '''Returns the distance from this to an other point along
+           an ellipsoidal rhumb (loxodrome) line.
+
+           @param other: The other point (L{LatLonEllipsoidalBase}).
+
+           @return: Distance (meter, the same units as the axes
+                    of this point's datum ellipsoid).
+
+           @raise TypeError: The other point is not L{LatLon}.
+
+           @raise ValueError: If datum ellipsoids are incompatible.
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> q = LatLon(50.964, 1.853)
+           >>> d = p.rhumbDistanceTo(q)  # 40413.1
+        '''
+        E = self.ellipsoids(other)
+        a1, b1, p1, m1 = self._rhumb4(E)
+        a2, b2, p2, m2 = other._rhumb4(E)
+
+        dm = m2 - m1
+        q = _q(a1, a2, p1, p2, dm, E)
+        return hypot(dm, q * wrapPI(b2 - b1))
 
     def to3xyz(self):  # overloads _LatLonHeightBase.to3xyz
         '''Converts this (ellipsoidal) geodetic LatLon point to
@@ -281,17 +391,7 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
            @return: 3-Tuple (x, y, z) in (meter).
         '''
         a, b = self.to2ab()
-        sa = sin(a)
-
-        E = self.ellipsoid()
-        # radius of curvature in prime vertical
-        r = E.a / sqrt(1 - E.e2 * sa * sa)
-
-        h = self.height
-        t = (h + r) * cos(a)
-        return (t * cos(b),
-                t * sin(b),
-               (h + r * E.e12) * sa)
+        return _llh2xyz(a, b, self.height, self.ellipsoid())
 
     def toOsgr(self):
         '''Converts this lat-/longitude to an OSGR coordinate.
@@ -319,6 +419,145 @@ class LatLonEllipsoidalBase(LatLonHeightBase):
             self._utm._latlon = self
         return self._utm
 
+
+def _convertDatum3(lat, lon, height, datum, toDatum):
+    '''(INTERNAL) Converts lat-, longitude and height from one to
+       an other datum, like L{LatLonEllipsoidalBase.convertDatum}
+       but without any intermediate objects.
+
+       @return: 3-Tuple (lat, lon, height) in (degrees90,
+                degrees180, meter).
+    '''
+    if datum == toDatum:
+        return lat, lon, height
+
+    xyz = _llh2xyz(radians(lat), radians(lon), height, datum.ellipsoid)
+    if datum != Datums.WGS84:  # convert to WGS84 first
+        xyz = datum.transform.transform(*xyz, inverse=True)
+    if toDatum != Datums.WGS84:
+        xyz = toDatum.transform.transform(*xyz)
+    return _xyz2llh(*xyz, E=toDatum.ellipsoid)
+
+
+def _llh2xyz(a, b, h, E):
+    '''(INTERNAL) Converts geodetic lat-, longitude and height
+       to geocentric x, y and z.
+
+       @param a: Latitude (radians).
+       @param b: Longitude (radians).
+       @param h: Height above ellipsoid (meter).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: 3-Tuple (x, y, z) in (meter).
+    '''
+    sa = sin(a)
+    # radius of curvature in prime vertical
+    r = E.a / sqrt(1 - E.e2 * sa * sa)
+
+    t = (h + r) * cos(a)
+    return (t * cos(b),
+            t * sin(b),
+           (h + r * E.e12) * sa)
+
+
+def _meridian(a, E):
+    '''(INTERNAL) Computes the meridian distance from the equator.
+
+       @param a: Latitude (radians).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: Meridian distance (meter).
+    '''
+    m1, m2, m3, m4 = E.Mu4
+    # rectifying latitude times the rectifying radius
+    return E.A * (a + m1 * sin(2 * a) + m2 * sin(4 * a)
+                    + m3 * sin(6 * a) + m4 * sin(8 * a))
+
+
+def _psi(a, E):
+    '''(INTERNAL) Computes the isometric latitude.
+
+       @param a: Latitude (radians).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: Isometric latitude (radians).
+    '''
+    return asinh(tan(a)) - E.e * atanh(E.e * sin(a))
+
+
+def _q(a1, a2, p1, p2, dm, E):
+    '''(INTERNAL) Computes the ratio of meridian distance and
+       isometric latitude differences, stretching the longitude.
+
+       @param a1: Start latitude (radians).
+       @param a2: End latitude (radians).
+       @param p1: Start isometric latitude (radians).
+       @param p2: End isometric latitude (radians).
+       @param dm: Meridian distance difference (meter).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: Ratio (meter).
+    '''
+    dp = p2 - p1
+    if abs(dp) > _TOL:
+        return dm / dp
+    # the ratio is ill-conditioned for (nearly) E-W lines
+    # and tends to the parallel radius nu * cos(lat)
+    a = (a1 + a2) * 0.5
+    s = E.e * sin(a)
+    return E.a * cos(a) / sqrt(1 - s * s)
+
+
+def _rectifying(m, E):
+    '''(INTERNAL) Converts rectifying to geodetic latitude.
+
+       @param m: Rectifying latitude (radians).
+       @param E: Ellipsoid (L{Ellipsoid}).
+
+       @return: Latitude (radians).
+    '''
+    a1, a2, a3, a4 = E.Phi4
+    return (m + a1 * sin(2 * m) + a2 * sin(4 * m)
+              + a3 * sin(6 * m) + a4 * sin(8 * m))
+
+
+def _xyz2llh(x, y, z, E):
+    '''(INTERNAL) Converts geocentric x, y and z to geodetic
+       lat-, longitude and height, see L{CartesianBase.to3llh}.
+
+       @return: 3-Tuple (lat, lon, height) in (degrees90,
+                degrees180, meter).
+    '''
+    p = hypot(x, y)  # distance from minor axis
+    r = hypot(p, z)  # polar radius
+
+    if min(p, r) > EPS:
+        # parametric latitude (Bowring eqn 17, replaced)
+        t = (E.b * z) / (E.a * p) * (1 + E.e22 * E.b / r)
+        c = 1 / hypot1(t)
+        s = t * c
+
+        # geodetic latitude (Bowring eqn 18)
+        a = atan2(z + E.e22 * E.b * s * s * s,
+                  p - E.e2  * E.a * c * c * c)
+        b = atan2(y, x)  # ... and longitude
+
+        # height above ellipsoid (Bowring eqn 7)
+        ca, sa = cos(a), sin(a)
+#       r = E.a / E.e2s2(sa)  # length of normal terminated by minor axis
+#       h = p * ca + z * sa - (E.a * E.a / r)
+        h = p * ca + z * sa - (E.a * E.e2s2(sa))
+
+        a, b = degrees90(a), degrees180(b)
+
+    # see <http://GIS.StackExchange.com/questions/28446/>
+    elif p > EPS:  # latitude arbitrarily zero
+        a, b, h = 0.0, degrees180(atan2(y, x)), p - E.a
+    else:  # polar latitude, longitude arbitrarily zero
+        a, b, h = copysign(90.0, z), 0.0, abs(z) - E.b
+
+    return a, b, h
+
 # **) MIT License
 #
 # Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
@@ -2,8 +2,8 @@
 # -*- coding: utf-8 -*-
 
 '''Vector-based ellipsoidal geodetic (lat-/longitude) and cartesion
-(x/y/z) classes L{LatLon}, L{Ned}, L{Nvector} and L{Cartesian} and
-functions L{meanOf} and L{toNed}.
+(x/y/z) classes L{LatLon}, L{Ned}, L{Nvector}, L{Cartesian} and
+L{LocalFrame} and functions L{meanOf} and L{toNed}.
 
 Python implementation of vector-based geodetic (lat-/longitude) methods
 by I{(C) Chris Veness 2011-2016} published under the same MIT Licence**,
@@ -22,20 +22,21 @@ U{http://www.navlab.net/Publications/A_Nonsingular_Horizontal_Position_Represent
 '''
 
 from .datum import Datum, Datums
-from .dms import F_D, toDMS
-from .ellipsoidalBase import CartesianBase, LatLonEllipsoidalBase
-from .nvector import NorthPole, LatLonNvectorBase, \
-                    Nvector as NvectorBase, sumOf
-from .utils import EPS, degrees90, degrees360, cbrt, fdot, fStr, \
-                  hypot3, radians
+from .dms import F_D, F_DMS, toDMS
+from .ellipsoidalBase import CartesianBase, LatLonEllipsoidalBase, \
+                           _llh2xyz, _xyz2llh
+from .nvector import LatLonNvectorBase, Nvector as NvectorBase, sumOf
+from .sphericalKernels import _columns
+from .utils import EPS, degrees90, degrees360, cbrt, fdot, fprecise, \
+                  fStr, hypot3, radians
 from .vector3d import Vector3d
 
 from math import asin, atan2, cos, hypot, sin, sqrt
 
 # all public contants, classes and functions
-__all__ = ('Cartesian', 'LatLon', 'Ned', 'Nvector',  # classes
+__all__ = ('Cartesian', 'LatLon', 'LocalFrame', 'Ned', 'Nvector',  # classes
            'meanOf', 'toNed')  # functions
-__version__ = '17.05.15'
+__version__ = '17.05.16'
 
 
 class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
@@ -53,13 +54,21 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
     def _rotation3(self):
         '''(INTERNAL) Build rotation matrix from n-vector
            coordinate frame axes.
+
+           East and north are computed from the cached sin and cos
+           of lat- and longitude, which equals the unit cross product
+           NorthPole.cross(nv) respectively east.cross(down) except
+           for rounding in the last bit.  At the poles, where that
+           cross product is degenerate, north and east are the limits
+           approaching the pole along this point's meridian.
         '''
         if self._r3 is None:
             nv = self.toNvector()  # local (n-vector) coordinate frame
+            sa, ca, sb, cb = self._sincos4()
 
             d = nv.negate()  # down (opposite to n-vector)
-            e = NorthPole.cross(nv).unit()  # east (pointing perpendicular to the plane)
-            n = e.cross(d)  # north (by right hand rule)
+            e = NvectorBase(-sb, cb, 0)  # east, perpendicular to the meridian
+            n = NvectorBase(-sa * cb, -sa * sb, ca)  # north, by right hand rule
 
             self._r3 = n, e, d  # matrix rows
         return self._r3
@@ -123,6 +132,10 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
            on the ellipsoid.  The points need not be defined on
            the same datum.
 
+           At the poles, north and east are oriented as when approaching
+           the pole along this point's meridian, with north pointing
+           along the opposite meridian at the North pole.
+
            @param other: The other point (L{LatLon}).
 
            @return: Delta of this point (L{Ned}).
@@ -183,6 +196,10 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
     def destinationNed(self, delta):
         '''Calculates destination point using supplied delta from this point.
 
+           At the poles, north and east are oriented as when approaching
+           the pole along this point's meridian, with north pointing
+           along the opposite meridian at the North pole.
+
            @param delta: Delta from this to the other point in the
                          local tangent plane (LTP) of this point (L{Ned}).
 
@@ -215,7 +232,7 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
         # obtain destination point as cartesian
         v = self.toCartesian().plus(dc)  # the plus() gives a plain vector
 
-        return v.toLatLon(datum=self.datum, LatLon=self.topsub)  # Cartesian(v.x, v.y, v.z).toLatLon(...)
+        return v.toLatLon(datum=self.datum, LatLon=self._topsub)  # Cartesian(v.x, v.y, v.z).toLatLon(...)
 
 #     def distanceTo(self, other):
 #         '''Returns distance from this to an other point.
@@ -370,7 +387,7 @@ class LatLon(LatLonNvectorBase, LatLonEllipsoidalBase):
             h = self._havg(other, f=fraction)
         else:
             h = height
-        return i.toLatLon(height=h, LatLon=self.topsub)  # Nvector(i.x, i.y, i.z).toLatLon(...)
+        return i.toLatLon(height=h, LatLon=self._topsub)  # Nvector(i.x, i.y, i.z).toLatLon(...)
 
     def toCartesian(self):
         '''Convert this (geodetic) point to (geocentric x/y/z)
@@ -482,6 +499,155 @@ class Cartesian(CartesianBase):
         return self._Nv
 
 
+class LocalFrame(object):
+    '''A local tangent plane (LTP) at a fixed origin to convert many
+       points to and from North-East-Down (NED) or East-North-Up (ENU)
+       coordinates.
+
+       The rotation matrix and the geocentric (ECEF) position of the
+       origin are computed once.  The conversions match those by
+       methods L{LatLon.deltaTo} and L{LatLon.destinationNed} without
+       creating any L{LatLon}, L{Cartesian} or L{Ned} instances.
+
+       @example:
+
+       >>> f = LocalFrame(LatLon(49.66618, 3.45063))
+       >>> t = f.toNeds([48.88667], [2.37472])  # [(-86126, -78900, 1069)]
+       >>> t = f.fromNeds(t)  # [(48.88667, 2.37472, 0.0)]
+    '''
+    _datum  = None  #: (INTERNAL) Origin datum (L{Datum}).
+    _origin = None  #: (INTERNAL) Origin point (L{LatLon}).
+    _r3     = ()    #: (INTERNAL) Rotation matrix rows (3-tuple (x, y, z)).
+    _xyz    = ()    #: (INTERNAL) Origin ECEF (3-tuple (x, y, z)).
+
+    def __init__(self, origin):
+        '''New local tangent plane.
+
+           @param origin: The origin of the local frame (L{LatLon}).
+
+           @raise TypeError: The origin is not L{LatLon}.
+
+           @example:
+
+           >>> f = LocalFrame(LatLon(49.66618, 3.45063))
+        '''
+        _Nvll.others(origin, name='origin')
+
+        self._datum  = origin.datum
+        self._origin = origin.copy()
+        self._r3  = tuple(v.to3xyz() for v in origin._rotation3())
+        self._xyz = origin.to3xyz()
+
+    def __str__(self):
+        return self.toStr()
+
+    @property
+    def datum(self):
+        '''Gets the datum of this frame's origin (L{Datum}).
+        '''
+        return self._datum
+
+    @property
+    def origin(self):
+        '''Gets the origin of this frame (L{LatLon}).
+        '''
+        return self._origin.copy()
+
+    def fromEnus(self, enus):
+        '''Converts local East-North-Up coordinates to points.
+
+           @param enus: Deltas from the origin (3-tuple (east, north,
+                        up)[] in meter).
+
+           @return: Points (3-tuple (lat, lon, height)[] in (degrees90,
+                    degrees180, meter)) on this frame's datum.
+        '''
+        return self.fromNeds((n, e, -u) for e, n, u in enus)
+
+    def fromNeds(self, neds):
+        '''Converts local North-East-Down coordinates to points, like
+           method L{LatLon.destinationNed} for each delta.
+
+           @param neds: Deltas from the origin (3-tuple (north, east,
+                        down)[] in meter).
+
+           @return: Points (3-tuple (lat, lon, height)[] in (degrees90,
+                    degrees180, meter)) on this frame's datum.
+
+           @example:
+
+           >>> f = LocalFrame(LatLon(49.66618, 3.45063))
+           >>> t = f.fromNeds([(-86126, -78900, 1069)])  # [(48.88667, 2.37472, 0)]
+        '''
+        E = self._datum.ellipsoid
+        f = fprecise()
+        (nx, ny, nz), (ex, ey, ez), (dx, dy, dz) = self._r3
+        x0, y0, z0 = self._xyz
+        # rotate each delta to the cartesian (ECEF) frame
+        # using the rotation matrix column vectors
+        return [_xyz2llh(x0 + fdot(dn, nx, ex, dx, precise=f),
+                         y0 + fdot(dn, ny, ey, dy, precise=f),
+                         z0 + fdot(dn, nz, ez, dz, precise=f), E)
+                for dn in neds]
+
+    def toEnus(self, lats, lons, heights=0):
+        '''Converts points to local East-North-Up coordinates.
+
+           @param lats: Latitudes (degrees[] or degrees).
+           @param lons: Longitudes (degrees[] or degrees).
+           @keyword heights: Heights above the ellipsoid (meter[]
+                             or meter).
+
+           @return: Deltas from the origin (3-tuple (east, north,
+                    up)[] in meter).
+
+           @raise ValueError: Unequal column lengths.
+        '''
+        return [(e, n, -d) for n, e, d in self.toNeds(lats, lons, heights)]
+
+    def toNeds(self, lats, lons, heights=0):
+        '''Converts points to local North-East-Down coordinates, like
+           method L{LatLon.deltaTo} for each point on this frame's datum.
+
+           @param lats: Latitudes (degrees[] or degrees).
+           @param lons: Longitudes (degrees[] or degrees).
+           @keyword heights: Heights above the ellipsoid (meter[]
+                             or meter).
+
+           @return: Deltas from the origin (3-tuple (north, east,
+                    down)[] in meter).
+
+           @raise ValueError: Unequal column lengths.
+
+           @example:
+
+           >>> f = LocalFrame(LatLon(49.66618, 3.45063))
+           >>> t = f.toNeds([48.88667], [2.37472])  # [(-86126, -78900, 1069)]
+        '''
+        n, cs = _columns(lats, lons, heights)
+        E = self._datum.ellipsoid
+        f = fprecise()
+        r3 = self._r3
+        x0, y0, z0 = self._xyz
+        neds = []
+        for a, b, h in zip(*cs):
+            x, y, z = _llh2xyz(radians(a), radians(b), h, E)
+            # delta in cartesian frame, rotated to the
+            # n-vector frame using the rotation matrix rows
+            dc = x - x0, y - y0, z - z0
+            neds.append(tuple(fdot(dc, *r, precise=f) for r in r3))
+        return neds
+
+    def toStr(self, form=F_DMS, prec=None, m='m', sep=', '):  # PYCHOK expected
+        '''Returns a string representation of this frame's origin.
+
+           See method L{LatLon}.toStr for the keyword arguments.
+
+           @return: Origin (string).
+        '''
+        return self._origin.toStr(form=form, prec=prec, m=m, sep=sep)
+
+
 class Ned(object):
     '''North-Eeast-Down (NED), also known as Local Tangent Plane (LTP),
        is a vector in the local coordinate frame of a body.
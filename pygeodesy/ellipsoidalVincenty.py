@@ -52,13 +52,15 @@ or by converting to anothor datum:
 
 from .datum import Datums
 from .ellipsoidalBase import CartesianBase, LatLonEllipsoidalBase
-from .utils import EPS, degrees90, degrees180, degrees360, radians
+from .instrument import _count, _histogram, _timed
+from .utils import EPS, degrees90, degrees180, degrees360, hsin3, \
+                   radians, wrapPI, _equirectangular
 
-from math import atan2, cos, hypot, sin, tan
+from math import atan2, cos, hypot, sin, sqrt, tan
 
 # all public contants, classes and functions
 __all__ = ('Cartesian', 'LatLon', 'VincentyError')  # classes
-__version__ = '17.05.15'
+__version__ = '17.05.16'
 
 
 class VincentyError(Exception):
@@ -82,7 +84,8 @@ class LatLon(LatLonEllipsoidalBase):
        converge for some valid points, raising a VincentyError.  In
        that case, a result may be obtained by increasing the epsilon
        and/or the iteration limit, see properties L{LatLon.epsilon}
-       and L{LatLon.iterations}.
+       and L{LatLon.iterations}.  The number of iterations actually
+       used is recorded when enabled, see module L{instrument}.
     '''
     _epsilon    = 1.0e-12  # about 0.006 mm
     _iterations = 50
@@ -184,6 +187,88 @@ class LatLon(LatLonEllipsoidalBase):
         '''
         return self._inverse(other, False)
 
+    def distanceTo2(self, other, tolerance=0):
+        '''Computes the distance between this and an other point within
+           a relative tolerance, using the cheapest formula whose error
+           bound satisfies the tolerance.
+
+           The formulas and their relative error bounds, with I{f} the
+           flattening of this point's datum ellipsoid, are:
+
+            - Equirectangular: M{1.7 * f + (dλ**2 * sin(φ)**2 + θ**2) / 4}
+              with longitude delta M{dλ}, max. absolute latitude M{φ} and
+              the angular distance M{θ} in radians, short distances only.
+
+            - Haversine on a sphere with the ellipsoid's mean radius
+              I{R}: M{1.7 * f}, about 0.56% for WGS84.
+
+            - Andoyer-Lambert: M{2 * f**2}, about 2.3e-5 for WGS84, for
+              angular distances up to 170 degrees.
+
+            - Vincenty: 0, accurate to within the L{LatLon.epsilon}.
+
+           The bounds were obtained empirically, comparing the results of
+           each formula against Vincenty for random points, short and
+           long, on datums WGS84, OSGB36 (Airy1830), NAD27 (Clarke1866),
+           ED50 (Intl1924) and NTF (Clarke1880IGN).
+
+           Coincident points have distance 0.0 with the error bound of
+           the formula used, for any tolerance above the Andoyer-Lambert
+           bound.  Only Vincenty, used for a smaller tolerance, raises
+           a L{VincentyError} for coincident points.
+
+           @param other: Destination point (L{LatLon}).
+           @keyword tolerance: Relative distance tolerance (float),
+                               0 for Vincenty.
+
+           @return: 2-Tuple (distance, error bound) in (meter, float),
+                    where the error bound is the relative error bound
+                    of the formula used.
+
+           @raise TypeError: The other point is not L{LatLon}.
+
+           @raise ValueError: If this and the other point's L{Datum}
+                              ellipsoids are not compatible.
+
+           @raise VincentyError: Vincenty fails to converge for the current
+                                 L{LatLon.epsilon} and L{LatLon.iterations}
+                                 limit or this and the other point coincide,
+                                 only if the tolerance is below the
+                                 Andoyer-Lambert bound.
+
+           @example:
+
+           >>> p = LatLon(50.06632, -5.71475)
+           >>> q = LatLon(58.64402, -3.07009)
+           >>> d, e = p.distanceTo2(q, tolerance=0.001)  # 969,961.1 m, 2.2e-5
+        '''
+        E = self.ellipsoids(other)
+
+        t = float(tolerance)
+        if t > 0:
+            a1, b1 = self.to2ab()
+            a2, b2 = other.to2ab()
+            db = wrapPI(b2 - b1)
+
+            e = E.f * _TOL_HSIN
+            if t > e:  # spherical
+                sa1, ca1, _, _ = self._sincos4()
+                r = _equirectangular(a1, ca1, sa1, a2, db)
+                s = sin(max(abs(a1), abs(a2))) * db
+                x = e + (s * s + r * r) * 0.25
+                if x > t:
+                    r, _, _ = hsin3(a2, a1, db)
+                    x = e
+                return r * E.R, x
+
+            e = E.f * E.f * _TOL_ANDOYER
+            if t > e:
+                d = _andoyer(E, a1, a2, db)
+                if d is not None:
+                    return d, e
+
+        return self._inverse(other, False), 0
+
     def distanceTo3(self, other):
         '''Computes the distance and the initial and final bearing along
            a geodesic between this and an other point, using Vincenty's
@@ -340,6 +425,7 @@ class LatLon(LatLonEllipsoidalBase):
         x, y, z = self.to3xyz()  # ellipsoidalBase.LatLonEllipsoidalBase
         return Cartesian(x, y, z)  # this ellipsoidalVincenty.Cartesian
 
+    @_timed('Vincenty.direct')
     def _direct(self, distance, bearing, llr, height=None):
         '''(INTERNAL) Direct Vincenty method.
 
@@ -364,13 +450,17 @@ class LatLon(LatLonEllipsoidalBase):
             A, B = _p2(c2a, E.e22)
 
         s = d = distance / (E.b * A)
-        for _ in range(self._iterations):
+        for i in range(1, self._iterations + 1):
             cs, ss, c2sm = cos(s), sin(s), cos(s12 + s)
             s_, s = s, d + _ds(B, cs, ss, c2sm)
             if abs(s - s_) < self._epsilon:
                 break
         else:
+            _count('Vincenty.direct.errors')
+            _histogram('Vincenty.direct', 0)
             raise VincentyError('no convergence %r' % (self,))
+        _count('Vincenty.direct.iterations', i)
+        _histogram('Vincenty.direct', i)
 
         t = s1 * ss - c1 * cs * ci
         # final bearing (reverse azimuth +/- 180)
@@ -384,9 +474,10 @@ class LatLon(LatLonEllipsoidalBase):
                           _dl(E.f, c2a, sa, s, cs, ss, c2sm) +
                            radians(self.lon))
             h = self.height if height is None else height
-            r = self.topsub(a, b, height=h, datum=self.datum), r
+            r = self._topsub(a, b, height=h, datum=self.datum), r
         return r
 
+    @_timed('Vincenty.inverse')
     def _inverse(self, other, azis):
         '''(INTERNAL) Inverse Vincenty method.
 
@@ -408,11 +499,13 @@ class LatLon(LatLonEllipsoidalBase):
         c1s2, s1c2 = c1 * s2, s1 * c2
 
         ll = dl = radians(other.lon - self.lon)
-        for _ in range(self._iterations):
+        for i in range(1, self._iterations + 1):
             cll, sll, ll_ = cos(ll), sin(ll), ll
 
             ss = hypot(c2 * sll, c1s2 - s1c2 * cll)
             if ss < EPS:
+                _count('Vincenty.inverse.errors')
+                _histogram('Vincenty.inverse', 0)
                 raise VincentyError('%r coincident with %r' % (self, other))
             cs = s1s2 + c1c2 * cll
             s = atan2(ss, cs)
@@ -429,7 +522,11 @@ class LatLon(LatLonEllipsoidalBase):
             if abs(ll - ll_) < self._epsilon:
                 break
         else:
+            _count('Vincenty.inverse.errors')
+            _histogram('Vincenty.inverse', 0)
             raise VincentyError('no convergence %r to %r' % (self, other))
+        _count('Vincenty.inverse.iterations', i)
+        _histogram('Vincenty.inverse', i)
 
         if c2a:  # e22 == (a / b) ** 2 - 1
             A, B = _p2(c2a, E.e22)
@@ -448,6 +545,35 @@ class LatLon(LatLonEllipsoidalBase):
         return d
 
 
+_TOL_ANDOYER = 2.0  #: (INTERNAL) Andoyer-Lambert relative error bound, times f**2.
+_TOL_HSIN    = 1.7  #: (INTERNAL) Haversine relative error bound, times f.
+_85 = radians(85)   #: (INTERNAL) Andoyer-Lambert limit, half of 170 degrees.
+
+
+def _andoyer(E, a1, a2, db):
+    '''(INTERNAL) Andoyer-Lambert distance or None if near-antipodal.
+    '''
+    F, G, L = (a1 + a2) * 0.5, (a1 - a2) * 0.5, db * 0.5
+    sF, cF = sin(F), cos(F)
+    sG, cG = sin(G), cos(G)
+    sL, cL = sin(L), cos(L)
+
+    cF2, sF2 = cF * cF, sF * sF
+    cG2, sG2 = cG * cG, sG * sG
+    cL2, sL2 = cL * cL, sL * sL
+    S = sG2 * cL2 + cF2 * sL2
+    C = cG2 * cL2 + sF2 * sL2
+    if not S:  # coincident
+        return 0.0
+    w = atan2(sqrt(S), sqrt(C))  # half the angular distance
+    if w > _85:  # near-antipodal
+        return None
+    R = sqrt(S * C) / w
+    H1 = (R * 3 - 1) / (C * 2)
+    H2 = (R * 3 + 1) / (S * 2)
+    return w * 2 * E.a * (1 + E.f * (H1 * sF2 * cG2 - H2 * cF2 * sG2))
+
+
 def _p2(c2a, ab2):
     '''(INTERNAL) Computes A, B polynomials.
     '''
@@ -0,0 +1,179 @@
+
+# -*- coding: utf-8 -*-
+
+'''Optional instrumentation of some geodesy operations, counting
+calls, events and accumulating the wall time spent per operation.
+
+Instrumentation is disabled by default.  Once enabled by function
+L{instrumented}, calls of the instrumented Vincenty, UTM, MGRS, OSGR,
+datum conversion and simplify functions and methods are counted and
+timed.  Counts like Vincenty iterations and errors are accumulated
+in additional entries.  Use L{instrumentSnapshot} to get and
+L{instrumentReset} to clear the results.
+
+The number of iterations used by each Vincenty direct and inverse
+call is also recorded in a histogram, see L{instrumentHistograms},
+to help trade accuracy for speed by tuning the C{LatLon.epsilon}
+and C{LatLon.iterations} settings of module L{ellipsoidalVincenty}.
+
+When disabled, each instrumented call costs only an additional
+function call and a test.
+
+@newfield example: Example, Examples
+'''
+
+from functools import wraps
+from timeit import default_timer as _timer
+
+# all public contants, classes and functions
+__all__ = ('instrumented', 'instrumentHistograms',  # functions
+           'instrumentReset', 'instrumentSnapshot')
+__version__ = '17.05.16'
+
+_enabled = False  #: (INTERNAL) Instrumentation on or off (bool).
+_hists   = {}     #: (INTERNAL) Histograms, by name: [failed, 1, 2, ...].
+_stats   = {}     #: (INTERNAL) Results, by name: [calls, count, secs].
+
+
+def _add(name, n, secs):
+    '''(INTERNAL) Accumulate a call or event.
+    '''
+    try:
+        s = _stats[name]
+    except KeyError:
+        _stats[name] = s = [0, 0, 0.0]
+    s[0] += 1
+    s[1] += n
+    s[2] += secs
+
+
+def _count(name, n=1):
+    '''(INTERNAL) Count an event and n items, if enabled.
+    '''
+    if _enabled:
+        _add(name, n, 0.0)
+
+
+def _histogram(name, i):
+    '''(INTERNAL) Count value i, 1 or more or 0 for failures
+       in a histogram, if enabled.
+    '''
+    if _enabled:
+        try:
+            h = _hists[name]
+        except KeyError:
+            _hists[name] = h = [0]
+        n = i - len(h) + 1
+        if n > 0:
+            h.extend([0] * n)
+        h[i] += 1
+
+
+def _timed(name):
+    '''(INTERNAL) Decorator to count the calls of and the
+       wall time spent in a function or method, if enabled.
+    '''
+    def _decorator(func):
+
+        @wraps(func)
+        def _wrapper(*args, **kwds):
+            if not _enabled:
+                return func(*args, **kwds)
+            t = _timer()
+            try:
+                return func(*args, **kwds)
+            finally:
+                _add(name, 1, _timer() - t)
+
+        return _wrapper
+
+    return _decorator
+
+
+def instrumented(enable=None):
+    '''Gets and optionally enables or disables instrumentation.
+
+       @keyword enable: New instrumentation setting (bool) or None
+                        to leave the current setting unchanged.
+
+       @return: Previous instrumentation setting (bool).
+
+       @example:
+
+       >>> e = instrumented(True)
+       >>> ...
+       >>> s = instrumentSnapshot()
+       >>> _ = instrumented(e)  # restore
+    '''
+    global _enabled
+    e = _enabled
+    if enable is not None:
+        _enabled = bool(enable)
+    return e
+
+
+def instrumentHistograms():
+    '''Gets a copy of the current instrumentation histograms.
+
+       @return: Histogram for each instrumented operation by name
+                (dict).  Each histogram is a list of the number of
+                calls which completed in 1, 2, 3, ... iterations at
+                index 1, 2, 3, ... and those which failed to converge
+                at index 0.
+
+       @example:
+
+       >>> instrumentHistograms()
+       {'Vincenty.inverse': [0, 0, 1, 25, 3, 0, 1]}
+    '''
+    return dict((n, list(h)) for n, h in _hists.items())
+
+
+def instrumentReset():
+    '''Clears all instrumentation results and histograms.
+
+       @return: Snapshot of the results before clearing (dict).
+    '''
+    s = instrumentSnapshot()
+    _hists.clear()
+    _stats.clear()
+    return s
+
+
+def instrumentSnapshot():
+    '''Gets a copy of the current instrumentation results.
+
+       @return: 3-Tuple (calls, count, secs) for each instrumented
+                operation by name (dict), with the number of calls
+                or events, the number of items counted, like Vincenty
+                iterations and the total wall time in seconds.
+
+       @example:
+
+       >>> instrumentSnapshot()
+       {'Vincenty.inverse': (1, 1, 5.2e-05),
+        'Vincenty.inverse.iterations': (1, 4, 0.0)}
+    '''
+    return dict((n, tuple(s)) for n, s in _stats.items())
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
@@ -0,0 +1,159 @@
+
+# -*- coding: utf-8 -*-
+
+'''(INTERNAL) The names lifted from the sub-modules into the
+L{pygeodesy} package, each imported lazily, on demand.
+
+Table C{_lazy_modules} is generated from the C{__all__} of the
+sub-modules, do not edit it.  Instead, edit C{_lifted} or a
+sub-module's C{__all__} and regenerate the table with
+
+C{python -m pygeodesy.lazily}
+'''
+
+# all public contants, classes and functions
+__all__ = ()
+__version__ = '17.05.16'
+
+# keep ellipsoidal and spherical modules as modules, but lift
+# only the names listed for those and all names in __all__ of
+# the other sub-modules, listed as None ... (see also David
+# Beazley's <http://dabeaz.com/modulepackage/index.html>)
+_lifted = (('ellipsoidalNvector', ()),
+           ('ellipsoidalVincenty', ('VincentyError',)),
+           ('sphericalKernels', ()),
+           ('sphericalNvector', ()),
+           ('sphericalTrigonometry', ()),
+           ('geohash', ('Geohash',)),
+           ('nvector', ()),
+           ('nvectorKernels', ()),
+           ('vector3d', ()),
+           ('bases', ('isclockwise',)),
+           ('datum', None),
+           ('dms', None),
+           ('instrument', None),
+           ('lcc', None),
+           ('mgrs', None),
+           ('osgr', None),
+           ('simplify', None),
+           ('utils', None),
+           ('utm', None))
+
+# generated by python -m pygeodesy.lazily, do not edit
+_lazy_modules = (('ellipsoidalNvector', ()),
+                 ('ellipsoidalVincenty', ('VincentyError',)),
+                 ('sphericalKernels', ()),
+                 ('sphericalNvector', ()),
+                 ('sphericalTrigonometry', ()),
+                 ('geohash', ('Geohash',)),
+                 ('nvector', ()),
+                 ('nvectorKernels', ()),
+                 ('vector3d', ()),
+                 ('bases', ('isclockwise',)),
+                 ('datum', ('R_KM', 'R_M', 'R_NM', 'R_SM', 'Datum',
+                            'Ellipsoid', 'Transform', 'Datums',
+                            'Ellipsoids', 'Transforms')),
+                 ('dms', ('F_D', 'F_DM', 'F_DMS', 'F_RAD', 'S_DEG',
+                          'S_MIN', 'S_SEC', 'S_SEP', 'bearingDMS',
+                          'bearingDMSs', 'compassDMS', 'compassPoint',
+                          'compassPoints', 'latDMS', 'latDMSs',
+                          'lonDMS', 'lonDMSs', 'normDMS', 'parseDMS',
+                          'parseDMSs', 'parse3llh', 'precision',
+                          'toDMS', 'toDMSs')),
+                 ('instrument', ('instrumented', 'instrumentHistograms',
+                                 'instrumentReset', 'instrumentSnapshot')),
+                 ('lcc', ('Conic', 'Conics', 'Lcc', 'latLonsToLccs',
+                          'lccsToLatLons', 'toLcc')),
+                 ('mgrs', ('Mgrs', 'decodeMGRS', 'encodeMGRS',
+                           'parseMGRS', 'toMgrs')),
+                 ('osgr', ('Osgr', 'latLonsToOsgrs', 'osgrsToLatLons',
+                           'parseOSGR', 'toOsgr')),
+                 ('simplify', ('simplify1', 'simplify2', 'simplifyRDP',
+                               'simplifyRDPm', 'simplifyVW',
+                               'simplifyVWm')),
+                 ('utils', ('EPS', 'EPS1', 'EPS2', 'PI', 'PI2', 'PI_2',
+                            'R_M', 'cbrt', 'cbrt2', 'degrees',
+                            'degrees90', 'degrees180', 'degrees360',
+                            'false2f', 'favg', 'fdot', 'fdot3',
+                            'fprecise', 'fStr', 'fsum', 'ft2m', 'halfs',
+                            'hsin', 'hsin3', 'hypot1', 'hypot3',
+                            'isint', 'isscalar', 'len2', 'm2ft', 'm2km',
+                            'm2NM', 'm2SM', 'map1', 'map2', 'radians',
+                            'radiansPI', 'radiansPI2', 'radiansPI_2',
+                            'tanPI_2_2', 'wrap90', 'wrap180', 'wrap360',
+                            'wrapPI', 'wrapPI2', 'wrapPI_2')),
+                 ('utm', ('Utm', 'parseUTM', 'toUtm')))
+# end generated
+
+
+def _source(table):
+    '''(INTERNAL) Format a C{_lazy_modules} table as source.
+
+       @param table: The table (2-tuples (module, names)).
+
+       @return: The table source (string).
+    '''
+    from textwrap import fill
+
+    i = ' ' * len('_lazy_modules = ((')
+    t = []
+    for m, ns in table:
+        if ns:
+            ns = ', '.join(repr(n) for n in ns) + (',' if len(ns) == 1 else '')
+            ns = fill(ns, width=72, initial_indent=i + ' ' * len(repr(m) + ', ('),
+                                    subsequent_indent=i + ' ' * len(repr(m) + ', ('),
+                                    break_long_words=False, break_on_hyphens=False)
+            ns = '(%s)' % (ns.lstrip(),)
+        else:
+            ns = '()'
+        t.append('(%r, %s)' % (m, ns))
+    return '_lazy_modules = (%s)' % ((',\n' + i[:-1]).join(t),)
+
+
+def _table():
+    '''(INTERNAL) Generate the C{_lazy_modules} table from the
+       C{__all__} of each sub-module lifted entirely.
+
+       @return: The table (2-tuples (module, names)).
+    '''
+    from importlib import import_module
+
+    return tuple((m, tuple(import_module('pygeodesy.' + m).__all__)
+                     if ns is None else ns) for m, ns in _lifted)
+
+
+if __name__ == '__main__':  # regenerate _lazy_modules
+
+    import re
+
+    f = __file__.replace('.pyc', '.py')
+    with open(f) as t:
+        t = t.read()
+    s = _source(_table())
+    t = re.sub('(?ms)^_lazy_modules = .*?\n(?=# end generated)',
+               lambda _: s + '\n', t, count=1)
+    with open(f, 'w') as w:
+        w.write(t)
+
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
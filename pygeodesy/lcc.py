@@ -16,14 +16,17 @@ U{http://mathworld.wolfram.com/LambertConformalConicProjection.html}.
 from .ellipsoidalBase import LatLonEllipsoidalBase as _LL
 from .datum import _Based, Datums, _Enum
 from .utils import EPS, PI_2, \
-                  degrees90, degrees180, false2f, fStr, radians
+                  degrees90, degrees180, false2f, fStr, len2, radians
 
 from math import atan, copysign, cos, hypot, log, sin, sqrt, tan
 
 # all public constants, classes and functions
 __all__ = ('Conic', 'Conics', 'Lcc',
-           'toLcc')  # functions
-__version__ = '17.05.06'
+           'latLonsToLccs', 'lccsToLatLons', 'toLcc')  # functions
+__version__ = '17.05.16'
+
+_TOL   = 1e-9  #: (INTERNAL) Latitude convergence (radians).
+_TRIPS = 32    #: (INTERNAL) Max latitude iterations (int).
 
 
 Conics = _Enum('Conics')  #: Registered conics (L{_Enum}).
@@ -315,16 +318,16 @@ class Conic(_Based):
         return PI_2 - 2 * atan(t_x)  # XXX + self._lat0
 
 
-Conics._assert(  # <http://spatialreference.org/ref/sr-org/...>
+Conics._lazy(  # <http://spatialreference.org/ref/sr-org/...>
 #   AsLb   = Conic(_LL(-14.2666667, 170, datum=Datums.NAD27), 0, 0, E0=500000, N0=0, name='AsLb', auth='EPSG:2155'),  # American Samoa ... SP=1 !
-    Be08Lb = Conic(_LL(50.7978150, 4.359215833, datum=Datums.GRS80), 49.833333, 51.166667, E0=649328.0, N0=665262.0, name='Be08Lb', auth='EPSG:9802'),  # Belgium
-    Be72Lb = Conic(_LL(90, 4.3674867, datum=Datums.NAD83), 49.8333339, 51.1666672, E0=150000.013, N0=5400088.438, name='Be72Lb', auth='EPSG:31370'),  # Belgium
-    Fr93Lb = Conic(_LL(46.5, 3, datum=Datums.WGS84), 49, 44, E0=700000, N0=6600000, name='Fr93Lb', auth='EPSG:2154'),  # RFG93, France
-    MaNLb  = Conic(_LL(33.3, -5.4, datum=Datums.NTF), 31.73, 34.87, E0=500000, N0=300000, name='MaNLb'),  # Marocco
-    MxLb   = Conic(_LL(12, -102, datum=Datums.WGS84), 17.5, 29.5, E0=2500000, N0=0, name='MxLb', auth='EPSG:2155'),  # Mexico
-    PyT_Lb = Conic(_LL(46.8, 2.33722917, datum=Datums.NTF), 45.89893890000052, 47.69601440000037, E0=600000, N0=200000, name='PyT_Lb', auth='Test'),  # France?
-    USA_Lb = Conic(_LL(23, -96, datum=Datums.WGS84), 33, 45, E0=0, N0=0, name='USA_Lb'),  # Conterminous, contiguous USA?
-    WRF_Lb = Conic(_LL(40, -97, datum=Datums.WGS84), 33, 45, E0=0, N0=0, name='WRF_Lb', auth='EPSG:4326')  # World
+    Be08Lb = lambda: Conic(_LL(50.7978150, 4.359215833, datum=Datums.GRS80), 49.833333, 51.166667, E0=649328.0, N0=665262.0, name='Be08Lb', auth='EPSG:9802'),  # Belgium
+    Be72Lb = lambda: Conic(_LL(90, 4.3674867, datum=Datums.NAD83), 49.8333339, 51.1666672, E0=150000.013, N0=5400088.438, name='Be72Lb', auth='EPSG:31370'),  # Belgium
+    Fr93Lb = lambda: Conic(_LL(46.5, 3, datum=Datums.WGS84), 49, 44, E0=700000, N0=6600000, name='Fr93Lb', auth='EPSG:2154'),  # RFG93, France
+    MaNLb  = lambda: Conic(_LL(33.3, -5.4, datum=Datums.NTF), 31.73, 34.87, E0=500000, N0=300000, name='MaNLb'),  # Marocco
+    MxLb   = lambda: Conic(_LL(12, -102, datum=Datums.WGS84), 17.5, 29.5, E0=2500000, N0=0, name='MxLb', auth='EPSG:2155'),  # Mexico
+    PyT_Lb = lambda: Conic(_LL(46.8, 2.33722917, datum=Datums.NTF), 45.89893890000052, 47.69601440000037, E0=600000, N0=200000, name='PyT_Lb', auth='Test'),  # France?
+    USA_Lb = lambda: Conic(_LL(23, -96, datum=Datums.WGS84), 33, 45, E0=0, N0=0, name='USA_Lb'),  # Conterminous, contiguous USA?
+    WRF_Lb = lambda: Conic(_LL(40, -97, datum=Datums.WGS84), 33, 45, E0=0, N0=0, name='WRF_Lb', auth='EPSG:4326')  # World
 )
 
 
@@ -336,13 +339,14 @@ class Lcc(_Based):
     _northing = 0  #: (INTERNAL) Northing (float).
     _conic = None  #: (INTERNAL) Lamber projection (L{Conic}).
 
-    def __init__(self, e, n, h=0, conic=Conics.WRF_Lb):
+    def __init__(self, e, n, h=0, conic=None):
         '''New L{Lcc} position.
 
            @param e: Easting in meter (scalar).
            @param n: Northing in meter (scalar).
            @keyword h: Height in meter (scalar).
-           @keyword conic: The conic projection (L{Conic}).
+           @keyword conic: The conic projection (L{Conic}),
+                           default L{Conics}.WRF_Lb.
 
            @return: The Lambert location (L{Lcc}).
 
@@ -354,7 +358,9 @@ class Lcc(_Based):
 
            >>> lb = Lcc(448251, 5411932.0001)
         '''
-        if not isinstance(conic, Conic):
+        if conic is None:
+            conic = Conics.WRF_Lb
+        elif not isinstance(conic, Conic):
             raise TypeError('%s not Conic: %r' % ('conic', conic))
         self._conic = conic
         self._easting  = false2f(e, 'easting',  false=conic.E0 > 0)
@@ -415,7 +421,7 @@ class Lcc(_Based):
         x = c._xdef(t_)  # XXX c._lon0
         while True:
             p, x = x, c._xdef(t_ * c._pdef(x))
-            if abs(x - p) < 1e-9:  # XXX EPS too small?
+            if abs(x - p) < _TOL:  # XXX EPS too small?
                 break
         y = (atan(e / n) + c._opt3) * c._n_ + c._lon0
 
@@ -464,23 +470,25 @@ class Lcc(_Based):
         return fmt % (sep.join('%s:%s' % t for t in zip(k, t)),)
 
 
-def toLcc(latlon, conic=Conics.WRF_Lb, height=None, Lcc=Lcc):
+def toLcc(latlon, conic=None, height=None, Lcc=Lcc):
     '''Converts an (ellipsoidal) geodetic point to a Lambert location.
 
        @param latlon: Ellipsoidal point (I{LatLon}).
-       @keyword conic: Lambert projection to use (L{Conic}).
+       @keyword conic: Lambert projection to use (L{Conic}),
+                       default L{Conics}.WRF_Lb.
        @keyword height: Optional height for the point, overriding
                         the default height (meter).
        @keyword Lcc: Lcc class for the Lambert location (L{Lcc}).
 
        @return: The Lambert location (L{Lcc}).
 
-       @raise TypeError: If latlon is not ellipsoidal.
+       @raise TypeError: If latlon is not ellipsoidal or conic
+                         is not L{Conic}.
     '''
     if not isinstance(latlon, _LL):
         raise TypeError('%s not %s: %r' % ('latlon', 'ellipsoidal', latlon))
 
-    c = conic.toDatum(latlon.datum)
+    c = _conic2(conic, latlon.datum)
 
     lat, lon = latlon.to2ab()
     r = c._rdef(c._tdef(lat))
@@ -491,6 +499,131 @@ def toLcc(latlon, conic=Conics.WRF_Lb, height=None, Lcc=Lcc):
                c._N0 + c._r0 - r * cos(t), h=h, conic=c)
 
 
+def _conic2(conic, datum):
+    '''(INTERNAL) Get the conic, default L{Conics}.WRF_Lb,
+       for a datum, once.
+    '''
+    if conic is None:
+        conic = Conics.WRF_Lb
+    elif not isinstance(conic, Conic):
+        raise TypeError('%s not Conic: %r' % ('conic', conic))
+    return conic.toDatum(datum) if datum else conic
+
+
+def latLonsToLccs(lats, lons, conic=None, datum=None):
+    '''Converts many lat-/longitudes to Lambert east- and northings.
+
+       Like L{toLcc} for each lat-/longitude, but with the conic
+       constants hoisted and without any intermediate I{LatLon}
+       or L{Lcc} instances.
+
+       @param lats: Latitudes (degrees).
+       @param lons: Longitudes (degrees).
+       @keyword conic: Lambert projection to use (L{Conic}),
+                       default L{Conics}.WRF_Lb.
+       @keyword datum: Datum of the lat-/longitudes, otherwise
+                       the conic's datum (L{Datum}).
+
+       @return: List of 2-tuples (easting, northing) in (meter).
+
+       @raise TypeError: If conic is not L{Conic} or datum is
+                         not ellipsoidal.
+
+       @raise ValueError: Unequal number of lats and lons.
+
+       @example:
+
+       >>> t = latLonsToLccs((46.5,), (3,), conic=Conics.Fr93Lb)  # [(700000.0, 6600000.0)]
+    '''
+    n, lats = len2(lats)
+    m, lons = len2(lons)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+
+    c = _conic2(conic, datum)
+    aF, e, n, r0 = c._aF, c._e, c._n, c._r0
+    E0, N0, e_2 = c._E0, c._N0 + r0, e / 2
+    b0, b3 = c._lon0, c._opt3
+
+    r = []
+    for a, b in zip(lats, lons):
+        a = radians(a)
+        s = e * sin(a)
+        t = tan((PI_2 - a) / 2) / pow((1 - s) / (1 + s), e_2)
+        t = aF * pow(t, n) if t > 0 else 0  # max(0, ...)
+        b = n * (radians(b) - b0) - b3
+        r.append((E0 + t * sin(b),
+                  N0 - t * cos(b)))
+    return r
+
+
+def lccsToLatLons(eastings, northings, conic=None, datum=None,
+                                       trips=None):
+    '''Converts many Lambert east- and northings to lat-/longitudes.
+
+       Like L{Lcc.toLatLon} for each easting and northing, but with
+       the conic constants hoisted and without any intermediate
+       L{Lcc} or I{LatLon} instances.
+
+       @param eastings: Eastings (meter).
+       @param northings: Northings (meter).
+       @keyword conic: Lambert projection to use (L{Conic}),
+                       default L{Conics}.WRF_Lb.
+       @keyword datum: Datum to use, otherwise the conic's
+                       datum (L{Datum}).
+       @keyword trips: Fixed number of latitude iterations, 3 or 4
+                       is plenty, otherwise iterate until converged
+                       but not more than 32 times (int).
+
+       @return: List of 2-tuples (lat, lon) in (degrees90, degrees180).
+
+       @raise TypeError: If conic is not L{Conic} or datum is
+                         not ellipsoidal.
+
+       @raise ValueError: Unequal number of eastings and northings
+                          or invalid trips.
+
+       @example:
+
+       >>> t = lccsToLatLons((700000,), (6600000,), conic=Conics.Fr93Lb)  # [(46.5, 3.0)]
+    '''
+    n, eastings = len2(eastings)
+    m, northings = len2(northings)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+
+    if trips is None:
+        tol, trips = _TOL, _TRIPS
+    else:
+        try:
+            tol, trips = -1, int(trips)
+            if trips < 1:
+                raise ValueError
+        except (TypeError, ValueError):
+            raise ValueError('%s invalid: %r' % ('trips', trips))
+
+    c = _conic2(conic, datum)
+    aF, e, n, n_ = c._aF, c._e, c._n, c._n_
+    E0, N0, e_2 = c._E0, c._N0 + c._r0, e / 2
+    b0, b3 = c._lon0, c._opt3
+    r_ = range(trips)
+
+    r = []
+    for x, y in zip(eastings, northings):
+        x -= E0
+        y = N0 - y
+
+        t = pow(copysign(hypot(x, y), n) / aF, n_)
+        a = PI_2 - 2 * atan(t)
+        for _ in r_:
+            s = e * sin(a)
+            p, a = a, PI_2 - 2 * atan(t * pow((1 - s) / (1 + s), e_2))
+            if abs(a - p) < tol:
+                break
+        r.append((degrees90(a), degrees180((atan(x / y) + b3) * n_ + b0)))
+    return r
+
+
 if __name__ == '__main__':
 
     # print all
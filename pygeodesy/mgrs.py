@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 '''Military Grid Reference System (MGRS/NATO) class L{Mgrs} and
-functions L{parseMGRS} and L{toMgrs}.
+functions L{parseMGRS} and L{toMgrs} and bulk functions L{decodeMGRS}
+and L{encodeMGRS}.
 
 Pure Python implementation of MGRS / UTM conversion functions using
 an ellipsoidal earth model.  Transcribed from JavaScript originals
@@ -27,29 +28,70 @@ and U{https://en.wikipedia.org/wiki/Military_grid_reference_system}.
 
 from .bases import Base
 from .datum import Datums
-from .utils import halfs
-from .utm   import toUtm, Utm, _toZBL
+from .instrument import _timed
+from .utils import halfs, len2
+from .utm   import Utm, _Bands, _toUtm7, _toZBL
 
-from math import log10
 import re  # PYCHOK warning locale.Error
 
 # all public contants, classes and functions
 __all__ = ('Mgrs',  # classes
+           'decodeMGRS', 'encodeMGRS',
            'parseMGRS', 'toMgrs')  # functions
-__version__ = '17.04.30'
+__version__ = '17.05.16'
 
 _100km  =  100e3  #: (INTERNAL) 100 km in meter.
 _2000km = 2000e3  #: (INTERNAL) 2,000 km in meter.
+_NAN    = float('nan')  #: (INTERNAL) Not-a-number (float).
 
 # 100 km grid square column (‘e’) letters repeat every third zone
 _Le100k = 'ABCDEFGH', 'JKLMNPQR', 'STUVWXYZ'  #: (INTERNAL) Grid E colums.
 # 100 km grid square row (‘n’) letters repeat every other zone
 _Ln100k = 'ABCDEFGHJKLMNPQRSTUV', 'FGHJKLMNPQRSTUVABCDE'  #: (INTERNAL) Grid N rows.
 
+# easting and northing offsets of the 100 km grid square letters (note,
+# +1 for eastings since those start at 166e3 due to 500 km false origin)
+_Le100k2m = tuple(dict((c, float(i + 1) * _100km) for i, c in enumerate(t))
+                  for t in _Le100k)  #: (INTERNAL) Grid E offsets (meter).
+_Ln100k2m = tuple(dict((c, float(i) * _100km) for i, c in enumerate(t))
+                  for t in _Ln100k)  #: (INTERNAL) Grid N offsets (meter).
+
 # split an MGRS string "12ABC1235..." into 3 parts
 _MGRSre = re.compile('(\d{1,2}[C-X]{1})([A-Z]{2})(\d+)', re.IGNORECASE)  #: (INTERNAL) Regex.
 _GZDre  = re.compile('(\d{1,2}[C-X]{1})', re.IGNORECASE)  #: (INTERNAL) Regex.
 
+_BandBases = {}  #: (INTERNAL) Band base northings and hemispheres, by ellipsoid.
+
+
+def _bandBases(E):
+    '''(INTERNAL) Gets the northing of the bottom of each band
+       and the hemisphere, built once for each ellipsoid.
+
+       @param E: The ellipsoid (L{Ellipsoid}).
+
+       @return: Dict of 2-tuples (northing, hemisphere) per band.
+    '''
+    k = E.a, E.f
+    t = _BandBases.get(k, None)
+    if t is None:
+        t = {}
+        for i, B in enumerate(_Bands[:-1]):  # excl. extended X
+            # northing of the band bottom, extended to
+            # include entirety of bottom-most 100 km square
+            n = _toUtm7((i << 3) - 80, 0, E, cs=False)[4]
+            t[B] = int(n / _100km) * _100km, ('S' if i < 10 else 'N')
+        _BandBases[k] = t
+    return t
+
+
+def _prec2wp(prec):
+    '''(INTERNAL) Returns the digit count and scale for a precision.
+    '''
+    w = prec // 2
+    if 1 > w or w > 5:
+        raise ValueError('%s invalid: %r' % ('prec', prec))
+    return w, (0, 1e-4, 1e-3, 1e-2, 1e-1, 1)[w]  # 10 ** (w - 5)
+
 
 class Mgrs(Base):
     '''Military Grid Reference System (MGRS/NATO) references,
@@ -89,8 +131,8 @@ class Mgrs(Base):
                 raise IndexError  # caught below
             self._en100k = en
             self._en100k2m()
-        except IndexError:
-            raise ValueError('%s invalid: %r' ('en100k', en100k))
+        except (IndexError, KeyError):
+            raise ValueError('%s invalid: %r' % ('en100k', en100k))
 
         self._easting, self._northing = float(easting), float(northing)
 
@@ -100,11 +142,9 @@ class Mgrs(Base):
     def _en100k2m(self):
         # check and convert grid letters to meter
         z = self._zone - 1
-        # get easting specified by e100k (note, +1 because
-        # eastings start at 166e3 due to 500 km false origin)
-        e = float(_Le100k[z % 3].index(self._en100k[0]) + 1) * _100km  # metres
-        # similarly, get northing specified by n100k
-        n = float(_Ln100k[z % 2].index(self._en100k[1])) * _100km  # metres
+        # get easting and northing specified by en100k
+        e = _Le100k2m[z % 3][self._en100k[0]]  # metres
+        n = _Ln100k2m[z % 2][self._en100k[1]]  # metres
         return e, n
 
     @property
@@ -170,10 +210,7 @@ class Mgrs(Base):
            >>> m = Mgrs(31, 'DQ', 48251, 11932, band='U')
            >>> m.toStr()  # '31U DQ 48251 11932'
         '''
-        w = prec // 2
-        if 1 > w or w > 5:
-            raise ValueError('%s invalid: %r' % ('prec', prec))
-        p = (0, 1e-4, 1e-3, 1e-2, 1e-1, 1)[w]  # 10 ** (5 - w)
+        w, p = _prec2wp(prec)
 
         t = ['%02d%s' % (self._zone, self._band), self._en100k,
              '%0*d' % (w, int(self._easting * p)),
@@ -192,6 +229,7 @@ class Mgrs(Base):
         t = self.toStr(prec=prec, sep=' ').split()
         return fmt % (sep.join('%s:%s' % t for t in zip('ZGEN', t)),)
 
+    @_timed('Mgrs.toUtm')
     def toUtm(self):
         '''Converts this MGRS grid reference to a UTM coordinate.
 
@@ -202,10 +240,8 @@ class Mgrs(Base):
            >>> m = Mgrs('31U', 'DQ', 448251, 11932)
            >>> u = m.toUtm()  # 31 N 448251 5411932
         '''
-        # get northing of the band bottom, extended to
-        # include entirety of bottom-most 100 km square
-        n = toUtm(self._bandLat, 0, datum=self._datum).northing
-        nb = int(n / _100km) * _100km
+        # get northing of the band bottom and hemisphere
+        nb, h = _bandBases(self._datum.ellipsoid)[self._band]
 
         e, n = self._en100k2m()
         # 100 km grid square row letters repeat every 2,000 km north;
@@ -215,8 +251,6 @@ class Mgrs(Base):
         while n < nb:
             n += _2000km
 
-        h = 'S' if self._bandLat < 0 else 'N'  # if self._band < 'N'
-
         return Utm(self._zone, h, e, n, band=self._band, datum=self._datum)
 
     @property
@@ -226,6 +260,119 @@ class Mgrs(Base):
         return self._zone
 
 
+def decodeMGRS(strMGRSs, datum=Datums.WGS84):
+    '''Decodes many MGRS grid references to UTM coordinates.
+
+       Like L{parseMGRS} followed by L{Mgrs.toUtm} for each grid
+       reference, but without regular expressions and without any
+       intermediate L{Mgrs} or L{Utm} instances.  Invalid grid
+       references are flagged in the returned mask instead of
+       raising an exception.
+
+       @param strMGRSs: MGRS grid references (strings).
+       @keyword datum: The datum to use (L{Datum}).
+
+       @return: 2-Tuple (utms, mask) of two lists with a 5-tuple
+                (zone, hemisphere, easting, northing, band), in the
+                order of the L{Utm} arguments, respectively the invalid
+                flag (bool) for each grid reference.  Invalid grid
+                references decode to (0, '', NAN, NAN, '').
+
+       @example:
+
+       >>> t, m = decodeMGRS(('31U DQ 48251 11932', '31UDQ4825111932', 'x'))
+       >>> t[0]  # (31, 'N', 448251.0, 5411932.0, 'U')
+       >>> u = Utm(*t[1])  # 31 N 448251 5411932
+       >>> m  # [False, False, True]
+    '''
+    def _s2m(g):  # e or n digits to meter
+        n = len(g)
+        if not (0 < n < 6 and g.isdigit()):
+            raise ValueError
+        return float(int(g) * (100000, 10000, 1000, 100, 10, 1)[n])
+
+    Bs = _bandBases(datum.ellipsoid)
+
+    r, ms = [], []
+    for s in strMGRSs:
+        try:
+            t = s.replace(',', ' ').split()
+            if len(t) == 4:  # 01A BC 1234 12345
+                g, e, n = t[0] + t[1], t[2], t[3]
+            else:  # 01ABC1234512345, 01ABC 1234512345, ...
+                g = ''.join(t)
+                e = g[5:] if g[1].isdigit() else g[4:]
+                e, n = halfs(e)
+                g = g[:len(g) - 2 * len(e)]
+
+            i = len(g) - 3
+            z = int(g[:i])
+            if not (0 < i < 3 and 0 < z < 61):
+                raise ValueError
+            nb, h = Bs[g[i].upper()]
+            en = g[i+1:].upper()
+
+            z_ = z - 1
+            e = _s2m(e) + _Le100k2m[z_ % 3][en[0]]
+            n = _s2m(n) + _Ln100k2m[z_ % 2][en[1]]
+            while n < nb:  # 100 km grid square rows repeat every 2,000 km
+                n += _2000km
+
+        except (AttributeError, IndexError, KeyError, ValueError):
+            r.append((0, '', _NAN, _NAN, ''))
+            ms.append(True)
+            continue
+
+        r.append((z, h, e, n, g[i].upper()))
+        ms.append(False)
+    return r, ms
+
+
+def encodeMGRS(lats, lons, prec=10, datum=Datums.WGS84, sep=' '):
+    '''Encodes many lat-/longitudes to MGRS grid reference strings.
+
+       Like L{utm.toUtm}, L{toMgrs} and L{Mgrs.toStr} for each lat-/longitude
+       but without any intermediate L{Utm} or L{Mgrs} instances.
+
+       @param lats: Latitudes (degrees).
+       @param lons: Longitudes (degrees).
+       @keyword prec: Number of digits, 4:km, 10:m (int).
+       @keyword datum: The datum to use (L{Datum}).
+       @keyword sep: Separator to join (string).
+
+       @return: List of MGRS grid references (strings).
+
+       @raise ValueError: Unequal number of lats and lons, invalid
+                          prec or lat outside the valid UTM bands.
+
+       @example:
+
+       >>> t = encodeMGRS((48.8582,), (2.2945,))  # ['31U DQ 48251 11932']
+    '''
+    w, p = _prec2wp(prec)
+
+    n, lats = len2(lats)
+    m, lons = len2(lons)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+
+    E, r = datum.ellipsoid, []
+    for lat, lon in zip(lats, lons):
+        z, _, B, e, n, _, _ = _toUtm7(lat, lon, E, cs=False)
+        # truncate east-/northing to within 100 km grid square
+        e, x = divmod(e, _100km)
+        n, y = divmod(n, _100km)
+
+        z_ = z - 1  # see function toMgrs below
+        en = _Le100k[z_ % 3][int(e) - 1] + _Ln100k[z_ % 2][int(n) % 20]
+
+        r.append(sep.join(('%02d%s' % (z, B), en,
+                           '%0*d' % (w, int(x * p)),
+                           '%0*d' % (w, int(y * p)))))
+    return r
+
+
+@_timed('parseMGRS')
 def parseMGRS(strMGRS, datum=Datums.WGS84):
     '''Parses a string representing a MGRS grid reference,
        consisting of zoneBand, grid, easting and northing.
@@ -252,10 +399,10 @@ def parseMGRS(strMGRS, datum=Datums.WGS84):
 
     def _s2m(g):  # e or n string to meter
         f = float(g)
-        if f > 0:
-            x = int(log10(f))
-            if 0 <= x < 4:  # at least 5 digits
-                f *= (10000, 1000, 100, 10)[x]
+        if f > 0:  # count digits, incl. leading zeros
+            x = len(g.split('.')[0])
+            if 0 < x < 5:  # at least 5 digits
+                f *= (10000, 1000, 100, 10)[x - 1]
         return f
 
     m = tuple(strMGRS.strip().replace(',', ' ').split())
@@ -276,6 +423,7 @@ def parseMGRS(strMGRS, datum=Datums.WGS84):
     return Mgrs(m[0], m[1].upper(), e, n, datum=datum)
 
 
+@_timed('toMgrs')
 def toMgrs(utm, Mgrs=Mgrs):
     '''Converts a UTM coordinate to an MGRS grid reference.
 
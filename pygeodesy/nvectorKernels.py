@@ -0,0 +1,767 @@
+
+# -*- coding: utf-8 -*-
+
+'''Spherical n-vector functions L{nvectors}, L{latlons}, L{distances},
+L{crossTrackDistances}, L{alongTrackDistances}, L{nearestOns},
+L{intersections}, L{triangulates}, L{trilaterates} and
+L{multilaterates} operating on blocks of n-vectors.
+
+A block is a list of n-vectors, each a 3-tuple (x, y, z) of a unit
+vector normal to the earth's surface, see function L{nvectors}.  Each
+function applies the vector operations of the corresponding method of
+the I{sphericalNvector} L{LatLon} class to every n-vector of the given
+blocks, producing identical results but without creating any L{LatLon},
+L{Nvector} or intermediate vector instances.  Any block may be given
+as a single 3-tuple, repeated to the length of the other blocks.
+
+Like method L{Vector3d.dot}, the dot products honor the L{fprecise}
+setting.
+
+Functions L{intersections}, L{triangulates}, L{trilaterates} and
+L{multilaterates} solve many independent problems at once.  Instead of raising an exception
+or returning an arbitrary point, each flags any degenerate problem in
+the returned mask and sets its solution to (NAN, NAN).
+
+@newfield example: Example, Examples
+'''
+
+from .datum import R_M
+from .sphericalKernels import _columns
+from .utils import EPS, PI_2, degrees90, degrees180, fprecise, fsum, \
+                   hypot3, isscalar, len2
+
+from math import atan2, cos, hypot, radians, sin, sqrt
+
+# all public contants, classes and functions
+__all__ = ('alongTrackDistances',  # functions
+           'crossTrackDistances', 'distances',
+           'intersections', 'latlons', 'multilaterates',
+           'nearestOns', 'nvectors', 'triangulates', 'trilaterates')
+__version__ = '17.05.16'
+
+_NAN       = float('nan')  #: (INTERNAL) Not-a-number (float).
+_NorthPole = 0, 0, 1  #: (INTERNAL) As nvector.NorthPole (n-vector).
+
+
+def _blocks(*blocks):
+    '''(INTERNAL) Return blocks of equal length, repeating any
+       single n-vector to the length of the other blocks.
+
+       @raise ValueError: Unequal block lengths or all single.
+    '''
+    return _blocks2(*((b, False) for b in blocks))
+
+
+def _blocks2(*bcs):
+    '''(INTERNAL) Return blocks and columns of equal length, each
+       given as 2-tuple (block, False) or (column, True), repeating
+       any single n-vector respectively scalar to the length of the
+       other blocks and columns.
+
+       @raise ValueError: Unequal lengths or all single.
+    '''
+    n, bs = None, []
+    for b, c in bcs:
+        if (isscalar(b) if c else _single(b)):
+            b = (b,)
+        else:
+            m, b = len2(b)
+            if n is None:
+                n = m
+            elif m != n:
+                raise ValueError('unequal len: %s vs %s' % (n, m))
+        bs.append(b)
+    if n is None:
+        raise ValueError('%s invalid: %r' % ('blocks', tuple(b for b, _ in bcs)))
+    return n, [(b * n if len(b) == 1 and n != 1 else b) for b in bs]
+
+
+def _cross(a, b):
+    '''(INTERNAL) Cross product as L{Vector3d}.cross.
+    '''
+    ax, ay, az = a
+    bx, by, bz = b
+    return (ay * bz - az * by,
+            az * bx - ax * bz,
+            ax * by - ay * bx)
+
+
+def _dot(a, b, precise):
+    '''(INTERNAL) Dot product as L{Vector3d}.dot.
+    '''
+    if precise:
+        return fsum([a[0] * b[0], a[1] * b[1], a[2] * b[2]])
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _angle(a, b, precise, vSign=None):
+    '''(INTERNAL) Angle between vectors as L{Vector3d}.angleTo.
+    '''
+    x = _cross(a, b)
+    s = hypot3(*x)
+    # use vSign as reference to get sign of s
+    if vSign is not None and _dot(x, vSign, precise) < 0:
+        s = -s
+    return atan2(s, _dot(a, b, precise))
+
+
+def _bearings(ends):
+    '''(INTERNAL) Are ends bearings rather than n-vectors?
+    '''
+    if isscalar(ends):
+        return True
+    if isinstance(ends, tuple) and _single(ends):
+        return False  # single n-vector
+    for e in ends:
+        return isscalar(e)
+    return False
+
+
+def _crossed(gc1, gc2):
+    '''(INTERNAL) Intersection gc1 × gc2 of two great circles or
+       None if either is undefined or both coincide.
+    '''
+    i = _cross(gc1, gc2)
+    if hypot3(*i) > EPS * hypot3(*gc1) * hypot3(*gc2):
+        return i
+    return None
+
+
+def _gaussNewton2(p, nvs, ds, epsilon, iterations, precise):
+    '''(INTERNAL) Gauss-Newton iteration for L{multilaterates},
+       starting at n-vector p.
+
+       @return: 2-Tuple (n-vector, sum of squared residuals) or
+                None if singular or without convergence.
+    '''
+    if hypot3(*p) < EPS:
+        return None
+    p = _unit(p)
+    for _ in range(iterations):
+        _, e, n, (a, b, c), (x, y), k = _lsq(p, nvs, ds, precise)
+        d = a * c - b * b
+        if k < 3 or abs(d) < EPS:
+            return None  # singular
+        de = (c * x - b * y) / d
+        dn = (a * y - b * x) / d
+        p = _unit(_plus(p, _plus(_times(e, de), _times(n, dn))))
+        if hypot(de, dn) < epsilon:
+            rs = _lsq(p, nvs, ds, precise)[0]
+            return p, fsum(r * r for r in rs)
+    return None  # no convergence
+
+
+def _gcb(v, bearing):
+    '''(INTERNAL) Great circle as L{Nvector}.greatCircle.
+    '''
+    t = radians(bearing)
+
+    e = _cross(_NorthPole, v)  # easting
+    n = _cross(v, e)  # northing
+
+    e = _times(e, cos(t) / hypot3(*e))
+    n = _times(n, sin(t) / hypot3(*n))
+    return _minus(n, e)
+
+
+def _gct(v, bearing):
+    '''(INTERNAL) Great circle as in function L{triangulate}.
+    '''
+    t = radians(bearing)
+
+    de = _unit(_cross(_NorthPole, v))  # east vector @ v
+    dn = _cross(v, de)  # north vector @ v
+
+    d = _plus(_times(dn, cos(t)), _times(de, sin(t)))
+    return _cross(v, d)  # great circle point + bearing
+
+
+def _ll(v):
+    '''(INTERNAL) Lat- and longitude as L{Vector3d}.to2ll.
+    '''
+    x, y, z = v
+    return degrees90(atan2(z, hypot(x, y))), degrees180(atan2(y, x))
+
+
+def _lsq(p, nvs, ds, precise):
+    '''(INTERNAL) Range residuals and the normal equations for a
+       Gauss-Newton step in the tangent plane at n-vector p.
+
+       @return: 6-Tuple (residuals, east, north, JtJ, Jtr, m) with
+                residuals in radians, the east and north unit vectors
+                at p, the 2x2 matrix JtJ as 3-tuple (ee, en, nn), the
+                2-vector Jtr and the number of points m used.
+    '''
+    e = _cross(_NorthPole, p)
+    if hypot3(*e) < EPS:  # at a pole
+        e = _cross((1.0, 0, 0), p)
+    e = _unit(e)
+    n = _cross(p, e)
+
+    rs, ee, en, nn, er, nr = [], [], [], [], [], []
+    for v, d in zip(nvs, ds):
+        s = hypot3(*_cross(p, v))
+        r = d - atan2(s, _dot(p, v, precise))
+        rs.append(r)
+        if s > EPS:  # derivative of the angle from p to v
+            je = -_dot(v, e, precise) / s
+            jn = -_dot(v, n, precise) / s
+            ee.append(je * je)
+            en.append(je * jn)
+            nn.append(jn * jn)
+            er.append(je * r)
+            nr.append(jn * r)
+    return rs, e, n, (fsum(ee), fsum(en), fsum(nn)), \
+                     (fsum(er), fsum(nr)), len(ee)
+
+
+def _minus(a, b):
+    '''(INTERNAL) Difference as L{Vector3d}.minus.
+    '''
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def _nv(lat, lon):
+    '''(INTERNAL) N-vector as L{LatLon}.toNvector.
+    '''
+    a, b = radians(lat), radians(lon)
+    ca = cos(a)
+    return ca * cos(b), ca * sin(b), sin(a)
+
+
+def _plus(a, b):
+    '''(INTERNAL) Sum as L{Vector3d}.plus.
+    '''
+    return a[0] + b[0], a[1] + b[1], a[2] + b[2]
+
+
+def _single(v):
+    '''(INTERNAL) Is v a single n-vector, 3 scalars?
+    '''
+    return len(v) == 3 and isscalar(v[0])
+
+
+def _start(nvs, ds, precise):
+    '''(INTERNAL) Start for L{multilaterates}, trilaterated from
+       the first three points with chord distances, on the side
+       of their plane nearest to the earth's surface.
+
+       @return: Start point (not unit n-vector) or None.
+    '''
+    n1 = nvs[0]
+    cs = [sin(d * 0.5) * 2 for d in ds[:3]]  # chords
+    t = _trilaterate5(n1, cs[0], nvs[1], cs[1], nvs[2], cs[2], precise)
+    if t is None:
+        return None
+    X, Y, x, y, z2 = t
+    p = _plus(_plus(n1, _times(X, x)), _times(Y, y))
+    if z2 > 0:
+        z = _times(_cross(X, Y), sqrt(z2))
+        p, q = _plus(p, z), _minus(p, z)
+        if abs(hypot3(*q) - 1) < abs(hypot3(*p) - 1):
+            p = q
+    return p
+
+
+def _times(v, f):
+    '''(INTERNAL) Product as L{Vector3d}.times.
+    '''
+    return v[0] * f, v[1] * f, v[2] * f
+
+
+def _trilaterate5(n1, d1, n2, d2, n3, d3, precise):
+    '''(INTERNAL) Trilaterate as function L{trilaterate}.
+
+       @return: 5-Tuple (X, Y, x, y, z2) with unit vectors X and Y,
+                the x and y coordinates and the squared distance
+                z2 from the plane or None if the points coincide
+                or are colinear.
+    '''
+    # x,y coordinate system with origin at n1 and x axis n1->n2
+    n21 = _minus(n2, n1)
+    n31 = _minus(n3, n1)
+    X = _unit(n21)  # unit vector in x direction n1->n2
+    i = _dot(X, n31, precise)  # signed magnitude of x component of n1->n3
+    Y = _unit(_minus(n31, _times(X, i)))  # unit vector in y direction
+    d = hypot3(*n21)  # distance n1->n2
+    j = _dot(Y, n31, precise)  # signed magnitude of y component of n1->n3
+
+    d12 = d1 * d1
+    try:
+        x = (d12 - d2 * d2 + d * d) / (2 * d)
+        y = (d12 - d3 * d3 + i * i + j * j) / (2 * j) - x * i / j
+    except ZeroDivisionError:  # coincident or colinear points
+        return None
+    return X, Y, x, y, d12 - x * x - y * y
+
+
+def _unit(v):
+    '''(INTERNAL) Normalized as L{Vector3d}.unit, returning
+       a (near-)zero or unit vector v as-is.
+    '''
+    n = hypot3(*v)
+    if n > EPS and abs(n - 1) > EPS:
+        return _times(v, 1.0 / n)
+    return v
+
+
+def _within(n0, n1, n2, precise):
+    '''(INTERNAL) Point within the extent as L{LatLon}.isWithin.
+    '''
+    if _dot(n0, n1, precise) < 0 or _dot(n0, n2, precise) < 0:
+        return False  # different hemisphere
+    return _dot(_minus(n0, n1), _minus(n2, n1), precise) >= 0 and \
+           _dot(_minus(n0, n2), _minus(n1, n2), precise) >= 0
+
+
+def alongTrackDistances(nvs, starts, ends, radius=R_M):
+    '''Computes the (signed) distances from the start to the closest
+       point on the great circle paths each defined by a start and an
+       end point.
+
+       @param nvs: The points (n-vector[] or n-vector).
+       @param starts: Start points of the paths (n-vector[] or n-vector).
+       @param ends: End points of the paths (n-vector[] or n-vector).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: Distances along the great circle paths (float[],
+                positive if after the start toward the end point
+                of the path or negative if before the start point).
+
+       @raise ValueError: Unequal block lengths.
+
+       @example:
+
+       >>> s, e = nvectors((53.3206, 53.1887), (-1.7297, 0.1334))
+       >>> t = nvectors([53.2611], [-0.7972])
+       >>> d = alongTrackDistances(t, s, e)  # [62331.58]
+    '''
+    n, (ps, ss, es) = _blocks(nvs, starts, ends)
+    f = fprecise()
+    ds = []
+    for i in range(n):
+        s = ss[i]
+        gc = _cross(s, es[i])
+        a = _cross(_cross(gc, ps[i]), gc)  # along-track point gc × p × gc
+        ds.append(_angle(s, a, f, vSign=gc) * radius)
+    return ds
+
+
+def crossTrackDistances(nvs, starts, ends, radius=R_M):
+    '''Computes the (signed) distances from points to the great
+       circles each defined by a start and an end point.
+
+       @param nvs: The points (n-vector[] or n-vector).
+       @param starts: Start points of the paths (n-vector[] or n-vector).
+       @param ends: End points of the paths (n-vector[] or n-vector).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: Distances to the great circles (float[], negative if
+                to the left or positive if to the right of the path).
+
+       @raise ValueError: Unequal block lengths.
+
+       @example:
+
+       >>> s, e = nvectors((53.3206, 53.1887), (-1.7297, 0.1334))
+       >>> t = nvectors([53.2611], [-0.7972])
+       >>> d = crossTrackDistances(t, s, e)  # [-307.5]
+    '''
+    n, (ps, ss, es) = _blocks(nvs, starts, ends)
+    f = fprecise()
+    return [(_angle(_cross(ss[i], es[i]), ps[i], f) - PI_2) * radius
+            for i in range(n)]
+
+
+def distances(nvs1, nvs2, radius=R_M):
+    '''Computes the distances between pairs of points.
+
+       @param nvs1: The start points (n-vector[] or n-vector).
+       @param nvs2: The end points (n-vector[] or n-vector).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: Distances (float[], in the same units as radius).
+
+       @raise ValueError: Unequal block lengths.
+
+       @example:
+
+       >>> p, q = nvectors((52.205, 48.857), (0.119, 2.351))
+       >>> d = distances(p, [q])  # [404279.7]
+    '''
+    n, (n1, n2) = _blocks(nvs1, nvs2)
+    f = fprecise()
+    return [_angle(n1[i], n2[i], f) * radius for i in range(n)]
+
+
+def intersections(starts1, ends1, starts2, ends2):
+    '''Locates the intersections of pairs of paths each defined by
+       two points or by a start point and an initial bearing.
+
+       Like function L{intersection} for each pair of paths, except
+       that a pair without unique intersection is flagged in the
+       returned mask instead of returning an arbitrary point.
+
+       @param starts1: Start points of the first paths (n-vector[]
+                       or n-vector).
+       @param ends1: End points of the first paths (n-vector[] or
+                     n-vector) or the initial bearings at the first
+                     start points (compass degrees[] or degrees).
+       @param starts2: Start points of the second paths (n-vector[]
+                       or n-vector).
+       @param ends2: End points of the second paths (n-vector[] or
+                     n-vector) or the initial bearings at the second
+                     start points (compass degrees[] or degrees).
+
+       @return: 2-Tuple (latlons, mask) of two lists with the
+                intersection (2-tuple (lat, lon) in (degrees90,
+                degrees180)) respectively the invalid flag (bool)
+                for each pair of paths.  The intersection of an
+                invalid pair is (NAN, NAN).
+
+       @raise ValueError: Unequal block or column lengths.
+
+       @note: A 3-tuple of scalars is a single n-vector, give
+              bearings as a list.
+
+       @example:
+
+       >>> s = nvectors((51.8853, 49.0034), (0.2545, 2.5735))
+       >>> t = intersections([s[0]], [108.55], s[1], 32.44)
+       >>> # ([(50.9076, 4.5086)], [False])
+    '''
+    b1, b2 = _bearings(ends1), _bearings(ends2)
+    n, (S1, E1, S2, E2) = _blocks2((starts1, False), (ends1, b1),
+                                   (starts2, False), (ends2, b2))
+
+    f = fprecise()
+    ll, ms = [], []
+    for k in range(n):
+        s1, s2 = S1[k], S2[k]
+        try:
+            if b1:
+                e1, gc1 = None, _gcb(s1, E1[k])
+            else:
+                e1 = E1[k]
+                gc1 = _cross(s1, e1)
+            if b2:
+                e2, gc2 = None, _gcb(s2, E2[k])
+            else:
+                e2 = E2[k]
+                gc2 = _cross(s2, e2)
+        except ZeroDivisionError:  # bearing at a pole
+            i1 = None
+        else:
+            i1 = _crossed(gc1, gc2)
+        if i1 is None:
+            ll.append((_NAN, _NAN))
+            ms.append(True)
+            continue
+
+        # as function intersection, select one of
+        # the two (antipodal) candidate intersections
+        i2 = _cross(gc2, gc1)
+        if e1 and e2:  # endpoint+endpoint
+            d = _dot(tuple(fsum(t) for t in zip(s1, s2, e1, e2)), i1, f)
+        elif e1 and not e2:  # endpoint+bearing
+            d = _dot(_cross(gc2, s2), i1, f)
+        elif e2 and not e1:  # bearing+endpoint
+            d = _dot(_cross(gc1, s1), i1, f)
+        else:  # bearing+bearing
+            d1 = _dot(_cross(gc1, s1), i1, f)
+            d2 = _dot(_cross(gc2, s2), i1, f)
+            if d1 > 0 and d2 > 0:
+                d = 1  # both point to i1
+            elif d1 < 0 and d2 < 0:
+                d = -1  # both point to i2
+            else:  # take opposite intersection from mid-point
+                d = -_dot(_plus(s1, s2), i1, f)
+
+        ll.append(_ll(i1 if d > 0 else i2))
+        ms.append(False)
+    return ll, ms
+
+
+def latlons(nvs):
+    '''Converts n-vectors to (geodetic) lat- and longitudes.
+
+       @param nvs: The n-vectors (n-vector[]).
+
+       @return: Lat- and longitudes (2-tuple (lat, lon)[] in
+                (degrees90, degrees180)).
+
+       @example:
+
+       >>> t = latlons([(0.5, 0.5, 0.7071)])  # [(44.9997, 45.0)]
+    '''
+    return [_ll(v) for v in nvs]
+
+
+def multilaterates(nvss, distancess, radius=R_M, epsilon=1.0e-12,
+                                   iterations=20, tolerance=None):
+    '''Locates points each from ranges measured to many other points,
+       in the least-squares sense.
+
+       Each fix is solved by Gauss-Newton iteration in the tangent
+       plane, minimizing the sum of the squared differences between
+       measured and computed (great circle) distances.  To avoid
+       local minima, the iteration starts at the trilateration of
+       the first three points or, if that fails, at the mean of all
+       points.
+
+       @param nvss: The points of each fix (n-vector[][]), at least
+                    three per fix.
+       @param distancess: The distances measured to those points
+                          (float[][], same units as radius).
+       @keyword radius: Mean earth radius (meter).
+       @keyword epsilon: Convergence limit for the step (radians).
+       @keyword iterations: Maximum number of steps per fix (int).
+       @keyword tolerance: Optional maximum residual RMS (float, same
+                           units as radius), default no limit.
+
+       @return: 4-Tuple (latlons, residuals, covariances, mask) of
+                four lists with the position (2-tuple (lat, lon) in
+                (degrees90, degrees180)), the residuals (float[],
+                measured minus computed distance, same units as
+                radius), the covariance of the position (2-tuple
+                ((nn, ne), (en, ee)), north and east, squared units
+                of radius) respectively the invalid flag (bool) for
+                each fix.  Fixes with fewer than three points, a
+                singular geometry, without convergence or with a
+                residual RMS exceeding a given tolerance are invalid
+                with NAN position, residuals and covariance.
+
+       @raise ValueError: Unequal number of fixes, points or distances.
+
+       @note: The covariance is the inverse of the normal matrix, scaled
+              by the residual variance with M{m - 2} degrees of freedom,
+              where M{m} is the number of points.
+
+       @example:
+
+       >>> t = nvectors((0, 0, 1, 1), (0, 1, 0, 1))
+       >>> ll, rs, cs, ms = multilaterates([t], [(71900, 71900, 87700, 87700)])
+    '''
+    n, nvss = len2(nvss)
+    m, distancess = len2(distancess)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+
+    R = float(radius)
+    f = fprecise()
+    ll, rss, cs, ms = [], [], [], []
+    for nvs, ds in zip(nvss, distancess):
+        m, (nvs, ds) = _blocks2((nvs, False), (ds, True))
+        ds = [float(d) / R for d in ds]
+
+        p = None
+        if m > 2:  # start at the trilateration or the mean
+            q = _start(nvs, ds, f)
+            if q:
+                p = _gaussNewton2(q, nvs, ds, epsilon, iterations, f)
+            if p is None:
+                q = tuple(fsum(t) for t in zip(*nvs))
+                p = _gaussNewton2(q, nvs, ds, epsilon, iterations, f)
+            # reject local minima, with implausible residuals
+            if p and tolerance is not None and \
+                     sqrt(p[1] / m) * R > tolerance:
+                p = None
+
+        if p is None:
+            ll.append((_NAN, _NAN))
+            rss.append([_NAN] * m)
+            cs.append(((_NAN, _NAN), (_NAN, _NAN)))
+            ms.append(True)
+            continue
+
+        p, _ = p
+        rs, _, _, (a, b, c), _, k = _lsq(p, nvs, ds, f)
+        rs = [r * R for r in rs]
+        # residual variance, squared units of radius
+        v = fsum(r * r for r in rs) / (m - 2)
+        d = a * c - b * b
+        nn, ne, ee = (a * v / d), (-b * v / d), (c * v / d)
+        ll.append(_ll(p))
+        rss.append(rs)
+        cs.append(((nn, ne), (ne, ee)))
+        ms.append(False)
+    return ll, rss, cs, ms
+
+
+def nearestOns(lats, lons, lats1, lons1, lats2, lons2):
+    '''Locates the points closest on the great circle segments
+       between two points and each point.
+
+       If a point is within the extent of its segment, the closest
+       point is on the segment, otherwise it is the closest of the
+       segment end points.
+
+       @param lats: Point latitudes (degrees[] or degrees).
+       @param lons: Point longitudes (degrees[] or degrees).
+       @param lats1: Segment start latitudes (degrees[] or degrees).
+       @param lons1: Segment start longitudes (degrees[] or degrees).
+       @param lats2: Segment end latitudes (degrees[] or degrees).
+       @param lons2: Segment end longitudes (degrees[] or degrees).
+
+       @return: Closest points on the segments (2-tuple (lat, lon)[]
+                in degrees).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> t = nearestOns([51.0, 51.0], [1.9, 2.1], 51.0, 1.0, 51.0, 2.0)
+       >>> # [(51.0004, 1.9), (51.0, 2.0)]
+    '''
+    n, (a, b, a1, b1, a2, b2) = _columns(lats, lons, lats1, lons1,
+                                         lats2, lons2)
+    f = fprecise()
+    ll = []
+    for i in range(n):
+        n0 = _nv(a[i], b[i])
+        n1 = _nv(a1[i], b1[i])
+        n2 = _nv(a2[i], b2[i])
+        if _within(n0, n1, n2, f):
+            # closer to segment than to its endpoints,
+            # find the closest point on the segment
+            gc1 = _cross(n1, n2)
+            ll.append(_ll(_cross(gc1, _cross(n0, gc1))))
+            # beyond segment extent, take closer endpoint
+        elif _angle(n0, n1, f) < _angle(n0, n2, f):
+            ll.append((float(a1[i]), float(b1[i])))
+        else:
+            ll.append((float(a2[i]), float(b2[i])))
+    return ll
+
+
+def nvectors(lats, lons):
+    '''Converts (geodetic) lat- and longitudes to n-vectors.
+
+       @param lats: Latitudes (degrees[]).
+       @param lons: Longitudes (degrees[]).
+
+       @return: N-vectors, normal to the earth's surface (3-tuple
+                (x, y, z)[]).
+
+       @raise ValueError: Unequal number of lats and lons.
+
+       @example:
+
+       >>> t = nvectors([45], [45])  # [(0.5, 0.5, 0.7071)]
+    '''
+    n, lats = len2(lats)
+    m, lons = len2(lons)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+    return [_nv(a, b) for a, b in zip(lats, lons)]
+
+
+def triangulates(nvs1, bearings1, nvs2, bearings2):
+    '''Locates points each given two known points and initial
+       bearings from those points.
+
+       Like function L{triangulate} for each pair of points, except
+       that a pair with parallel or undefined great circles is flagged
+       in the returned mask instead of returning an arbitrary point.
+
+       @param nvs1: The first reference points (n-vector[] or n-vector).
+       @param bearings1: Bearings at the first points (compass degrees[]
+                         or degrees).
+       @param nvs2: The second reference points (n-vector[] or n-vector).
+       @param bearings2: Bearings at the second points (compass degrees[]
+                         or degrees).
+
+       @return: 2-Tuple (latlons, mask) of two lists with the
+                triangulated point (2-tuple (lat, lon) in (degrees90,
+                degrees180)) respectively the invalid flag (bool) for
+                each pair of points.  Invalid points are (NAN, NAN).
+
+       @raise ValueError: Unequal block or column lengths.
+
+       @example:
+
+       >>> p = nvectors((47.3038, 47.3111), (-2.5721, -2.5286))
+       >>> t = triangulates([p[0]], 7, [p[1]], 295)
+       >>> # ([(47.3237, -2.5685)], [False])
+    '''
+    n, (N1, T1, N2, T2) = _blocks2((nvs1, False), (bearings1, True),
+                                   (nvs2, False), (bearings2, True))
+    ll, ms = [], []
+    for k in range(n):
+        i = _crossed(_gct(N1[k], T1[k]),
+                     _gct(N2[k], T2[k]))
+        if i is None:
+            ll.append((_NAN, _NAN))
+            ms.append(True)
+        else:
+            ll.append(_ll(i))
+            ms.append(False)
+    return ll, ms
+
+
+def trilaterates(nvs1, distances1, nvs2, distances2, nvs3, distances3,
+                 radius=R_M):
+    '''Locates points each at given distances from three other points.
+
+       Like function L{trilaterate} for each triple of points, except
+       that a triple without trilateration is flagged in the returned
+       mask instead of raising an exception.
+
+       @param nvs1: The first points (n-vector[] or n-vector).
+       @param distances1: Distances to the first points (float[] or
+                          float, same units as radius).
+       @param nvs2: The second points (n-vector[] or n-vector).
+       @param distances2: Distances to the second points (float[] or
+                          float, same units as radius).
+       @param nvs3: The third points (n-vector[] or n-vector).
+       @param distances3: Distances to the third points (float[] or
+                          float, same units as radius).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: 2-Tuple (latlons, mask) of two lists with the
+                trilaterated point (2-tuple (lat, lon) in (degrees90,
+                degrees180)) respectively the invalid flag (bool) for
+                each triple of points.  Invalid points are (NAN, NAN).
+
+       @raise ValueError: Unequal block or column lengths.
+    '''
+    n, (N1, D1, N2, D2, N3, D3) = _blocks2((nvs1, False), (distances1, True),
+                                           (nvs2, False), (distances2, True),
+                                           (nvs3, False), (distances3, True))
+    f = fprecise()
+    ll, ms = [], []
+    for k in range(n):
+        n1 = N1[k]
+        t = _trilaterate5(n1, float(D1[k]) / radius,
+                          N2[k], float(D2[k]) / radius,
+                          N3[k], float(D3[k]) / radius, f)
+        if t and t[4] > 0:
+            X, Y, x, y, _ = t
+            ll.append(_ll(_plus(_plus(n1, _times(X, x)), _times(Y, y))))
+            ms.append(False)
+        else:
+            ll.append((_NAN, _NAN))
+            ms.append(True)
+    return ll, ms
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
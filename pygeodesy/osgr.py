@@ -30,18 +30,19 @@ U{https://en.wikipedia.org/wiki/Transverse_Mercator:_Redfearn_series}.
 
 from .bases import Base
 from .datum import Datums
-from .ellipsoidalBase import LatLonEllipsoidalBase
+from .ellipsoidalBase import LatLonEllipsoidalBase, _convertDatum3
+from .instrument import _timed
 from .utils import degrees90, degrees180, false2f, fdot, \
-                  halfs, isscalar, radians
+                  halfs, isscalar, len2, radians
 
 from math import cos, sin, sqrt, tan
 
 # all public contants, classes and functions
 __all__ = ('Osgr',  # classes
+           'latLonsToOsgrs', 'osgrsToLatLons',
            'parseOSGR', 'toOsgr')  # functions
-__version__ = '17.04.30'
+__version__ = '17.05.16'
 
-_10um    = 1e-5    #: (INTERNAL) 0.01 millimeter (meter)
 _100km   = 100000  #: (INTERNAL) 100 km (int meter)
 
 _A0, _B0 = radians(49), radians(-2)  #: (INTERNAL) NatGrid true origin, 49°N,2°W.
@@ -50,6 +51,34 @@ _F0      = 0.9996012717   #: (INTERNAL) NatGrid scale of central meridian
 
 _OSGB36  = Datums.OSGB36  #: (INTERNAL) Airy130 ellipsoid
 
+_FP2     = None  #: (INTERNAL) Footpoint constants (2-tuple)
+
+
+def _footpoint(n):
+    '''(INTERNAL) Computes the footpoint latitude from the
+       series of the rectifying latitude plus a single, fixed
+       correction, replacing the OS iteration of the meridional
+       arc (which may stop short north of about 55°N).
+
+       @param n: Northing (meter).
+
+       @return: Footpoint latitude (radians).
+    '''
+    global _FP2
+    E = _OSGB36.ellipsoid
+    if _FP2 is None:
+        _FP2 = (E.b * _F0 * E.Mabcd[0],     # scaled rectifying radius
+                _N0 + E.b * _M(E.Mabcd, 0))  # northing of the equator
+    A, N = _FP2
+    c2, c4, c6, c8 = E.Phi4
+
+    m = (n - N) / A  # rectifying latitude
+    a = m + c2 * sin(m * 2) + c4 * sin(m * 4) \
+          + c6 * sin(m * 6) + c8 * sin(m * 8)
+
+    # residual < 1e-7 meter, 0.1 micrometer
+    return a + (n - _N0 - E.b * _M(E.Mabcd, a)) / (E.a * _F0)
+
 
 def _M(Mabcd, a):
     '''(INTERNAL) Compute meridional arc.
@@ -111,6 +140,7 @@ class Osgr(Base):
         '''
         return parseOSGR(strOSGR)
 
+    @_timed('Osgr.toLatLon')
     def toLatLon(self, LatLon, datum=Datums.WGS84):
         '''Converts this OSGR coordinate to an (ellipsoidal) geodetic
            point.
@@ -141,59 +171,10 @@ class Osgr(Base):
         if not issubclass(LatLon, LatLonEllipsoidalBase):
             raise TypeError('%s not %s: %r' % ('LatLon', 'ellipsoidal', LatLon))
 
-        E = _OSGB36.ellipsoid  # Airy130
-        Mabcd = E.Mabcd
-
-        e, n = self._easting, self._northing
-
-        a, M = _A0, 0
-        while True:
-            t = n - _N0 - M
-            if t < _10um:
-                break
-            a += t / (E.a * _F0)
-            M = E.b * _M(Mabcd, a)
-
-        ca, sa, ta = cos(a), sin(a), tan(a)
-
-        s = 1 - E.e2 * sa * sa
-        v = E.a * _F0 / sqrt(s)
-        r = v * E.e12 / s
-
-        x2 = v / r - 1  # η
-
-        v3 = v * v * v
-        v5 = v * v * v3
-        v7 = v * v * v5
-
-        ta2 = ta  * ta
-        ta4 = ta2 * ta2
-        ta6 = ta4 * ta2
-
-        V4 = (a,
-              ta / (  2 * r * v),
-              ta / ( 24 * r * v3) * fdot((5, 3, 1, -9), 1, ta2, x2, x2 * ta2),
-              ta / (720 * r * v5) * fdot((61, 90, 45), 1, ta2, ta4))
-
-        sca = 1 / ca
-        X5 = (_B0,
-              sca / v,
-              sca / (   6 * v3) * (v / r + 2 * ta),
-              sca / ( 120 * v5) * fdot((5, 28, 24), 1, ta2, ta4),
-              sca / (5040 * v7) * fdot((61, 662, 1320, 720), ta, ta2, ta4, ta6))
-
-        d  = e - _E0
-        d2 = d  * d
-        d4 = d2 * d2
-        d6 = d2 * d4
-
-        a = fdot(V4, 1,    -d2,     d4,     -d6)
-        b = fdot(X5, 1, d, -d2 * d, d4 * d, -d6 * d)
-
-        ll = LatLon(degrees90(a), degrees180(b), datum=_OSGB36)
+        a, b = _toLatLon2(self._easting, self._northing)
         if datum != _OSGB36:
-            ll = ll.convertDatum(datum)
-            ll = LatLon(ll.lat, ll.lon, datum=datum)
+            a, b, _ = _convertDatum3(a, b, 0, _OSGB36, datum)
+        ll = LatLon(a, b, datum=datum)
 
         self._latlon = ll
         return ll
@@ -266,6 +247,167 @@ class Osgr(Base):
         return fmt % (t,)
 
 
+def _toLatLon2(e, n):
+    '''(INTERNAL) Converts OSGR easting and northing to OSGB36
+       lat- and longitude, without any intermediate objects.
+
+       @return: 2-Tuple (lat, lon) in (degrees90, degrees180).
+    '''
+    E = _OSGB36.ellipsoid  # Airy130
+
+    a = _footpoint(n)
+
+    ca, sa, ta = cos(a), sin(a), tan(a)
+
+    s = 1 - E.e2 * sa * sa
+    v = E.a * _F0 / sqrt(s)
+    r = v * E.e12 / s
+
+    x2 = v / r - 1  # η
+
+    v3 = v * v * v
+    v5 = v * v * v3
+    v7 = v * v * v5
+
+    ta2 = ta  * ta
+    ta4 = ta2 * ta2
+    ta6 = ta4 * ta2
+
+    V4 = (a,
+          ta / (  2 * r * v),
+          ta / ( 24 * r * v3) * fdot((5, 3, 1, -9), 1, ta2, x2, x2 * ta2),
+          ta / (720 * r * v5) * fdot((61, 90, 45), 1, ta2, ta4))
+
+    sca = 1 / ca
+    X5 = (_B0,
+          sca / v,
+          sca / (   6 * v3) * (v / r + 2 * ta2),
+          sca / ( 120 * v5) * fdot((5, 28, 24), 1, ta2, ta4),
+          sca / (5040 * v7) * fdot((61, 662, 1320, 720), ta, ta2, ta4, ta6))
+
+    d  = e - _E0
+    d2 = d  * d
+    d4 = d2 * d2
+    d6 = d2 * d4
+
+    a = fdot(V4, 1,    -d2,     d4,     -d6)
+    b = fdot(X5, 1, d, -d2 * d, d4 * d, -d6 * d)
+
+    return degrees90(a), degrees180(b)
+
+
+def _toOsgr2(lat, lon):
+    '''(INTERNAL) Converts OSGB36 lat- and longitude to OSGR
+       easting and northing, without any intermediate objects.
+
+       @return: 2-Tuple (easting, northing) in (meter).
+    '''
+    E = _OSGB36.ellipsoid
+
+    a, b = radians(lat), radians(lon)
+
+    ca, sa, ta = cos(a), sin(a), tan(a)
+
+    s = 1 - E.e2 * sa * sa
+    v = E.a * _F0 / sqrt(s)
+    r = s / E.e12  # = v / r = v / (v * E.e12 / s)
+
+    ca3 = ca * ca * ca
+    ca5 = ca * ca * ca3
+
+    ta2 = ta  * ta
+    ta4 = ta2 * ta2
+
+    x2 = r - 1  # η
+
+    I4 = (E.b * _M(E.Mabcd, a) + _N0,
+         (v /   2) * sa * ca,
+         (v /  24) * sa * ca3 * (5 - ta2 + 9 * x2),
+         (v / 720) * sa * ca5 * (61 - 58 * ta2 + ta4))
+
+    V4 = (_E0,
+          v * ca,
+         (v /   6) * ca3 * (r - ta2),
+         (v / 120) * ca5 * (5 - 18 * ta2 + ta4 + 14 * x2 - 58 * ta2 * x2))
+
+    d = b - _B0
+    d2 = d  * d
+    d3 = d2 * d
+    d5 = d2 * d3
+
+    n = fdot(I4, 1, d2, d3 * d, d5 * d)
+    e = fdot(V4, 1, d,  d3,     d5)
+
+    return e, n
+
+
+def latLonsToOsgrs(lats, lons, datum=Datums.WGS84):
+    '''Converts many lat-/longitudes to OSGR coordinates.
+
+       Like L{toOsgr} for each lat-/longitude, but without any
+       intermediate I{LatLon} or L{Osgr} instances.
+
+       @param lats: Latitudes (degrees).
+       @param lons: Longitudes (degrees).
+       @keyword datum: Datum of the lat-/longitudes (I{Datum}).
+
+       @return: List of 2-tuples (easting, northing) in (meter).
+
+       @raise ValueError: Unequal number of lats and lons.
+
+       @example:
+
+       >>> t = latLonsToOsgrs((52.65798,), (1.71605,))  # [(651409.8, 313177.4)]
+    '''
+    n, lats = len2(lats)
+    m, lons = len2(lons)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+
+    if datum == _OSGB36:
+        return [_toOsgr2(a, b) for a, b in zip(lats, lons)]
+
+    r = []
+    for a, b in zip(lats, lons):
+        a, b, _ = _convertDatum3(a, b, 0, datum, _OSGB36)
+        r.append(_toOsgr2(a, b))
+    return r
+
+
+def osgrsToLatLons(eastings, northings, datum=Datums.WGS84):
+    '''Converts many OSGR coordinates to lat-/longitudes.
+
+       Like L{Osgr.toLatLon} for each easting and northing, but
+       without any intermediate L{Osgr} or I{LatLon} instances.
+
+       @param eastings: Eastings from OS false easting (meter).
+       @param northings: Northings from OS false northing (meter).
+       @keyword datum: Datum for the lat-/longitudes (I{Datum}).
+
+       @return: List of 2-tuples (lat, lon) in (degrees90, degrees180).
+
+       @raise ValueError: Unequal number of eastings and northings.
+
+       @example:
+
+       >>> t = osgrsToLatLons((651409.903,), (313177.270,))  # [(52.657979, 1.716052)]
+    '''
+    n, eastings = len2(eastings)
+    m, northings = len2(northings)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+
+    if datum == _OSGB36:
+        return [_toLatLon2(e, n) for e, n in zip(eastings, northings)]
+
+    r = []
+    for e, n in zip(eastings, northings):
+        a, b = _toLatLon2(e, n)
+        r.append(_convertDatum3(a, b, 0, _OSGB36, datum)[:2])
+    return r
+
+
+@_timed('parseOSGR')
 def parseOSGR(strOSGR):
     '''Parses an OSGR coordinate string to an Osgr instance.
 
@@ -343,6 +485,7 @@ def parseOSGR(strOSGR):
     return Osgr(e, n)
 
 
+@_timed('toOsgr')
 def toOsgr(latlon, lon=None, datum=Datums.WGS84, Osgr=Osgr):
     '''Converts lat-/longitude point to na OSGR coordinate.
 
@@ -376,42 +519,7 @@ def toOsgr(latlon, lon=None, datum=Datums.WGS84, Osgr=Osgr):
     if latlon.datum != _OSGB36:
         latlon = latlon.convertDatum(_OSGB36)
 
-    E = _OSGB36.ellipsoid
-
-    a, b = radians(latlon.lat), radians(latlon.lon)
-
-    ca, sa, ta = cos(a), sin(a), tan(a)
-
-    s = 1 - E.e2 * sa * sa
-    v = E.a * _F0 / sqrt(s)
-    r = s / E.e12  # = v / r = v / (v * E.e12 / s)
-
-    ca3 = ca * ca * ca
-    ca5 = ca * ca * ca3
-
-    ta2 = ta  * ta
-    ta4 = ta2 * ta2
-
-    x2 = r - 1  # η
-
-    I4 = (E.b * _M(E.Mabcd, a) + _N0,
-         (v /   2) * sa * ca,
-         (v /  24) * sa * ca3 * (5 - ta2 + 9 * x2),
-         (v / 720) * sa * ca5 * (61 - 58 * ta2 + ta4))
-
-    V4 = (_E0,
-          v * ca,
-         (v /   6) * ca3 * (r - ta2),
-         (v / 120) * ca5 * (5 - 18 * ta2 + ta4 + 14 * x2 - 58 * ta2 * x2))
-
-    d = b - _B0
-    d2 = d  * d
-    d3 = d2 * d
-    d5 = d2 * d3
-
-    n = fdot(I4, 1, d2, d3 * d, d5 * d)
-    e = fdot(V4, 1, d,  d3,     d5)
-
+    e, n = _toOsgr2(latlon.lat, latlon.lon)
     return Osgr(e, n)
 
 # **) MIT License
@@ -54,6 +54,7 @@ Tested with 64-bit Python 2.6.9, 2.7.13, 3.5.3 and 3.6.0 on macOS
 '''
 
 from .datum import R_M
+from .instrument import _timed
 from .utils import EPS, len2, radiansPI, wrap180
 
 from math  import cos, degrees, radians
@@ -281,6 +282,7 @@ class _Sy(object):
         return r  # as dict
 
 
+@_timed('simplify1')
 def simplify1(points, distance, radius=R_M, adjust=True):
     '''Basic simplification of a path of LatLon points.
 
@@ -310,6 +312,7 @@ def simplify1(points, distance, radius=R_M, adjust=True):
     return S.points(r)
 
 
+@_timed('simplify2')
 def simplify2(points, band2, radius=R_M, adjust=True, shortest=False):
     '''Pipe simplification of a path of LatLon points.
 
@@ -346,6 +349,7 @@ def simplify2(points, band2, radius=R_M, adjust=True, shortest=False):
     return S.points(r)
 
 
+@_timed('simplifyRDP')
 def simplifyRDP(points, distance, radius=R_M, adjust=True, shortest=False):
     '''Ramer-Douglas-Peucker (RDP) simplification of a path of
        LatLon points.
@@ -391,6 +395,7 @@ def simplifyRDP(points, distance, radius=R_M, adjust=True, shortest=False):
     return S.points(r)
 
 
+@_timed('simplifyRDPm')
 def simplifyRDPm(points, distance, radius=R_M, adjust=True, shortest=False):
     '''Modified Ramer-Douglas-Peucker (RDP) simplification of a path
        of LatLon points.
@@ -435,6 +440,7 @@ def simplifyRDPm(points, distance, radius=R_M, adjust=True, shortest=False):
     return S.points(r)
 
 
+@_timed('simplifyVW')
 def simplifyVW(points, area2, radius=R_M, adjust=True, attr=None):
     '''Visvalingam-Whyatt (VW) simplification of a path of LatLon
        points.
@@ -477,6 +483,7 @@ def simplifyVW(points, area2, radius=R_M, adjust=True, attr=None):
     return S.points(S.vwr(attr))
 
 
+@_timed('simplifyVWm')
 def simplifyVWm(points, area2, radius=R_M, adjust=True, attr=None):
     '''Modified Visvalingam-Whyatt (VW) simplification of a path of
        LatLon points.
@@ -16,14 +16,14 @@ from .datum import R_M, Datum, Datums
 from .dms   import parse3llh
 from .utils import EPS, PI, PI2, PI_2, \
                   degrees90, degrees180, degrees360, \
-                  favg, radians, tanPI_2_2, wrapPI
+                  favg, isscalar, len2, radians, tanPI_2_2, wrapPI
 
 from math import acos, atan2, cos, hypot, log, sin
 
 # XXX the following classes are listed only to get
 # Epydoc to include class and method documentation
 __all__ = ('LatLonSphericalBase',)
-__version__ = '17.05.08'
+__version__ = '17.05.16'
 
 
 class LatLonSphericalBase(LatLonHeightBase):
@@ -144,7 +144,7 @@ class LatLonSphericalBase(LatLonHeightBase):
 
            @raise ValueError: Invalid strll.
         '''
-        return self.topsub(*parse3llh(strll, height=height, sep=sep))
+        return self._topsub(*parse3llh(strll, height=height, sep=sep))
 
     def _rhumb3(self, other):
         '''(INTERNAL) Rhumb_ helper function.
@@ -227,7 +227,7 @@ class LatLonSphericalBase(LatLonHeightBase):
             b2 = b1
 
         h = self.height if height is None else height
-        return self.topsub(degrees90(a2), degrees180(b2), height=h)
+        return self._topsub(degrees90(a2), degrees180(b2), height=h)
 
     def rhumbDistanceTo(self, other, radius=R_M):
         '''Returns distance from this to an other point along
@@ -303,7 +303,181 @@ class LatLonSphericalBase(LatLonHeightBase):
                           b2 * log(f1) + (b2 - b1) * log(f3)) / f
 
         h = self._havg(other) if height is None else height
-        return self.topsub(degrees90(a3), degrees180(b3), height=h)
+        return self._topsub(degrees90(a3), degrees180(b3), height=h)
+
+    def _rhumbs3(self, lats, lons):
+        '''(INTERNAL) Rhumb_s helper function, like L{_rhumb3}
+           for many other points, yielding 3-tuples (da, db, dp).
+
+           @param lats: Latitudes of the other points (degrees).
+           @param lons: Longitudes of the other points (degrees).
+        '''
+        lats, lons = _columns2(lats, lons, 'lats', 'lons')
+
+        a1, b1 = self.to2ab()
+        t1 = tanPI_2_2(a1)
+        for a2, b2 in zip(lats, lons):
+            a2 = radians(a2)
+            yield (a2 - a1), wrapPI(radians(b2) - b1), log(tanPI_2_2(a2) / t1)
+
+    def rhumbBearingsTo(self, lats, lons):
+        '''Returns the initial rhumb bearings from this to
+           many other points, like L{rhumbBearingTo} for
+           each other point.
+
+           @param lats: Latitudes of the other points (degrees).
+           @param lons: Longitudes of the other points (degrees).
+
+           @return: Initial bearings (list of compass degrees).
+
+           @raise ValueError: Unequal number of lats and lons.
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> b = p.rhumbBearingsTo((50.964,), (1.853,))  # [116.7]
+        '''
+        return [degrees360(atan2(db, dp)) for _, db, dp in
+                self._rhumbs3(lats, lons)]
+
+    def rhumbDestinations(self, distances, bearings, radius=R_M):
+        '''Returns the destinations having travelled along a rhumb
+           line from this point, like L{rhumbDestination} for each
+           distance and bearing.
+
+           @param distances: Distances travelled (same units as radius).
+           @param bearings: Bearings from this point (compass degrees).
+           @keyword radius: Mean earth radius (meter).
+
+           @return: Destinations (list of 2-tuples (lat, lon) in
+                    (degrees90, degrees180)).
+
+           @raise ValueError: Unequal number of distances and bearings.
+
+           @note: Either distances or bearings may be a single scalar,
+                  applied to each of the other's items.
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> t = p.rhumbDestinations((40300, 80600), 116.7)
+           >>> # [(50.9642, 1.8530), (50.8013, 2.3662)]
+        '''
+        ds, ts = _columns2(distances, bearings, 'distances', 'bearings')
+
+        a1, b1 = self.to2ab()
+        t1, q1, R = tanPI_2_2(a1), cos(a1), float(radius)
+
+        r = []
+        for d, t in zip(ds, ts):
+            d = float(d) / R  # angular distance in radians
+            t = radians(t)
+
+            da = d * cos(t)
+            a2 = a1 + da
+            # normalize latitude if past pole
+            if a2 > PI_2:
+                a2 =  PI - a2
+            elif a2 < -PI_2:
+                a2 = -PI - a2
+
+            dp = log(tanPI_2_2(a2) / t1)
+            # E-W course becomes ill-conditioned with 0/0
+            q = (da / dp) if abs(dp) > EPS else q1
+            b2 = (b1 + d * sin(t) / q) if abs(q) > EPS else b1
+
+            r.append((degrees90(a2), degrees180(b2)))
+        return r
+
+    def rhumbDistancesTo(self, lats, lons, radius=R_M):
+        '''Returns the rhumb distances from this to many other
+           points, like L{rhumbDistanceTo} for each other point.
+
+           @param lats: Latitudes of the other points (degrees).
+           @param lons: Longitudes of the other points (degrees).
+           @keyword radius: Mean radius of earth (scalar, default meter).
+
+           @return: Distances (list, in the same units as radius).
+
+           @raise ValueError: Unequal number of lats and lons.
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> d = p.rhumbDistancesTo((50.964,), (1.853,))  # [40307.8]
+        '''
+        q1, R = cos(self.to2ab()[0]), float(radius)
+        return [R * hypot(da, (da / dp if abs(dp) > EPS else q1) * db)
+                for da, db, dp in self._rhumbs3(lats, lons)]
+
+    def rhumbMidpointsTo(self, lats, lons):
+        '''Returns the rhumb midpoints between this and many
+           other points, like L{rhumbMidpointTo} for each
+           other point.
+
+           @param lats: Latitudes of the other points (degrees).
+           @param lons: Longitudes of the other points (degrees).
+
+           @return: Midpoints (list of 2-tuples (lat, lon) in
+                    (degrees90, degrees180)).
+
+           @raise ValueError: Unequal number of lats and lons.
+
+           @example:
+
+           >>> p = LatLon(51.127, 1.338)
+           >>> t = p.rhumbMidpointsTo((50.964,), (1.853,))
+           >>> # [(51.0455, 1.5957)]
+        '''
+        lats, lons = _columns2(lats, lons, 'lats', 'lons')
+
+        a1, b1_ = self.to2ab()
+        f1 = tanPI_2_2(a1)
+        if abs(f1) > EPS:
+            l1 = log(f1)
+
+        r = []
+        for a2, b2 in zip(lats, lons):
+            a2, b2 = radians(a2), radians(b2)
+            b1 = b1_
+            if abs(b2 - b1) > PI:
+                b1 += PI2  # crossing anti-meridian
+
+            a3 = favg(a1, a2)
+            b3 = favg(b1, b2)
+
+            if abs(f1) > EPS:
+                f2 = tanPI_2_2(a2)
+                f = f2 / f1
+                if abs(f) > EPS:
+                    f = log(f)
+                    if abs(f) > EPS:
+                        f3 = tanPI_2_2(a3)
+                        b3 = (b1 * log(f2) -
+                              b2 * l1 + (b2 - b1) * log(f3)) / f
+
+            r.append((degrees90(a3), degrees180(b3)))
+        return r
+
+
+def _columns2(xs, ys, x, y):
+    '''(INTERNAL) Return two columns of equal length, repeating
+       a single scalar to the length of the other column.
+
+       @raise ValueError: Unequal number of xs and ys.
+    '''
+    if isscalar(xs):
+        n, ys = len2(ys)
+        return [xs] * n, ys
+    elif isscalar(ys):
+        n, xs = len2(xs)
+        return xs, [ys] * n
+
+    n, xs = len2(xs)
+    m, ys = len2(ys)
+    if n != m:
+        raise ValueError('unequal len: %s vs %s' % (n, m))
+    return xs, ys
 
 # **) MIT License
 #
@@ -0,0 +1,421 @@
+
+# -*- coding: utf-8 -*-
+
+'''Great circle functions L{haversines}, L{initialBearings},
+L{finalBearings}, L{destinations}, L{intermediates},
+L{crossTrackDistances} and L{intersections} operating on columns
+of lat- and longitudes and the L{equirectangulars} approximation
+for short distances.
+
+Each function applies the formulas of the corresponding method of the
+I{sphericalTrigonometry} L{LatLon} class to every item of the given
+columns, producing the same results, within rounding, but without
+creating a L{LatLon} instance for each point or result.  Any column
+may be given as a single scalar, repeated to the length of the other
+columns and converted to radians only once.
+
+Columns are lists, sequences or tuples of degrees, results are
+lists of floats or 2-tuples (lat, lon) in degrees.  Function
+L{intersections} flags any ambiguous, infinite or parallel pair
+of paths in the returned mask instead of raising an exception.
+
+@newfield example: Example, Examples
+'''
+
+from .datum import R_M
+from .utils import EPS, PI2, degrees90, degrees180, degrees360, favg, \
+                  hsin3, isscalar, len2, wrapPI, _equirectangular, _hsin
+
+from math import acos, asin, atan2, cos, hypot, radians, sin
+
+# all public contants, classes and functions
+__all__ = ('crossTrackDistances',  # functions
+           'destinations', 'equirectangulars', 'finalBearings',
+           'haversines', 'initialBearings',
+           'intermediates', 'intersections')
+__version__ = '17.05.16'
+
+_NAN = float('nan')  #: (INTERNAL) Not-a-number (float).
+
+
+def _columns(*cols):
+    '''(INTERNAL) Return columns of equal length, repeating any
+       single scalar to the length of the other columns.
+
+       @raise ValueError: Unequal column lengths or all scalars.
+    '''
+    n, cs = None, []
+    for c in cols:
+        if not isscalar(c):
+            m, c = len2(c)
+            if n is None:
+                n = m
+            elif m != n:
+                raise ValueError('unequal len: %s vs %s' % (n, m))
+        cs.append(c)
+    if n is None:
+        raise ValueError('%s invalid: %r' % ('columns', cols))
+    return n, [([c] * n if isscalar(c) else c) for c in cs]
+
+
+def _ab(lats, lons):
+    '''(INTERNAL) Convert lat- and longitude columns to radians,
+       converting a scalar only once.
+    '''
+    return (radians(lats) if isscalar(lats) else [radians(a) for a in lats],
+            radians(lons) if isscalar(lons) else [radians(b) for b in lons])
+
+
+def _destination2(a, b, r, t):
+    '''(INTERNAL) Destination as sphericalTrigonometry._destination2.
+    '''
+    ca, cr, ct = cos(a), cos(r), cos(t)
+    sa, sr, st = sin(a), sin(r), sin(t)
+
+    a  = asin(ct * sr * ca + cr * sa)
+    b += atan2(st * sr * ca, cr - sa * sin(a))
+    return degrees90(a), degrees180(b)
+
+
+def _initial(a1, b1, a2, b2):
+    '''(INTERNAL) Initial bearing as L{LatLon}.initialBearingTo.
+    '''
+    db = b2 - b1
+    ca2 = cos(a2)
+    x = cos(a1) * sin(a2) - sin(a1) * ca2 * cos(db)
+    y = sin(db) * ca2
+    return degrees360(atan2(y, x))
+
+
+def _intersection2(a1, b1, t13, a2, b2, t23):
+    '''(INTERNAL) Intersection as sphericalTrigonometry.intersection.
+
+       @raise ValueError: Ambiguous, infinite or parallel paths.
+    '''
+    ca1, ca2 = cos(a1), cos(a2)
+    r12 = _hsin(a2, a1, b2 - b1, ca2, ca1)
+    if abs(r12) < EPS:
+        raise ValueError('parallel')
+
+    sa1, sa2, sr12 = sin(a1), sin(a2), sin(r12)
+    x1, x2 = (sr12 * ca1), (sr12 * ca2)
+    if min(abs(x1), abs(x2)) < EPS:
+        raise ValueError('parallel')
+
+    cr12 = cos(r12)
+    t1 = acos((sa2 - sa1 * cr12) / x1)
+    t2 = acos((sa1 - sa2 * cr12) / x2)
+    if sin(b2 - b1) > 0:
+        t12, t21 = t1, PI2 - t2
+    else:
+        t12, t21 = PI2 - t1, t2
+
+    x1 = wrapPI(t13 - t12)  # angle 2-1-3
+    x2 = wrapPI(t21 - t23)  # angle 1-2-3
+    sx1, sx2 = sin(x1), sin(x2)
+    if sx1 == 0 and sx2 == 0:
+        raise ValueError('infinite')
+    sx3 = sx1 * sx2
+    if sx3 < 0:
+        raise ValueError('ambiguous')
+    cx1, cx2 = cos(x1), cos(x2)
+
+    x3 = acos(cr12 * sx3 - cx2 * cx1)
+    r13 = atan2(sr12 * sx3, cx2 + cx1 * cos(x3))
+    return _destination2(a1, b1, r13, t13)
+
+
+def crossTrackDistances(lats, lons, lats1, lons1, lats2, lons2, radius=R_M):
+    '''Computes the (signed) distances from points to the great
+       circles each defined by a start and an end point.
+
+       @param lats: Point latitudes (degrees[] or degrees).
+       @param lons: Point longitudes (degrees[] or degrees).
+       @param lats1: Start latitudes (degrees[] or degrees).
+       @param lons1: Start longitudes (degrees[] or degrees).
+       @param lats2: End latitudes (degrees[] or degrees).
+       @param lons2: End longitudes (degrees[] or degrees).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: Distances to great circle (float[], negative if to
+                the left or positive if to the right of the path).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> d = crossTrackDistances([53.2611], [-0.7972],
+                                   53.3206, -1.7297, 53.1887, 0.1334)  # [-307.5]
+    '''
+    n, (a, b, a1, b1, a2, b2) = _columns(*(_ab(lats, lons) +
+                                           _ab(lats1, lons1) +
+                                           _ab(lats2, lons2)))
+    R = float(radius)
+    ds = []
+    for i in range(n):
+        a1i, b1i = a1[i], b1[i]
+        # as method LatLon._trackDistanceTo3
+        r, _, _ = hsin3(a[i], a1i, b[i] - b1i)
+        t = radians(_initial(a1i, b1i, a[i], b[i]))
+        e = radians(_initial(a1i, b1i, a2[i], b2[i]))
+        ds.append(asin(sin(r) * sin(t - e)) * R)
+    return ds
+
+
+def destinations(lats, lons, distances, bearings, radius=R_M):
+    '''Locates the destinations after having travelled the given
+       distances on the given initial bearings.
+
+       @param lats: Start latitudes (degrees[] or degrees).
+       @param lons: Start longitudes (degrees[] or degrees).
+       @param distances: Distances travelled (same units as radius).
+       @param bearings: Bearings from the start (compass degrees).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: Destinations (2-tuple (lat, lon)[] in (degrees90,
+                degrees180)).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> t = destinations(51.4778, -0.0015, [7794], [300.7])  # [(51.5135, -0.0983)]
+    '''
+    n, (a, b, ds, ts) = _columns(*(_ab(lats, lons) + (distances, bearings)))
+    R = float(radius)
+    ll = []
+    for i in range(n):
+        r = float(ds[i]) / R  # angular distance in radians
+        ll.append(_destination2(a[i], b[i], r, radians(ts[i])))
+    return ll
+
+
+def equirectangulars(lats1, lons1, lats2, lons2, radius=R_M, limit=100e3):
+    '''Computes the distances between pairs of points using the
+       equirectangular approximation, for short distances.
+
+       Pairs further apart than the limit or whose longitude delta
+       times the sine of the latitude exceeds the limit, near the
+       poles, are computed with the haversine formula instead.  The
+       relative error versus L{haversines} is at most M{(limit / radius)**2 / 2},
+       about 1.2e-4 for the default limit.
+
+       The cosine and sine of a single start latitude are computed
+       only once and not for each pair.
+
+       @param lats1: Start latitudes (degrees[] or degrees).
+       @param lons1: Start longitudes (degrees[] or degrees).
+       @param lats2: End latitudes (degrees[] or degrees).
+       @param lons2: End longitudes (degrees[] or degrees).
+       @keyword radius: Mean earth radius (meter).
+       @keyword limit: Equirectangular range (in the same units as radius).
+
+       @return: Distances (float[], in the same units as radius).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> d = equirectangulars(52.205, 0.119, [52.2, 52.3], [0.1, 0.2])  # [1409.1, 11916.0]
+    '''
+    a1, b1 = _ab(lats1, lons1)
+    if isscalar(a1):  # single origin
+        c1, s1 = cos(a1), sin(a1)
+    else:
+        c1, s1 = [cos(a) for a in a1], [sin(a) for a in a1]
+    _, cs = _columns(a1, c1, s1, b1, *_ab(lats2, lons2))
+    R = float(radius)
+    r = float(limit) / R  # radians
+    return [_equirectangular(a1, c1, s1, a2, b2 - b1, limit=r) * R
+            for a1, c1, s1, b1, a2, b2 in zip(*cs)]
+
+
+def finalBearings(lats1, lons1, lats2, lons2):
+    '''Computes the final bearings (reverse azimuth) between
+       pairs of points.
+
+       @param lats1: Start latitudes (degrees[] or degrees).
+       @param lons1: Start longitudes (degrees[] or degrees).
+       @param lats2: End latitudes (degrees[] or degrees).
+       @param lons2: End longitudes (degrees[] or degrees).
+
+       @return: Final bearings (compass degrees[]).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> b = finalBearings(52.205, 0.119, [48.857], [2.351])  # [157.9]
+    '''
+    n, (a1, b1, a2, b2) = _columns(*(_ab(lats1, lons1) + _ab(lats2, lons2)))
+    bs = []
+    for i in range(n):
+        # final bearing is reverse
+        b = _initial(a2[i], b2[i], a1[i], b1[i]) + 180
+        if b > 360:
+            b -= 360
+        bs.append(b)
+    return bs
+
+
+def haversines(lats1, lons1, lats2, lons2, radius=R_M):
+    '''Computes the distances between pairs of points using
+       the Haversine formula.
+
+       @param lats1: Start latitudes (degrees[] or degrees).
+       @param lons1: Start longitudes (degrees[] or degrees).
+       @param lats2: End latitudes (degrees[] or degrees).
+       @param lons2: End longitudes (degrees[] or degrees).
+       @keyword radius: Mean earth radius (meter).
+
+       @return: Distances (float[], in the same units as radius).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> d = haversines(52.205, 0.119, [48.857], [2.351])  # [404300]
+    '''
+    _, cs = _columns(*(_ab(lats1, lons1) + _ab(lats2, lons2)))
+    R = float(radius)
+    return [hsin3(a2, a1, b2 - b1)[0] * R for a1, b1, a2, b2 in zip(*cs)]
+
+
+def initialBearings(lats1, lons1, lats2, lons2):
+    '''Computes the initial bearings (forward azimuth) between
+       pairs of points.
+
+       @param lats1: Start latitudes (degrees[] or degrees).
+       @param lons1: Start longitudes (degrees[] or degrees).
+       @param lats2: End latitudes (degrees[] or degrees).
+       @param lons2: End longitudes (degrees[] or degrees).
+
+       @return: Initial bearings (compass degrees[]).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> b = initialBearings(52.205, 0.119, [48.857], [2.351])  # [156.2]
+    '''
+    n, (a1, b1, a2, b2) = _columns(*(_ab(lats1, lons1) + _ab(lats2, lons2)))
+    return [_initial(a1[i], b1[i], a2[i], b2[i]) for i in range(n)]
+
+
+def intermediates(lats1, lons1, lats2, lons2, fractions):
+    '''Locates the points at given fractions between pairs of points.
+
+       @param lats1: Start latitudes (degrees[] or degrees).
+       @param lons1: Start longitudes (degrees[] or degrees).
+       @param lats2: End latitudes (degrees[] or degrees).
+       @param lons2: End longitudes (degrees[] or degrees).
+       @param fractions: Fractions between both points (float[] or
+                         float, 0.0 = start point, 1.0 = end point).
+
+       @return: Intermediate points (2-tuple (lat, lon)[] in
+                (degrees90, degrees180)).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> t = intermediates(52.205, 0.119, 48.857, 2.351, [0.25])  # [(51.3721, 0.7073)]
+    '''
+    n, (a1, b1, a2, b2, fs) = _columns(*(_ab(lats1, lons1) +
+                                         _ab(lats2, lons2) + (fractions,)))
+    ll = []
+    for i in range(n):
+        a1i, b1i, a2i, b2i, f = a1[i], b1[i], a2[i], b2[i], fs[i]
+        r, ca2, ca1 = hsin3(a2i, a1i, b2i - b1i)
+        if r > EPS:
+            sr = sin(r)
+
+            A = sin((1 - f) * r) / sr
+            B = sin(     f  * r) / sr
+
+            x = A * ca1 * cos(b1i) + B * ca2 * cos(b2i)
+            y = A * ca1 * sin(b1i) + B * ca2 * sin(b2i)
+            z = A * sin(a1i)       + B * sin(a2i)
+
+            a = atan2(z, hypot(x, y))
+            b = atan2(y, x)
+
+        else:  # points too close
+            a = favg(a1i, a2i, f=f)
+            b = favg(b1i, b2i, f=f)
+
+        ll.append((degrees90(a), degrees180(b)))
+    return ll
+
+
+def intersections(lats1, lons1, bearings1, lats2, lons2, bearings2):
+    '''Locates the intersections of pairs of paths each defined by
+       a start point and an initial bearing.
+
+       Like function L{intersection} for each pair of paths, except
+       that an ambiguous, infinite or parallel pair is flagged in the
+       returned mask instead of raising an exception.
+
+       @param lats1: Start latitudes of the first paths (degrees[]
+                     or degrees).
+       @param lons1: Start longitudes of the first paths (degrees[]
+                     or degrees).
+       @param bearings1: Initial bearings of the first paths (compass
+                         degrees[] or degrees).
+       @param lats2: Start latitudes of the second paths (degrees[]
+                     or degrees).
+       @param lons2: Start longitudes of the second paths (degrees[]
+                     or degrees).
+       @param bearings2: Initial bearings of the second paths (compass
+                         degrees[] or degrees).
+
+       @return: 2-Tuple (latlons, mask) of two lists with the
+                intersection (2-tuple (lat, lon) in (degrees90,
+                degrees180)) respectively the invalid flag (bool)
+                for each pair of paths.  The intersection of an
+                invalid pair is (NAN, NAN).
+
+       @raise ValueError: Unequal column lengths.
+
+       @example:
+
+       >>> t = intersections([51.8853], [0.2545], 108.547, 49.0034, 2.5735, 32.435)
+       >>> # ([(50.9078, 4.5084)], [False])
+    '''
+    n, (a1, b1, t13, a2, b2, t23) = _columns(*(_ab(lats1, lons1) +
+                                               (bearings1,) +
+                                               _ab(lats2, lons2) +
+                                               (bearings2,)))
+    ll, ms = [], []
+    for i in range(n):
+        try:  # as function sphericalTrigonometry.intersection
+            ll.append(_intersection2(a1[i], b1[i], radians(t13[i]),
+                                     a2[i], b2[i], radians(t23[i])))
+            ms.append(False)
+        except ValueError:
+            ll.append((_NAN, _NAN))
+            ms.append(True)
+    return ll, ms
+
+
+# **) MIT License
+#
+# Copyright (C) 2016-2017 -- mrJean1 at Gmail dot com
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+# OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
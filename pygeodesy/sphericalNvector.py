@@ -1,9 +1,9 @@
 
 # -*- coding: utf-8 -*-
 
-'''Vector-based spherical geodetic (lat-/longitude) classes L{LatLon}
-and L{Nvector} and functions L{areaOf}, L{intersection}, L{meanOf},
-L{triangulate} and L{trilaterate}.
+'''Vector-based spherical geodetic (lat-/longitude) classes L{LatLon},
+L{Nvector} and L{Polyline} and functions L{areaOf}, L{intersection},
+L{meanOf}, L{triangulate} and L{trilaterate}.
 
 Python implementation of vector-based spherical geodetic (lat-/longitude)
 methods.  Transcribed from JavaScript originals by I{(C) Chris Veness
@@ -32,16 +32,19 @@ to a normalised version of an (ECEF) cartesian coordinate.
 from .datum import R_M
 from .nvector import NorthPole, LatLonNvectorBase, \
                     Nvector as NvectorBase, sumOf
+from .nvectorKernels import _angle, _cross
 from .sphericalBase import LatLonSphericalBase
-from .utils import PI, PI2, PI_2, degrees360, fsum, isscalar
+from .utils import EPS, PI, PI2, PI_2, degrees360, fprecise, fsum, \
+                   hypot3, isscalar
 
+from heapq import heappop, heappush
 from math import atan2, cos, radians, sin
 
 # all public contants, classes and functions
-__all__ = ('LatLon', 'Nvector',  # classes
+__all__ = ('LatLon', 'Nvector', 'Polyline',  # classes
            'areaOf', 'intersection', 'meanOf',  # functions
            'triangulate', 'trilaterate')
-__version__ = '17.05.15'
+__version__ = '17.05.16'
 
 
 class LatLon(LatLonNvectorBase, LatLonSphericalBase):
@@ -173,7 +176,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
 
         r = float(distance) / float(radius)  # angular distance in radians
         n = p.times(cos(r)).plus(q.times(sin(r)))
-        return n.toLatLon(height=height, LatLon=self.topsub)  # Nvector(n.x, n.y, n.z).toLatLon(...)
+        return n.toLatLon(height=height, LatLon=self._topsub)  # Nvector(n.x, n.y, n.z).toLatLon(...)
 
     def distanceTo(self, other, radius=R_M):
         '''Computes the distance from this to an other point.
@@ -306,7 +309,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
 #       i = other.toNvector() * fraction + \
 #            self.toNvector() * (1 - fraction))
 
-        return i.toLatLon(height=height, LatLon=self.topsub)  # Nvector(i.x, i.y, i.z).toLatLon(...)
+        return i.toLatLon(height=height, LatLon=self._topsub)  # Nvector(i.x, i.y, i.z).toLatLon(...)
 
     def intermediateTo(self, other, fraction, height=None):
         '''Locates the point at a given fraction between this and an
@@ -341,7 +344,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
         a = atan2(x.length(), p.dot(q)) * fraction  # interpolated
         i = p.times(cos(a)).plus(d.times(sin(a)))  # p * cosα + d * sinα
 
-        return i.toLatLon(height=height, LatLon=self.topsub)  # Nvector(i.x, i.y, i.z).toLatLon(...)
+        return i.toLatLon(height=height, LatLon=self._topsub)  # Nvector(i.x, i.y, i.z).toLatLon(...)
 
     def intersection(self, end1, start2, end2, height=None):
         '''Locates the point of intersection of two paths each defined
@@ -367,7 +370,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
            >>> i = s.intersection(108.55, e, 32.44)  # 50.9076°N, 004.5086°E
         '''
         return intersection(self, end1, start2, end2,
-                            height=height, LatLon=self.topsub)
+                            height=height, LatLon=self._topsub)
 
     def isEnclosedBy(self, points):
         '''Tests whether this point is enclosed by a (convex) polygon
@@ -464,7 +467,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
         self.others(other)
 
         m = self.toNvector().plus(other.toNvector())
-        return m.toLatLon(height=height, LatLon=self.topsub)
+        return m.toLatLon(height=height, LatLon=self._topsub)
 
     def nearestOn(self, point1, point2, height=None):
         '''Locates the point closest on great circle segment between
@@ -504,7 +507,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
             # find the closest point on the segment
             gc1 = point1.toNvector().cross(point2.toNvector())
             gc2 = self.toNvector().cross(gc1)
-            p = gc1.cross(gc2).toLatLon(height=height, LatLon=self.topsub)
+            p = gc1.cross(gc2).toLatLon(height=height, LatLon=self._topsub)
 
             # beyond segment extent, take closer endpoint
         elif self.distanceTo(point1) < self.distanceTo(point2):
@@ -554,7 +557,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
            >>> t = p.triangulate(7, q, 295)  # 47.323667°N, 002.568501°W'
         '''
         return triangulate(self, bearing1, other, bearing2,
-                                 height=height, LatLon=self.topsub)
+                                 height=height, LatLon=self._topsub)
 
     def trilaterate(self, distance1, point2, distance2, point3, distance3,
                           radius=R_M, height=None):
@@ -580,7 +583,7 @@ class LatLon(LatLonNvectorBase, LatLonSphericalBase):
         return trilaterate(self, distance1, point2, distance2,
                                             point3, distance3,
                                  radius=radius, height=height,
-                                 LatLon=self.topsub)
+                                 LatLon=self._topsub)
 
 
 class Nvector(NvectorBase):
@@ -641,9 +644,157 @@ class Nvector(NvectorBase):
         return n.minus(e)
 
 
+class Polyline(object):
+    '''A prepared path of great circle segments for nearest segment
+       queries, like map-matching.
+
+       The great circle normal, length and bounding cap of each segment
+       are computed once.  The caps of every I{leaf} consecutive segments
+       are merged into a bounding cap, recursively, and method L{nearest}
+       searches that tree of caps best-first, examining only segments
+       whose caps may be closer than the closest segment found so far.
+    '''
+
+    def __init__(self, points, radius=R_M, leaf=8):
+        '''New prepared polyline.
+
+           @param points: The path points (L{LatLon}[]).
+           @keyword radius: Mean earth radius (meter).
+           @keyword leaf: Number of caps merged per tree node (int).
+
+           @raise TypeError: Some points are not L{LatLon}.
+
+           @raise ValueError: Too few points or invalid leaf.
+
+           @example:
+
+           >>> r = LatLon(51, 1), LatLon(51, 2), LatLon(52, 3)
+           >>> p = Polyline(r)
+           >>> t = p.nearest(LatLon(51, 1.9))  # 0, 0.9, 42.7, 62979.2, 42.7
+        '''
+        n, points = _Nvll.points(points, closed=False)
+        if n < 2:
+            raise ValueError('too few points: %s' % (n,))
+        if not (isinstance(leaf, int) and leaf > 1):
+            raise ValueError('%s invalid: %r' % ('leaf', leaf))
+
+        f = fprecise()
+        vs = [p.toNvector().to3xyz() for p in points]
+        # per segment: start, end, unit normal and length
+        # of the great circle arc and the bounding cap
+        cs, ss, v1 = [], [], vs[0]
+        for v2 in vs[1:]:
+            c = _unitOrNone((v1[0] + v2[0], v1[1] + v2[1], v1[2] + v2[2])) or v1
+            cs.append((c, max(_angle(c, v1, f), _angle(c, v2, f))))
+            ss.append((v1, v2, _unitOrNone(_cross(v1, v2)), _angle(v1, v2, f)))
+            v1 = v2
+
+        # tree of caps, level 0 are the segment caps
+        caps = [cs]
+        while len(cs) > 1:
+            ps = []
+            for i in range(0, len(cs), leaf):
+                ks = cs[i:i + leaf]
+                c = _unitOrNone(tuple(fsum(k[0][j] for k in ks) for j in range(3))) or ks[0][0]
+                ps.append((c, max(_angle(c, k[0], f) + k[1] for k in ks)))
+            caps.append(ps)
+            cs = ps
+
+        self._caps = caps
+        self._leaf = leaf
+        self._points = points
+        self._segs = ss
+        self.radius = radius
+
+    def __len__(self):
+        '''Returns the number of segments.
+        '''
+        return len(self._segs)
+
+    def _nearest4(self, i, v, f):
+        '''(INTERNAL) Get the angular distance, fraction and angular
+           cross- and along-track distance of a point to a segment.
+        '''
+        v1, v2, gc, r = self._segs[i]
+        if gc is None:  # coincident points
+            return _angle(v, v1, f), 0.0, 0.0, 0.0
+
+        x = _angle(gc, v, f) - PI_2
+        # along-track point gc × v × gc
+        a = _angle(v1, _cross(_cross(gc, v), gc), f, vSign=gc)
+        if 0 <= a <= r:  # within segment extent
+            return abs(x), (a / r if r > EPS else 0.0), x, a
+
+        # beyond segment extent, take closer endpoint
+        d1, d2 = _angle(v, v1, f), _angle(v, v2, f)
+        if d1 > d2:
+            return d2, 1.0, x, a
+        return d1, 0.0, x, a
+
+    def nearest(self, point):
+        '''Locates the segment closest to a point.
+
+           @param point: The point (L{LatLon}).
+
+           @return: 5-Tuple (index, fraction, crossTrack, alongTrack,
+                    distance) of the closest segment, the fraction
+                    of the closest point on that segment (0.0 for the
+                    segment start, 1.0 for its end), the (signed)
+                    cross-track distance to and along-track distance
+                    from the segment start on its great circle and the
+                    distance to the closest point, all distances in
+                    the same units as radius.
+
+           @raise TypeError: The point is not L{LatLon}.
+
+           @example:
+
+           >>> i, f, x, a, d = p.nearest(LatLon(51.5, 2.6))  # 1, 0.529, ...
+        '''
+        self._points[0].others(point, name='point')
+
+        v = point.toNvector().to3xyz()
+        f = fprecise()
+
+        caps, n = self._caps, self._leaf
+        k = len(caps) - 1
+        t, d = None, PI2  # closest so far
+        h = [(0, k, 0)]  # heap of (bound, level, index)
+        while h:
+            b, k, i = heappop(h)
+            if b >= d:
+                break  # all remaining are farther
+            if k > 0:  # push children caps
+                k -= 1
+                cs = caps[k]
+                for j in range(i * n, min(i * n + n, len(cs))):
+                    c, r = cs[j]
+                    b = _angle(c, v, f) - r
+                    if b < d:
+                        heappush(h, (max(b, 0), k, j))
+            else:
+                t4 = self._nearest4(i, v, f)
+                if t4[0] < d:
+                    d, t = t4[0], (i,) + t4
+
+        i, d, f, x, a = t
+        r = self.radius
+        return i, f, x * r, a * r, d * r
+
+
 _Nvll = LatLon(0, 0)  #: (INTERNAL) Reference instance (L{LatLon}).
 
 
+def _unitOrNone(v):
+    '''(INTERNAL) Normalize a 3-tuple vector, unlike
+       nvectorKernels._unit returning None if zero.
+    '''
+    n = hypot3(*v)
+    if n > EPS:
+        return v[0] / n, v[1] / n, v[2] / n
+    return None
+
+
 def areaOf(points, radius=R_M):
     '''Calculates the area of a spherical polygon where the sides
        of the polygon are great circle arcs joining the points.
@@ -15,7 +15,8 @@ see U{http://www.movable-type.co.uk/scripts/latlong.html}.
 from .datum import R_M
 from .sphericalBase import LatLonSphericalBase
 from .utils import EPS, PI2, PI_2, degrees90, degrees180, degrees360, \
-                  favg, fsum, hsin3, map1, radians, wrap180, wrapPI
+                  favg, fsum, map1, radians, wrap180, wrapPI, \
+                  _equirectangular, _hsin
 from .vector3d import Vector3d, sumOf
 
 from math import acos, asin, atan2, copysign, cos, hypot, sin, tan
@@ -25,7 +26,7 @@ __all__ = ('LatLon',  # classes
            'areaOf',  # functions
            'intersection', 'isPoleEnclosedBy',
            'meanOf')
-__version__ = '17.05.15'
+__version__ = '17.05.16'
 
 
 class LatLon(LatLonSphericalBase):
@@ -110,8 +111,10 @@ class LatLon(LatLonSphericalBase):
 
         a, db = radians(lat), (b2 - b1)
 
-        ca, ca1, ca2, cdb = map1(cos, a, a1, a2, db)
-        sa, sa1, sa2, sdb = map1(sin, a, a1, a2, db)
+        ca, cdb = map1(cos, a, db)
+        sa, sdb = map1(sin, a, db)
+        sa1, ca1, _, _ = self._sincos4()
+        sa2, ca2, _, _ = other._sincos4()
 
         x = sa1 * ca2 * ca * sdb
         y = sa1 * ca2 * ca * cdb - ca1 * sa2 * ca
@@ -177,7 +180,7 @@ class LatLon(LatLonSphericalBase):
 
         a, b = _destination2(a, b, r, t)
         h = self.height if height is None else height
-        return self.topsub(a, b, height=h)
+        return self._topsub(a, b, height=h)
 
     def distanceTo(self, other, radius=R_M):
         '''Computes the distance from this to an other point.
@@ -198,11 +201,47 @@ class LatLon(LatLonSphericalBase):
         '''
         self.others(other)
 
+        r, _, _ = _hsin3(self, other)
+        return r * float(radius)
+
+    def equirectangularTo(self, other, radius=R_M, limit=100e3):
+        '''Computes the distance from this to an other point using
+           the equirectangular approximation, for short distances.
+
+           If the points are further apart than the limit or their
+           longitude delta times the sine of the latitude exceeds
+           the limit, near the poles, the distance is computed with
+           the haversine formula as L{distanceTo}.  The relative
+           error is at most M{(limit / radius)**2 / 2}, about 1.2e-4
+           for the default limit.
+
+           The sine and cosine of this point's latitude are cached.
+
+           @param other: The other point (L{LatLon}).
+           @keyword radius: Mean earth radius (meter).
+           @keyword limit: Equirectangular range (in the same units
+                           as radius).
+
+           @return: Distance between this and the other point
+                    (in the same units as radius).
+
+           @raise TypeError: The other point is not L{LatLon}.
+
+           @example:
+
+           >>> p1 = LatLon(52.205, 0.119)
+           >>> p2 = LatLon(52.3, 0.2)
+           >>> d = p1.equirectangularTo(p2)  # 11916.0
+        '''
+        self.others(other)
+
         a1, b1 = self.to2ab()
         a2, b2 = other.to2ab()
+        s1, c1, _, _ = self._sincos4()
 
-        r, _, _ = hsin3(a2, a1, b2 - b1)
-        return r * float(radius)
+        R = float(radius)
+        r = _equirectangular(a1, c1, s1, a2, b2 - b1, limit=float(limit) / R)
+        return r * R
 
     def greatCircle(self, bearing):
         '''Computes vector normal to great circle obtained by heading
@@ -221,11 +260,9 @@ class LatLon(LatLonSphericalBase):
            >>> g = p.greatCircle(96.0)
            >>> g.toStr()  # (-0.794, 0.129, 0.594)
         '''
-        a, b = self.to2ab()
+        sa, ca, sb, cb = self._sincos4()
         t = radians(bearing)
-
-        ca, cb, ct = map1(cos, a, b, t)
-        sa, sb, st = map1(sin, a, b, t)
+        ct, st = cos(t), sin(t)
 
         return Vector3d(sb * ct - cb * sa * st,
                        -cb * ct - sb * sa * st,
@@ -251,13 +288,14 @@ class LatLon(LatLonSphericalBase):
         '''
         self.others(other)
 
-        a1, b1 = self.to2ab()
-        a2, b2 = other.to2ab()
+        _, b1 = self.to2ab()
+        _, b2 = other.to2ab()
 
         db = b2 - b1
 
-        ca1, ca2, cdb = map1(cos, a1, a2, db)
-        sa1, sa2, sdb = map1(sin, a1, a2, db)
+        sa1, ca1, _, _ = self._sincos4()
+        sa2, ca2, _, _ = other._sincos4()
+        cdb, sdb = cos(db), sin(db)
 
         # see <http://mathforum.org/library/drmath/view/55417.html>
         x = ca1 * sa2 - sa1 * ca2 * cdb
@@ -294,10 +332,11 @@ class LatLon(LatLonSphericalBase):
         a1, b1 = self.to2ab()
         a2, b2 = other.to2ab()
 
-        r, ca2, ca1 = hsin3(a2, a1, b2 - b1)
+        r, ca2, ca1 = _hsin3(self, other)
         if r > EPS:
-            cb1, cb2               = map1(cos, b1, b2)
-            sb1, sb2, sa1, sa2, sr = map1(sin, b1, b2, a1, a2, r)
+            sa1, _, sb1, cb1 = self._sincos4()
+            sa2, _, sb2, cb2 = other._sincos4()
+            sr = sin(r)
 
             A = sin((1 - fraction) * r) / sr
             B = sin(     fraction  * r) / sr
@@ -317,7 +356,7 @@ class LatLon(LatLonSphericalBase):
             h = self._havg(other, f=fraction)
         else:
             h = height
-        return self.topsub(degrees90(a), degrees180(b), height=h)
+        return self._topsub(degrees90(a), degrees180(b), height=h)
 
     def intersection(self, bearing, start2, bearing2, height=None):
         '''Locates the intersection of two paths each defined by
@@ -343,7 +382,7 @@ class LatLon(LatLonSphericalBase):
            >>> i = p.intersection(108.547, s, 32.435)  # '50.9078°N, 004.5084°E'
         '''
         return intersection(self, bearing, start2, bearing2,
-                                  height=height, LatLon=self.topsub)
+                                  height=height, LatLon=self._topsub)
 
     def isEnclosedBy(self, points):
         '''Tests whether this point is enclosed by the polygon
@@ -427,13 +466,14 @@ class LatLon(LatLonSphericalBase):
         self.others(other)
 
         # see <http://mathforum.org/library/drmath/view/51822.html>
-        a1, b1 = self.to2ab()
-        a2, b2 = other.to2ab()
+        _, b1 = self.to2ab()
+        _, b2 = other.to2ab()
 
         db = b2 - b1
 
-        ca1, ca2, cdb = map1(cos, a1, a2, db)
-        sa1, sa2, sdb = map1(sin, a1, a2, db)
+        sa1, ca1, _, _ = self._sincos4()
+        sa2, ca2, _, _ = other._sincos4()
+        cdb, sdb = cos(db), sin(db)
 
         x = ca2 * cdb + ca1
         y = ca2 * sdb
@@ -445,7 +485,7 @@ class LatLon(LatLonSphericalBase):
             h = self._havg(other)
         else:
             h = height
-        return self.topsub(degrees90(a), degrees180(b), height=h)
+        return self._topsub(degrees90(a), degrees180(b), height=h)
 
 #   def nearestOn(self, point1, point2):
 #       '''Locates the point closest to the segment between two points
@@ -493,6 +533,22 @@ def _destination2(a, b, r, t):
     return degrees90(a), degrees180(b)
 
 
+def _hsin3(point1, point2):
+    '''(INTERNAL) Computes the angular distance between two points
+       as L{hsin3}, using the points' cached latitude cosines.
+
+       @param point1: First point (L{LatLon}).
+       @param point2: Second point (L{LatLon}).
+
+       @return: 3-Tuple (angle, cos(lat2), cos(lat1)).
+    '''
+    a1, b1 = point1.to2ab()
+    a2, b2 = point2.to2ab()
+    _, ca1, _, _ = point1._sincos4()
+    _, ca2, _, _ = point2._sincos4()
+    return _hsin(a2, a1, b2 - b1, ca2, ca1), ca2, ca1
+
+
 def areaOf(points, radius=R_M):
     '''Calculates the area of a spherical polygon where the sides
        of the polygon are great circle arcs joining the points.
@@ -570,11 +626,13 @@ def intersection(start1, bearing1, start2, bearing2,
     a1, b1 = start1.to2ab()
     a2, b2 = start2.to2ab()
 
-    r12, ca2, ca1 = hsin3(a2, a1, b2 - b1)
+    r12, ca2, ca1 = _hsin3(start1, start2)
     if abs(r12) < EPS:
         raise ValueError('intersection %s: %r vs %r' % ('parallel', start1, start2))
 
-    sa1, sa2, sr12 = map1(sin, a1, a2, r12)
+    sa1, _, _, _ = start1._sincos4()
+    sa2, _, _, _ = start2._sincos4()
+    sr12 = sin(r12)
     x1, x2 = (sr12 * ca1), (sr12 * ca2)
     if min(map1(abs, x1, x2)) < EPS:
         raise ValueError('intersection %s: %r vs %r' % ('parallel', start1, start2))
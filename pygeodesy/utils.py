@@ -10,7 +10,8 @@ and U{http://www.movable-type.co.uk/scripts/latlong-vectors.html}.
 @newfield example: Example, Examples
 '''
 
-from math import atan2, cos, degrees, pi as PI, radians, sin, sqrt, tan  # pow
+from math import atan2, cos, degrees, hypot, pi as PI, radians, sin, \
+                 sqrt, tan  # pow
 try:
     from math import fsum  # precision sum, Python 2.6+
 except ImportError:
@@ -24,7 +25,8 @@ import sys
 __all__ = ('EPS', 'EPS1', 'EPS2', 'PI', 'PI2', 'PI_2', 'R_M',  # constants
            'cbrt', 'cbrt2',
            'degrees', 'degrees90', 'degrees180', 'degrees360',
-           'false2f', 'favg', 'fdot', 'fdot3', 'fStr', 'fsum', 'ft2m',
+           'false2f', 'favg', 'fdot', 'fdot3', 'fprecise',
+           'fStr', 'fsum', 'ft2m',
            'halfs', 'hsin', 'hsin3', 'hypot1', 'hypot3',
            'isint', 'isscalar', 'len2',
            'm2ft', 'm2km', 'm2NM', 'm2SM', 'map1', 'map2',
@@ -32,7 +34,7 @@ __all__ = ('EPS', 'EPS1', 'EPS2', 'PI', 'PI2', 'PI_2', 'R_M',  # constants
            'tanPI_2_2',
            'wrap90', 'wrap180', 'wrap360',
            'wrapPI', 'wrapPI2', 'wrapPI_2')
-__version__ = '17.05.03'
+__version__ = '17.05.16'
 
 try:  # Luciano Ramalho, "Fluent Python", page 395, O'Reilly, 2016
     from numbers import Real as _Scalars  #: (INTERNAL) Scalar objects
@@ -66,6 +68,8 @@ R_M = 6371008.771415  #: Mean, spherical earth radius (meter).
 _1_3rd = 1.0 / 3.0  #: (INTERNAL) One third (float)
 _2_3rd = 2.0 / 3.0  #: (INTERNAL) Two third (float)
 
+_fprecise = False  #: (INTERNAL) Dot products with fsum (bool)
+
 
 def cbrt(x):
     '''Computes the cubic root M{x**(1/3)}.
@@ -136,6 +140,31 @@ def _drap(deg, wrap):
     return d
 
 
+def _equirectangular(a1, ca1, sa1, a2, b21, limit=None):
+    '''(INTERNAL) Equirectangular angular distance, using the cosine
+       of the mean latitude to 2nd order from the cosine and sine of
+       latitude a1.
+
+       @param a1: Latitude1 (radians).
+       @param ca1: Cosine of latitude1 (float).
+       @param sa1: Sine of latitude1 (float).
+       @param a2: Latitude2 (radians).
+       @param b21: Longitude delta (radians).
+       @keyword limit: Optional equirectangular range (radians).
+
+       @return: Angular distance (radians), the Haversine one if
+                beyond the limit or near the poles.
+    '''
+    b21 = wrapPI(b21)
+    a21 = a2 - a1
+    c = ca1 * (1 - a21 * a21 * 0.125) - sa1 * a21 * 0.5
+    r = hypot(b21 * c, a21)
+    if limit is not None and (r > limit or
+                              abs(b21) * (abs(sa1) + abs(a21)) > limit):
+        r = _hsin(a2, a1, b21, cos(a2), ca1)  # too far or near a pole
+    return r
+
+
 def false2f(value, name='value', false=True):
     '''Converts false east-/northing to non-negative float.
 
@@ -172,31 +201,57 @@ def favg(v1, v2, f=0.5):
     return v1 + f * (v2 - v1)  # v1 * (1 - f) + v2 * f
 
 
-def fdot(a, *b):
-    '''Returns the precision dot product M{sum(a[i] * b[i]
+def fdot(a, *b, **precise):
+    '''Returns the dot product M{sum(a[i] * b[i]
        for i in range(len(a)))}.
 
        @param a: List, sequence, tuple, etc. (scalars).
        @param b: List, sequence, tuple, etc. (scalars).
+       @keyword precise: Use L{fsum} (bool), overriding the
+                         L{fprecise} setting for this call.
 
        @return: Dot product (float).
 
+       @raise TypeError: Keyword other than I{precise}.
+
        @raise ValueError: Unequal len(a) and len(b).
-    '''
-    if not len(a) == len(b):
-        raise ValueError('unequal len: %s vs %s' % (len(a), len(b)))
 
-    return fsum(list(map(mul, a, b)))
+       @note: By default, L{fprecise} is False and products are summed
+              with plain float arithmetic instead of L{fsum}, also
+              for existing callers like L{Transform.transform},
+              L{toUtm}, L{toOsgr} and the n-vector classes.  Results
+              change by at most 5e-10 meter for L{Transform.transform},
+              2e-9 meter for L{toUtm} and 4e-10 meter for L{toOsgr},
+              see I{benchmarks/benchFdot.py}.
+    '''
+    p = precise.pop('precise', None)
+    if precise:
+        raise TypeError('%s invalid: %s' % ('keyword', ', '.join(sorted(precise))))
+
+    n = len(a)
+    if not n == len(b):
+        raise ValueError('unequal len: %s vs %s' % (n, len(b)))
+
+    if _fprecise if p is None else p:
+        return fsum(list(map(mul, a, b)))
+    elif n == 3:  # unrolled, common case
+        return float(a[0] * b[0] + a[1] * b[1] + a[2] * b[2])
+    elif n == 4:
+        return float(a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3])
+    else:
+        return sum(map(mul, a, b), 0.0)
 
 
-def fdot3(a, b, c, start=0):
-    '''Returns the precision dot product M{sum(a[i] * b[i] * c[i]
+def fdot3(a, b, c, start=0, precise=None):
+    '''Returns the dot product M{sum(a[i] * b[i] * c[i]
        for i in range(len(a))) + start}.
 
        @param a: List, sequence, tuple, etc. (scalars).
        @param b: List, sequence, tuple, etc. (scalars).
        @param c: List, sequence, tuple, etc. (scalars).
        @keyword start: Optional bias (scalar).
+       @keyword precise: Use L{fsum} (bool), overriding the
+                         L{fprecise} setting for this call.
 
        @return: Dot product (float).
 
@@ -208,10 +263,41 @@ def fdot3(a, b, c, start=0):
     if not len(a) == len(b) == len(c):
         raise ValueError('unequal len: %s vs %s vs %s' % (len(a), len(b), len(c)))
 
-    m3 = list(map(mul3, a, b, c))
-    if start:
-        m3 = (start,) + tuple(m3)
-    return fsum(m3)
+    if _fprecise if precise is None else precise:
+        m3 = list(map(mul3, a, b, c))
+        if start:
+            m3 = (start,) + tuple(m3)
+        return fsum(m3)
+    else:
+        return sum(map(mul3, a, b, c), float(start))
+
+
+def fprecise(precise=None):
+    '''Gets and optionally sets the precision mode for the dot
+       products L{fdot} and L{fdot3}.
+
+       In precise mode, the products are summed with L{fsum}.
+       Otherwise, short products are unrolled and summed with
+       plain float arithmetic, which is faster, but may differ
+       in the last few bits.  The default is not precise, see
+       the note at L{fdot}.
+
+       @keyword precise: New precision mode (bool) or None to
+                         leave the current setting unchanged.
+
+       @return: Previous precision mode (bool).
+
+       @example:
+
+       >>> p = fprecise(True)  # use fsum
+       >>> ...
+       >>> _ = fprecise(p)  # restore
+    '''
+    global _fprecise
+    p = _fprecise
+    if precise is not None:
+        _fprecise = bool(precise)
+    return p
 
 
 def fStr(floats, prec=6, sep=', ', fmt='%.*f', ints=False):
@@ -267,6 +353,19 @@ def halfs(str2):
     return str2[:h], str2[h:]
 
 
+def _hsin(a2, a1, b21, ca2, ca1):
+    '''(INTERNAL) Haversine angular distance as L{hsin3}, given
+       the cosines of both latitudes.
+
+       @return: Angular distance (radians).
+    '''
+    h = hsin(a2 - a1) + ca1 * ca2 * hsin(b21)  # haversine
+    try:
+        return atan2(sqrt(h), sqrt(1 - h)) * 2  # == asin(sqrt(h)) * 2
+    except ValueError:
+        return 0 if h < 0.5 else PI
+
+
 def hsin(rad):
     '''Computes the Haversine value of an angle.
 
@@ -294,12 +393,7 @@ def hsin3(a2, a1, b21):
        @see: U{http://www.edwilliams.org/avform.htm#Dist}
     '''
     ca2, ca1 = map1(cos, a2, a1)
-    h = hsin(a2 - a1) + ca1 * ca2 * hsin(b21)  # haversine
-    try:
-        r = atan2(sqrt(h), sqrt(1 - h)) * 2  # == asin(sqrt(h)) * 2
-    except ValueError:
-        r = 0 if h < 0.5 else PI
-    return r, ca2, ca1
+    return _hsin(a2, a1, b21, ca2, ca1), ca2, ca1
 
 
 def hypot1(x):
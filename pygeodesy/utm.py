@@ -33,6 +33,7 @@ from .bases import Base
 from .datum import Datums
 from .dms import S_DEG
 from .ellipsoidalBase import LatLonEllipsoidalBase
+from .instrument import _timed
 from .utils import EPS, degrees, degrees90, degrees180, \
                   fdot3, fStr, hypot1, isscalar, len2, map2, \
                   radians, wrap90, wrap180
@@ -52,6 +53,7 @@ _Bands         = 'CDEFGHJKLMNPQRSTUVWXX'  #: (INTERNAL) Latitude bands.
 _FalseEasting  =   500e3  #: (INTERNAL) False (meter).
 _FalseNorthing = 10000e3  #: (INTERNAL) False (meter).
 _K0            = 0.9996   #: (INTERNAL) UTM scale central meridian.
+_TRIPS         = 16       #: (INTERNAL) Max. toLatLon iterations.
 
 
 class _Ks(object):
@@ -287,6 +289,7 @@ class Utm(Base):
         '''
         return self._scale
 
+    @_timed('Utm.toLatLon')
     def toLatLon(self, LatLon):
         '''Converts this UTM coordinate to an (ellipsoidal) geodetic point.
 
@@ -332,15 +335,19 @@ class Utm(Base):
 
         T = t0 = sy / H
         q = 1.0 / E.e12
-        d = 1
         # note, a relatively large convergence test as d
-        # toggles on +/-1.12e-16 eg. 31 N 400000 5000000
-        while abs(d) > EPS:  # 1e-12
+        # toggles on +/-1.12e-16 eg. 31 N 400000 5000000,
+        # scaled by T since d may toggle on an ulp of T,
+        # eg. 20 S 342636 3345121, and limited to _TRIPS
+        e = max(1.0, abs(T)) * EPS
+        for _ in range(_TRIPS):
             h = hypot1(T)
             s = sinh(E.e * atanh(E.e * T / h))
             t = T * hypot1(s) - s * h
             d = (t0 - t) / hypot1(t) * (q + T * T) / h
             T += d
+            if abs(d) < e:
+                break
 
         a = atan(T)  # lat
         b = atan2(shx, cy) + radians(self._zone * 6 - 183)  # lon of central meridian
@@ -432,6 +439,7 @@ class Utm(Base):
         return self._zone
 
 
+@_timed('parseUTM')
 def parseUTM(strUTM, datum=Datums.WGS84):
     '''Parses a string representing a UTM coordinate, consisting
        of zone, hemisphere, easting and northing.
@@ -466,6 +474,7 @@ def parseUTM(strUTM, datum=Datums.WGS84):
     return Utm(z, h.upper(), e, n, datum=datum)
 
 
+@_timed('toUtm')
 def toUtm(latlon, lon=None, datum=None, Utm=Utm):
     '''Converts lat-/longitude point to a UTM coordinate.
 
@@ -508,13 +517,26 @@ def toUtm(latlon, lon=None, datum=None, Utm=Utm):
             raise ValueError('%s invalid: %r' % ('lat', lat))
         d = datum or Datums.WGS84
 
-    E = d.ellipsoid
+    z, h, B, x, y, c, k = _toUtm7(lat, lon, d.ellipsoid)
+    return Utm(z, h, x, y, band=B, datum=d, convergence=c, scale=k)
+
+
+def _toUtm7(lat, lon, E, cs=True):  # used by mgrs
+    '''(INTERNAL) Converts lat-/longitude to UTM, without objects.
+
+       @param lat: Latitude (degrees).
+       @param lon: Longitude (degrees).
+       @param E: Ellipsoid to use (L{Ellipsoid}).
+       @keyword cs: Compute convergence and scale (bool).
 
+       @return: 7-Tuple (zone, hemisphere, Band, easting, northing,
+                convergence, scale), the last two None if not cs.
+    '''
     z, B, a, b = _toZBll(lat, lon)
     h = 'S' if a < 0 else 'N'  # hemisphere
 
     # easting, northing: Karney 2011 Eq 7-14, 29, 35
-    cb, sb, tb = cos(b), sin(b), tan(b)
+    cb, sb = cos(b), sin(b)
 
     T = tan(a)
     T12 = hypot1(T)
@@ -536,15 +558,17 @@ def toUtm(latlon, lon=None, datum=None, Utm=Utm):
     if y < 0:
         y += _FalseNorthing  # y relative to false northing in S
 
-    # convergence: Karney 2011 Eq 23, 24
-    p_ = A6.ps(1)
-    q_ = A6.qs(0)
-    c = degrees(atan(T_ / hypot1(T_) * tb) + atan2(q_, p_))
+    c = k = None
+    if cs:
+        # convergence: Karney 2011 Eq 23, 24
+        p_ = A6.ps(1)
+        q_ = A6.qs(0)
+        c = degrees(atan(T_ / hypot1(T_) * tan(b)) + atan2(q_, p_))
 
-    # scale: Karney 2011 Eq 25
-    k = E.e2s2(sin(a)) * T12 / H * (A0 / E.a * hypot(p_, q_))
+        # scale: Karney 2011 Eq 25
+        k = E.e2s2(sin(a)) * T12 / H * (A0 / E.a * hypot(p_, q_))
 
-    return Utm(z, h, x, y, band=B, datum=d, convergence=c, scale=k)
+    return z, h, B, x, y, c, k
 
 # **) MIT License
 #
@@ -4,7 +4,7 @@
 # Test base classes.
 
 __all__ = ('Tests',)
-__version__ = '17.04.07'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
@@ -32,6 +32,22 @@ class Tests(_Tests):
         self.test('precision', precision(F_DMS), '0')
         self.test('toStr', p.toStr(), '''51°28'40"N, 000°00'06"W, +42.00m''')
 
+        q = p.copy()  # _topsub
+        self.test('copy', q.toStr(F_D), '51.4778°N, 000.0016°W, +42.00m')
+        self.test('copy', q.__class__.__name__, p.__class__.__name__)
+        s, n = p.bounds(2000, 2000)
+        self.test('bounds', s.toStr(F_D, prec=6), '51.468807°N, 000.01604°W, +42.00m')
+        self.test('bounds', n.toStr(F_D, prec=6), '51.486793°N, 000.01284°E, +42.00m')
+
+        class _LatLon(LatLon):  # overloaded __init__
+            def __init__(self, lat, lon, height=0, **unused):
+                LatLon.__init__(self, lat, lon, height=height)
+                self.inited = True
+
+        q = _LatLon(51.4778, -0.0016, 42)._topsub(1.5, 2.5)
+        self.test('_topsub', getattr(q, 'inited', False), 'True')
+        self.test('_topsub', q.toStr(F_D), '01.5°N, 002.5°E')
+
 
 if __name__ == '__main__':
 
@@ -4,12 +4,12 @@
 # Test datums, ellipsoids and transforms.
 
 __all__ = ('Tests',)
-__version__ = '17.04.22'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
 from pygeodesy import R_M, Datum, Datums, Ellipsoid, Ellipsoids, \
-                      fStr, Transform, Transforms
+                      fprecise, fStr, Transform, Transforms
 
 
 class Tests(_Tests):
@@ -28,6 +28,29 @@ class Tests(_Tests):
         self.test('datum', D is Datums.TestDatum, 'True')
 #       print(Datum())
 
+        # registries instantiate entries on first access
+        n = len(Ellipsoids)
+        self.test('pending', 'Plessis1817' in Ellipsoids, 'True')
+        self.test('resolved', Ellipsoids.Plessis1817 is Ellipsoids['Plessis1817'], 'True')
+        self.test('len', len(Ellipsoids), str(n))
+        self.test('keys', len(list(Ellipsoids.keys())), str(n))
+        self.test('get', Ellipsoids.get('Unknown'), 'None')
+        try:
+            t = Ellipsoid(6397523.0, 6355863.0, 0, name='Plessis1817')
+        except NameError as x:
+            t = x
+        self.test('exists', t, 'Ellipsoids.Plessis1817 exists')
+        try:
+            t = Datums.Unknown
+        except AttributeError as x:
+            t = x
+        self.test('Unknown', t, "Datums.Unknown doesn't exist")
+
+        E = Ellipsoid(6378000.0, 6357000.0, 0, name='TestLazy')
+        self.test('R2', E._R2, 'None')
+        self.test('R2', E.R2, '6370998.46613', fmt='%.5f')
+        self.test('R2', E._R2 == E.R2, 'True')
+
         E = Transforms.ED50
         t = E.inverse().inverse("ED50_")
         self.test('ED50.inverse().inverse()', t == E, 'True')
@@ -45,6 +68,17 @@ class Tests(_Tests):
         self.test('WGS84', t[1], "A=6367449.1458234154, e=0.0818191908, f_=298.2572235630, n=0.0016792204(-3.7914875232e-13)")
         self.test('WGS84', t[2], "Alpha6=(0, 8.377318206245e-04, 7.608527773572e-07, 1.197645503329e-09, 2.429170607201e-12, 5.711757677866e-15, 1.491117731258e-17)")
         self.test('WGS84', t[3], "Beta6=(0, 8.377321640579e-04, 5.905870152220e-08, 1.673482665284e-1, 2.164798040063e-13, 3.787978046169e-16, 7.248748890694e-19)")
+        self.test('WGS84', fStr(E.Mu4, prec=12, fmt='%.*e'), '-2.518827916119e-03, 2.643541059810e-06, -3.452628898843e-09, 4.891830328312e-12')
+        self.test('WGS84', fStr(E.Phi4, prec=12, fmt='%.*e'), '2.518826584391e-03, 3.700949035621e-06, 7.447813767504e-09, 1.703599323860e-11')
+
+
+        T = Transforms.OSGB36
+        x = T.transform(3980581.0, -9.0, 4966825.0)
+        self.test('transform', fStr(x, prec=6), '3980210.163957, 103.522425, 4966389.473976')
+        p = fprecise(True)
+        x = T.transform(3980581.0, -9.0, 4966825.0)
+        self.test('transform', fStr(x, prec=6), '3980210.163957, 103.522425, 4966389.473976')
+        fprecise(p)
 
 
 if __name__ == '__main__':
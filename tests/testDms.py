@@ -4,12 +4,14 @@
 # Test degrees, minutes, seconds functions.
 
 __all__ = ('Tests',)
-__version__ = '17.04.07'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
-from pygeodesy import F_D, F_DM, F_DMS, \
-                      compassPoint, parse3llh, parseDMS, toDMS
+from pygeodesy import F_D, F_DM, F_DMS, F_RAD, \
+                      bearingDMS, bearingDMSs, compassPoint, compassPoints, \
+                      latDMS, latDMSs, lonDMS, lonDMSs, \
+                      parse3llh, parseDMS, parseDMSs, toDMS, toDMSs
 
 
 class Tests(_Tests):
@@ -23,6 +25,22 @@ class Tests(_Tests):
         self.test('parseDMS', parseDMS('''000° 00'00"'''),    '0.0')
         self.test('parseDMS', parseDMS('''000°00 ' 00.0"'''), '0.0')
 
+        t = ('0.0°', '''000°00'00"''', '51° 28′ 40.12″ N', '000° 00′ 05.31″W',
+             "45°45.756'", '-45.7626', '+45.7626', 45.7626, 'x', '', None,
+             '4°N°', '45\n', '45\x00N', '1 2 3 4')
+        ds, ms = parseDMSs(t)
+        self.test('parseDMSs', len(ds), str(len(t)))
+        for s, d, m in zip(t, ds, ms):
+            try:
+                x = '%.6f' % (parseDMS(s),)
+            except (AttributeError, TypeError, ValueError):
+                x = 'nan'
+            self.test('parseDMSs', '%.6f' % (d,), x)
+            self.test('parseDMSs', m, str(x == 'nan'))
+        ds, ms = parseDMSs(t[2:4], suffix='NS')
+        self.test('parseDMSs', '%.6f, %s' % (ds[0], ms[0]), '51.477811, False')
+        self.test('parseDMSs', '%.6f, %s' % (ds[1], ms[1]), 'nan, True')
+
         x = parse3llh('000° 00′ 05.31″W, 51° 28′ 40.12″ N')
         x = ', '.join('%.6f' % a for a in x)  # XXX fStr
         self.test('parse3llh', x, '51.477811, -0.001475, 0.000000')
@@ -54,6 +72,21 @@ class Tests(_Tests):
                      ((237, 3), 'WSW')):
             self.test('compassPoint', compassPoint(*a), x)
 
+        j = ', '.join
+        t = (45.76260, -0.0015, 0, 359.99999, -90, 123.456789)
+        for f in (F_D, F_DM, F_DMS, F_RAD):
+            for p in (None, 0, 2, -4):
+                self.test('toDMSs', j(toDMSs(t, f, p, 3, '-', '+')),
+                                    j(toDMS(d, f, p, 3, '-', '+') for d in t))
+                self.test('latDMSs', j(latDMSs(t, f, p)), j(latDMS(d, f, p) for d in t))
+                self.test('lonDMSs', j(lonDMSs(t, f, p)), j(lonDMS(d, f, p) for d in t))
+                self.test('bearingDMSs', j(bearingDMSs(t, f, p)), j(bearingDMS(d, f, p) for d in t))
+        self.test('toDMSs', j(toDMSs(t[:2], F_D, 4)), '45.7626°, -00.0015°')
+        self.test('latDMSs', j(latDMSs(t[:2])), '''45°45'45.36"N, 00°00'05.4"S''')
+        for p in (1, 2, 3):
+            self.test('compassPoints', j(compassPoints(t, p)), j(compassPoint(d, p) for d in t))
+        self.test('compassPoints', j(compassPoints((24, 226, 237))), 'NNE, SW, WSW')
+
 
 if __name__ == '__main__':
 
@@ -4,7 +4,7 @@
 # Test ellipsoidal earth model functions and methods.
 
 __all__ = ('Tests',)
-__version__ = '17.05.06'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
@@ -27,6 +27,27 @@ class Tests(_Tests):
         self.test('convertDatum', d, '51.477284°N, 000.00002°E, -45.91m')  # 51.4773°N, 000.0000°E, -45.91m
         self.test('convertDatum', d.toStr(F_D, prec=4), '51.4773°N, 000.0°E, -45.91m')
 
+        p = LatLon(51.127, 1.338)
+        q = LatLon(50.964, 1.853)
+        b = p.rhumbBearingTo(q)
+        self.test('rhumbBearingTo', b, '116.661', '%.3f')
+        d = p.rhumbDistanceTo(q)
+        self.test('rhumbDistanceTo', d, '40413.130', '%.3f')
+        t = p.rhumbDestination(40300, 116.7)
+        self.test('rhumbDestination', t, '50.964234°N, 001.851383°E')
+        self.test('rhumbDestination', isinstance(t, LatLon), 'True')
+        t = p.rhumbDestination(d, b)
+        self.test('rhumbDestination', t, '50.964°N, 001.853°E')
+
+        p = LatLon(40, 170)
+        q = LatLon(40, -170)
+        self.test('rhumbBearingTo', p.rhumbBearingTo(q), '90.0')
+        d = p.rhumbDistanceTo(q)
+        self.test('rhumbDistanceTo', d, '1707877.139', '%.3f')
+        self.test('rhumbDestination', p.rhumbDestination(d, 90), '40.0°N, 170.0°W')
+        p.lat = -40  # reset cached rhumb
+        self.test('rhumbDestination', p.rhumbDestination(d, 90), '40.0°S, 170.0°W')
+
         if Cartesian:
             c = Cartesian(3980581, 97, 4966825)
             n = c.toNvector()  # {x: 0.6228, y: 0.0000, z: 0.7824, h: 0.0000}  # XXX height
@@ -50,6 +71,37 @@ class Tests(_Tests):
             n = Nvector(0.5, 0.5, 0.7071, 1).toStr(3)
             self.test('Nvector', n, '(0.5, 0.5, 0.707, +1.00)')
 
+    def testLocalFrame(self, LatLon, LocalFrame, Ned):
+        a = LatLon(49.66618, 3.45063)
+        b = LatLon(48.88667, 2.37472)
+        f = LocalFrame(a)
+        self.test('LocalFrame', f.toStr(F_D), '49.66618°N, 003.45063°E')
+        t = f.toNeds([b.lat, a.lat], [b.lon, a.lon])
+        self.test('toNeds', repr(t[0]), repr(a.deltaTo(b).to3ned()))
+        self.test('toNeds', Ned(*t[0]).toStr(prec=0), '[N:-86126, E:-78900, D:1069]')
+        self.test('toNeds', Ned(*t[1]).length, '0.0', '%.1f')
+        t = f.toEnus(b.lat, [b.lon], heights=1000)
+        self.test('toEnus', Ned(*t[0]).toStr(prec=0), '[N:-78912, E:-86139, D:-69]')
+
+        d = a.deltaTo(b)
+        t = f.fromNeds([d.to3ned()])
+        c = a.destinationNed(d)
+        self.test('fromNeds', repr(t[0][:2]), repr((c.lat, c.lon)))
+        self.test('fromNeds', '%.5f, %.5f, %.3f' % t[0], '48.88667, 2.37472, 0.000')
+        t = f.fromEnus(f.toEnus([b.lat], b.lon, 1000))
+        self.test('fromEnus', '%.5f, %.5f, %.3f' % t[0], '48.88667, 2.37472, 1000.000')
+
+        # at the poles, north and east as approaching along the meridian
+        for a, n in ((90, '-111688'), (-90, '111688')):
+            p = LatLon(a, 30)
+            q = LatLon(a - 1 if a > 0 else a + 1, 30)
+            self.test('deltaTo', p.deltaTo(q).toStr(prec=0), '[N:%s, E:0, D:975]' % (n,))
+            q = LatLon(q.lat, 120)
+            d = p.deltaTo(q)
+            self.test('deltaTo', '%.0f, %.0f, %.0f' % (abs(d.north), d.east, d.down), '0, 111688, 975')
+            c = p.destinationNed(p.deltaTo(q))
+            self.test('destinationNed', '%.6f, %.6f' % (c.lat, c.lon), '%.6f, 120.000000' % (q.lat,))
+
     def testVincenty(self, LatLon, datum):
         d = datum
         n = ' (%s)' % (d.name,)
@@ -209,6 +261,28 @@ class Tests(_Tests):
         t = p.distanceTo3(q)
         self.test('NOAAexample4', _dfr(*t), '145239.0603, 114 29 26.9586, 295 21 32.6566')  # Ell Dist, FAZ, BAZ
 
+    def testDistanceTo2(self, LatLon):
+        p = LatLon(50.06632, -5.71475)
+        q = LatLon(58.64402, -3.07009)
+        r = LatLon(50.07, -5.72)
+        for t, x, y in ((0.1,   '969068.719, 0.0118723', '554.843, 0.00569978'),  # equirectangular
+                        (0.01,  '968876.038, 0.00569978', '554.843, 0.00569978'),  # haversine
+                        (0.001, '969961.099, 2.24827e-05', '555.724, 2.24827e-05'),  # Andoyer-Lambert
+                        (0,     '969954.166, 0', '555.723, 0')):  # Vincenty
+            d, e = p.distanceTo2(q, tolerance=t)
+            self.test('distanceTo2(%s)' % (t,), '%.3f, %.6g' % (d, e), x)
+            d, e = p.distanceTo2(r, tolerance=t)
+            self.test('distanceTo2(%s)' % (t,), '%.3f, %.6g' % (d, e), y)
+        q = LatLon(p.lat, p.lon)  # coincident
+        for t, x in ((0.01,  '0.0, 0.00569978'),  # haversine
+                     (0.001, '0.0, 2.24827e-05'),  # Andoyer-Lambert
+                     (1e-5,  'VincentyError')):  # Vincenty
+            try:
+                d = '%.1f, %.6g' % p.distanceTo2(q, tolerance=t)
+            except Exception as e:
+                d = e.__class__.__name__
+            self.test('distanceTo2(%s)' % (t,), d, x)
+
 
 if __name__ == '__main__':
 
@@ -217,6 +291,7 @@ if __name__ == '__main__':
     t.testLatLon(N.LatLon, Sph=False)
     t.testVectorial(N.LatLon, N.Nvector, N.sumOf)
     t.testEllipsoidal(N.LatLon, N.Nvector, N.Cartesian)
+    t.testLocalFrame(N.LatLon, N.LocalFrame, N.Ned)
     t.results()
 
     from pygeodesy import ellipsoidalVincenty as V
@@ -225,5 +300,6 @@ if __name__ == '__main__':
     for d in (Datums.WGS84, Datums.NAD83,):  # Datums.Sphere):
         t.testVincenty(V.LatLon, d)
     t.testNOAA(V.LatLon)
+    t.testDistanceTo2(V.LatLon)
     t.results()
     t.exit()
@@ -0,0 +1,81 @@
+
+# -*- coding: utf-8 -*-
+
+# Test instrument module.
+
+__all__ = ('Tests',)
+__version__ = '17.05.16'
+
+from .tests import Tests as _Tests
+
+from pygeodesy import ellipsoidalVincenty, instrument, instrumented, \
+                      instrumentHistograms, instrumentReset, instrumentSnapshot, \
+                      parseMGRS, simplify1, toOsgr, toUtm
+
+
+class Tests(_Tests):
+
+    def testInstrument(self):
+        # instrument module tests
+        LatLon = ellipsoidalVincenty.LatLon
+        p = LatLon(-37.95103, 144.42487)
+        q = LatLon(-37.65282, 143.92650)
+
+        instrumentReset()
+        self.test('instrumented', instrumented(), 'False')
+        p.distanceTo(q)
+        self.test('disabled', instrumentSnapshot(), '{}')
+
+        e = instrumented(True)
+        self.test('instrumented', e, 'False')
+        self.test('instrumented', instrumented(), 'True')
+
+        d = p.distanceTo(q)
+        self.test('distanceTo', d, '54971.954', fmt='%.3f')
+        p.destination(54972.271, 306.86816)
+        try:
+            p.distanceTo(p)
+        except ellipsoidalVincenty.VincentyError:
+            pass
+        u = toUtm(p)
+        u.toLatLon(LatLon)
+        parseMGRS('31U DQ 48251 11932')
+        toOsgr(LatLon(52.65798, 1.71605))
+        simplify1((p, q, p), 10)
+
+        s = instrumentSnapshot()
+        self.test('names', ', '.join(sorted(s.keys())), 'LatLon.convertDatum, Utm.toLatLon, Vincenty.direct, Vincenty.direct.iterations, Vincenty.inverse, Vincenty.inverse.errors, Vincenty.inverse.iterations, parseMGRS, simplify1, toOsgr, toUtm')
+        self.test('Vincenty.inverse', s['Vincenty.inverse'][:2], '(2, 2)')
+        self.test('Vincenty.inverse.iterations', s['Vincenty.inverse.iterations'][:2], '(1, 4)')
+        self.test('Vincenty.inverse.errors', s['Vincenty.inverse.errors'], '(1, 1, 0.0)')
+        self.test('Vincenty.direct.iterations', s['Vincenty.direct.iterations'][:2], '(1, 3)')
+        self.test('secs', all(t[2] >= 0 for t in s.values()), 'True')
+
+        h = instrumentHistograms()
+        self.test('Vincenty.direct', h['Vincenty.direct'], '[0, 0, 0, 1]')
+        self.test('Vincenty.inverse', h['Vincenty.inverse'], '[1, 0, 0, 0, 1]')
+        a = LatLon(0, 0)
+        a.iterations = 3
+        try:  # near-antipodal, not converging in 3 iterations
+            t = a.distanceTo(LatLon(0.5, 179.7))
+        except ellipsoidalVincenty.VincentyError as x:
+            t = str(x)[:14]
+        self.test('no convergence', t, 'no convergence')
+        self.test('Vincenty.inverse', instrumentHistograms()['Vincenty.inverse'], '[2, 0, 0, 0, 1]')
+        s = instrumentSnapshot()
+        self.test('Vincenty.inverse.errors', s['Vincenty.inverse.errors'], '(2, 2, 0.0)')
+
+        self.test('instrumented', instrumented(e), 'True')
+        p.distanceTo(q)
+        self.test('Vincenty.inverse', instrumentSnapshot()['Vincenty.inverse'][:2], '(3, 3)')
+        self.test('reset', instrumentReset() == s, 'True')
+        self.test('reset', instrumentSnapshot(), '{}')
+        self.test('reset', instrumentHistograms(), '{}')
+
+
+if __name__ == '__main__':
+
+    t = Tests(__file__, __version__, instrument)
+    t.testInstrument()
+    t.results()
+    t.exit()
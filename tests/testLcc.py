@@ -4,11 +4,12 @@
 # Test LCC functions and methods.
 
 __all__ = ('Tests',)
-__version__ = '17.05.02'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
-from pygeodesy import F_D, F_DMS, Conic, Conics, Datums, Lcc, toLcc
+from pygeodesy import F_D, F_DMS, Conic, Conics, Datums, Lcc, \
+                      latLonsToLccs, lccsToLatLons, toLcc
 
 
 class Tests(_Tests):
@@ -60,6 +61,40 @@ class Tests(_Tests):
                     self.test(n, ll, str(ll_))
                     self.test(n, ll.datum.name, ll_.datum.name)
 
+    def testLccs(self, LatLon):
+
+        c = Conics.Fr93Lb
+        t = latLonsToLccs((46.5, 49, 44), (3, 1, 5), conic=c)
+        self.test('latLonsToLccs', len(t), '3')
+        self.test('latLonsToLccs', '%.3f, %.3f' % t[0], '700000.000, 6600000.000')
+        for (e, n), ll in zip(t[1:], (LatLon(49, 1, datum=c.datum),
+                                      LatLon(44, 5, datum=c.datum))):
+            lb = toLcc(ll, conic=c)
+            self.test('latLonsToLccs', '%.6f, %.6f' % (e, n),
+                      '%.6f, %.6f' % (lb.easting, lb.northing))
+
+        es, ns = zip(*t)
+        for trips in (None, 4):
+            t = lccsToLatLons(es, ns, conic=c, trips=trips)
+            self.test('lccsToLatLons', '%.8f, %.8f' % t[0], '46.50000000, 3.00000000')
+            self.test('lccsToLatLons', '%.8f, %.8f' % t[1], '49.00000000, 1.00000000')
+            self.test('lccsToLatLons', '%.8f, %.8f' % t[2], '44.00000000, 5.00000000')
+
+        ll = Lcc(1894410.9, 1564649.5, conic=Snyder).toLatLon(LatLon)
+        t = lccsToLatLons((1894410.9,), (1564649.5,), conic=Snyder)
+        self.test('lccsToLatLons', '%.12f, %.12f' % t[0], '%.12f, %.12f' % (ll.lat, ll.lon))
+
+        try:
+            t = lccsToLatLons(es, ns, conic=c, trips=0)
+        except ValueError as x:
+            t = str(x)
+        self.test('lccsToLatLons', t, 'trips invalid: 0')
+        try:
+            t = latLonsToLccs((1, 2), (3,))
+        except ValueError as x:
+            t = str(x)
+        self.test('latLonsToLccs', t, 'unequal len: 2 vs 1')
+
 
 if __name__ == '__main__':
 
@@ -74,6 +109,7 @@ if __name__ == '__main__':
     t = Tests(__file__, __version__, lcc)
     t.testLcc(nLatLon)
     t.testLcc(vLatLon)
+    t.testLccs(vLatLon)
     t.testConic(vLatLon, 1)
     t.testConic(nLatLon, 2)
     t.results()
@@ -4,7 +4,7 @@
 # Test MGRS functions and methods.
 
 __all__ = ('Tests',)
-__version__ = '17.04.07'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
@@ -45,6 +45,30 @@ class Tests(_Tests):
             m = p.toUtm().toMgrs()
             self.test('toUtm(%s).toMgrs' % (p,), m, x)
 
+        t = mgrs.encodeMGRS((48.8582, 60.0, 76.0, -33.8688),
+                            (2.2945,  3.0, 13.0, 151.2093))
+        self.test('encodeMGRS', t, "['31U DQ 48251 11932', '32V JM 65640 66593', '33X VE 45999 36099', '56H LH 34368 50948']")
+        t = mgrs.encodeMGRS((48.8582,), (2.2945,), prec=4, sep='')
+        self.test('encodeMGRS', t, "['31UDQ4811']")
+
+        t, m = mgrs.decodeMGRS(('31U DQ 48251 11932', '31UDQ4825111932', '31U DQ 4825111932',
+                                '4QFJ12345678', '56H LH 34570 51112', '31U DQ 04825 01193'))
+        self.test('decodeMGRS', m, '[False, False, False, False, False, False]')
+        self.test('decodeMGRS', t[0], "(31, 'N', 448251.0, 5411932.0, 'U')")
+        self.test('decodeMGRS', t[1] == t[0] == t[2], 'True')
+        self.test('decodeMGRS', t[3], "(4, 'N', 612340.0, 2356780.0, 'Q')")
+        self.test('decodeMGRS', t[4], "(56, 'S', 334570.0, 6251112.0, 'H')")
+        self.test('decodeMGRS', t[5], "(31, 'N', 404825.0, 5401193.0, 'U')")
+        m = mgrs.parseMGRS('31U DQ 04825 01193')
+        self.test('parseMGRS', m.toUtm(), '31 N 404825 5401193')
+        t, m = mgrs.decodeMGRS(('31U IQ 1 1', '31U DQ 48251 11932', '', None))
+        self.test('decodeMGRS', t, "[(0, '', nan, nan, ''), (31, 'N', 448251.0, 5411932.0, 'U'), (0, '', nan, nan, ''), (0, '', nan, nan, '')]")
+        self.test('decodeMGRS', m, '[True, False, True, True]')
+        try:
+            self.test('parseMGRS', mgrs.parseMGRS('31U IQ 1 1'), ValueError)
+        except ValueError as x:
+            self.test('parseMGRS', x, "en100k invalid: 'IQ'")
+
 
 if __name__ == '__main__':
 
@@ -4,11 +4,11 @@
 # Test OSGR functions and methods.
 
 __all__ = ('Tests',)
-__version__ = '17.04.07'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
-from pygeodesy import F_DMS, Datums, osgr
+from pygeodesy import F_DMS, Datums, fStr, osgr
 
 
 class Tests(_Tests):
@@ -31,16 +31,17 @@ class Tests(_Tests):
 
         p = g.toLatLon(LatLon)
         p.height = 0
-        self.test('toLatLon1', p.toStr(F_DMS), '52°39′28.72″N, 001°42′57.74″E', known=True)
-        self.test('toLatLon1', p, '52.657977°N, 001.716038°E', known=True)
+        self.test('toLatLon1', p.toStr(F_DMS), '52°39′28.72″N, 001°42′57.79″E')
+        self.test('toLatLon1', p, '52.657979°N, 001.716052°E')
         r = p.toOsgr()
-        self.test('toOsgr1', r.toStr(0), '651409.903, 313177.270', known=True)
+        self.test('toOsgr1', r.toStr(0), '651409,313177')
 
         p = g.toLatLon(LatLon, datum=Datums.OSGB36)
-        self.test('toLatLon2', p.toStr(F_DMS), '52°39′27.25″N, 001°43′04.47″E', known=True)
-        self.test('toLatLon2', p, '52.657568°N, 001.717908°E', known=True)
+        # OS "A guide to coordinate systems in Great Britain", worked example
+        self.test('toLatLon2', p.toStr(F_DMS, prec=4), '52°39′27.2531″N, 001°43′04.5177″E')
+        self.test('toLatLon2', p, '52.65757°N, 001.717922°E')
         r = osgr.toOsgr(p)
-        self.test('toOsgr2', r.toStr(0), '651409,313177', known=True)
+        self.test('toOsgr2', r.toStr(-3), '651409.903,313177.270')
 
         p = LatLon(52.65798, 1.71605)
         r = osgr.toOsgr(p)  # TG 51409 13177
@@ -71,6 +72,19 @@ class Tests(_Tests):
         r = osgr.parseOSGR(g.toStr(prec=-3))
         self.test('OSGR6', r.toStr(prec=0), '651409,313177')
 
+        t = osgr.osgrsToLatLons((651409.903, 400000, 300000), (313177.270, 1200000, 50000))
+        self.test('osgrsToLatLons', fStr(t[0], prec=6), '52.657979, 1.716052')
+        self.test('osgrsToLatLons', fStr(t[1], prec=6), '60.683214, -2.001839')
+        self.test('osgrsToLatLons', fStr(t[2], prec=6), '50.341405, -3.406654')
+        t = osgr.latLonsToOsgrs(*zip(*t))
+        self.test('latLonsToOsgrs', fStr(t[0], prec=3), '651409.9, 313177.27')
+        self.test('latLonsToOsgrs', fStr(t[1], prec=3), '399999.997, 1199999.999')
+        self.test('latLonsToOsgrs', fStr(t[2], prec=3), '299999.998, 50000.0')
+        t = osgr.osgrsToLatLons((651409.903,), (313177.270,), datum=Datums.OSGB36)
+        self.test('osgrsToLatLons', fStr(t[0], prec=6), '52.65757, 1.717922')
+        t = osgr.latLonsToOsgrs(*zip(*t), datum=Datums.OSGB36)
+        self.test('latLonsToOsgrs', fStr(t[0], prec=3), '651409.903, 313177.27')
+
 
 if __name__ == '__main__':
 
@@ -4,7 +4,7 @@
 # Test spherical earth model functions and methods.
 
 __all__ = ('Tests',)
-__version__ = '17.05.06'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
@@ -61,6 +61,28 @@ class Tests(_Tests):
         self.test('rhumbMidpointo', m, '51.0455°N, 001.595727°E')
         self.test('rhumbMidpointo', isinstance(m, LatLon), 'True')
 
+        lats, lons = (50.964, 52.205, -33.8688), (1.853, 0.119, 151.2093)
+        qs = [LatLon(a, b) for a, b in zip(lats, lons)]
+        t = p.rhumbBearingsTo(lats, lons)
+        self.test('rhumbBearingsTo', t[0], '116.722', '%.3f')
+        self.test('rhumbBearingsTo', t, repr([p.rhumbBearingTo(q) for q in qs]), '%r')
+        t = p.rhumbDistancesTo(lats, lons)
+        self.test('rhumbDistancesTo', t[0], '40307.8', '%.1f')
+        self.test('rhumbDistancesTo', t, repr([p.rhumbDistanceTo(q) for q in qs]), '%r')
+        t = p.rhumbMidpointsTo(lats, lons)
+        self.test('rhumbMidpointsTo', '(%.4f, %.6f)' % t[0], '(51.0455, 1.595727)')
+        self.test('rhumbMidpointsTo', t, repr([(m.lat, m.lon) for m in
+                                               (p.rhumbMidpointTo(q) for q in qs)]), '%r')
+        t = p.rhumbDestinations((40300, 1e6, 5e6), 116.7)
+        self.test('rhumbDestinations', '(%.6f, %.3f)' % t[0], '(50.964155, 1.853)')
+        self.test('rhumbDestinations', t, repr([(d.lat, d.lon) for d in
+                                                (p.rhumbDestination(d, 116.7) for d in (40300, 1e6, 5e6))]), '%r')
+        try:
+            t = p.rhumbDistancesTo(lats, lons[:2])
+        except ValueError as x:
+            t = str(x)
+        self.test('rhumbDistancesTo', t, 'unequal len: 3 vs 2')
+
         b = LatLon(45, 1), LatLon(45, 2), LatLon(46, 2), LatLon(46, 1)
         self.test('areaOf', spherical.areaOf(b), '8.6660587507e+09', fmt='%.10e')  # 8666058750.718977
 
@@ -73,19 +95,206 @@ class Tests(_Tests):
             p = LatLon(85, 90), LatLon(85, 0), LatLon(85, -180)
             self.test('isPoleEnclosedBy', spherical.isPoleEnclosedBy(p), 'True', known=True)
 
+    def testKernels(self, LatLon, K):
+        # great circle kernels versus LatLon methods
+        lats, lons = (50.964, 52.205, -33.8688), (1.853, 0.119, 151.2093)
+
+        p = LatLon(52.205, 0.119)
+        qs = [LatLon(a, b) for a, b in zip(lats, lons)]
+
+        t = K.haversines(p.lat, p.lon, lats, lons)
+        self.test('haversines', t[1], '0.0', '%.1f')
+        self.test('haversines', t, repr([p.distanceTo(q) for q in qs]), '%r')
+        t = K.initialBearings(p.lat, p.lon, lats, lons)
+        self.test('initialBearings', t, repr([p.initialBearingTo(q) for q in qs]), '%r')
+        t = K.finalBearings(p.lat, p.lon, lats, lons)
+        self.test('finalBearings', t, repr([p.finalBearingTo(q) for q in qs]), '%r')
+
+        t = K.destinations(51.4778, -0.0015, (7794, 1e6), 300.7)
+        self.test('destinations', '(%.4f, %.4f)' % t[0], '(51.5135, -0.0983)')
+        s = LatLon(51.4778, -0.0015)
+        self.test('destinations', t, repr([(d.lat, d.lon) for d in
+                                           (s.destination(d, 300.7) for d in (7794, 1e6))]), '%r')
+
+        fs = 0.25, 0, 1.5
+        t = K.intermediates(p.lat, p.lon, lats, lons, fs)
+        self.test('intermediates', t, repr([(i.lat, i.lon) for i in
+                                            (p.intermediateTo(q, f) for q, f in zip(qs, fs))]), '%r')
+
+        s, e = LatLon(53.3206, -1.7297), LatLon(53.1887, 0.1334)
+        t = K.crossTrackDistances(lats, lons, s.lat, s.lon, e.lat, e.lon)
+        self.test('crossTrackDistances', ', '.join('%.6f' % d for d in t),
+                                         ', '.join('%.6f' % q.crossTrackDistanceTo(s, e) for q in qs))
+        t = K.crossTrackDistances(53.2611, -0.7972, [s.lat], [s.lon], e.lat, e.lon)
+        self.test('crossTrackDistances', t[0], '-307.5', '%.1f')
+
+        p = LatLon(52.205, 0.119)
+        t = K.equirectangulars(p.lat, p.lon, (52.2, 52.3, 48.857), (0.1, 0.2, 2.351))
+        self.test('equirectangulars', '%.3f, %.3f' % tuple(t[:2]), '1409.137, 11915.969')
+        self.test('equirectangulars', t[2], '%.6f' % (p.distanceTo(LatLon(48.857, 2.351)),), '%.6f')  # haversine
+        self.test('equirectangularTo', p.equirectangularTo(LatLon(52.3, 0.2)), '%.6f' % (t[1],), '%.6f')
+        self.test('equirectangularTo', p.equirectangularTo(p), '0.0', '%.1f')
+        d = p.distanceTo(LatLon(52.3, 0.2))
+        self.test('equirectangularTo', abs(t[1] - d) < 0.01, 'True')
+        t = K.equirectangulars([p.lat], [p.lon + 720], 52.3, -719.8)  # |lon delta| > 540
+        self.test('equirectangulars', t[0], '11915.969', '%.3f')
+        t = K.equirectangulars(p.lat, p.lon, [52.3], [0.2], limit=1e3)
+        self.test('equirectangulars', t[0], '%.6f' % (d,), '%.6f')  # beyond limit
+
+        try:
+            t = K.haversines(lats, lons[:2], 0, 0)
+        except ValueError as x:
+            t = str(x)
+        self.test('haversines', t, 'unequal len: 3 vs 2')
+
+        p, q = LatLon(51.8853, 0.2545), LatLon(49.0034, 2.5735)
+        t, m = K.intersections([p.lat, q.lat], [p.lon, q.lon], 108.547, q.lat, q.lon, 32.435)
+        i = p.intersection(108.547, q, 32.435)
+        self.test('intersections', t[0], repr((i.lat, i.lon)), '%r')
+        self.test('intersections', '(%.4f, %.4f)' % t[0], '(50.9078, 4.5084)')
+        self.test('intersections', m, '[False, True]', '%r')
+
+    def testNvectorKernels(self, LatLon, K):
+        # n-vector kernels versus LatLon methods
+        lats, lons = (53.2611, 51.0, 51.0, 52.205), (-0.7972, 1.9, 2.1, 0.119)
+        ps = [LatLon(a, b) for a, b in zip(lats, lons)]
+
+        t = K.nvectors(lats, lons)
+        self.test('nvectors', t, repr([p.toNvector().to3xyz() for p in ps]), '%r')
+        self.test('latlons', '(%.4f, %.4f)' % K.latlons(t)[0], '(53.2611, -0.7972)')
+
+        s, e = LatLon(53.3206, -1.7297), LatLon(53.1887, 0.1334)
+        ns, ne = K.nvectors((s.lat, e.lat), (s.lon, e.lon))
+
+        d = K.distances(t, ns)
+        self.test('distances', d, repr([p.distanceTo(s) for p in ps]), '%r')
+        d = K.crossTrackDistances(t, ns, ne)
+        self.test('crossTrackDistances', d[0], '-307.55', '%.2f')
+        self.test('crossTrackDistances', d, repr([p.crossTrackDistanceTo(s, e) for p in ps]), '%r')
+        d = K.alongTrackDistances(t, ns, ne)
+        self.test('alongTrackDistances', d[0], '62331.58', '%.2f')
+        self.test('alongTrackDistances', d, repr([p.alongTrackDistanceTo(s, e) for p in ps]), '%r')
+
+        s, e = LatLon(51.0, 1.0), LatLon(51.0, 2.0)
+        d = K.nearestOns(lats, lons, s.lat, s.lon, e.lat, e.lon)
+        self.test('nearestOns', '(%.4f, %.4f)' % d[1], '(51.0004, 1.9000)')
+        self.test('nearestOns', d, repr([(n.lat, n.lon) for n in
+                                         (p.nearestOn(s, e) for p in ps)]), '%r')
+
+        try:
+            d = K.distances(t, t[:2])
+        except ValueError as x:
+            d = str(x)
+        self.test('distances', d, 'unequal len: 4 vs 2')
+
+        p, q = LatLon(51.8853, 0.2545), LatLon(49.0034, 2.5735)
+        np, nq = K.nvectors((p.lat, q.lat), (p.lon, q.lon))
+        d, m = K.intersections([np, np], [108.55, 288.55], nq, 32.44)
+        i = p.intersection(108.55, q, 32.44)
+        self.test('intersections', '(%.4f, %.4f)' % d[0], '(50.9076, 4.5086)')
+        self.test('intersections', d[0], repr((i.lat, i.lon)), '%r')
+        i = p.intersection(288.55, q, 32.44)
+        self.test('intersections', d[1], repr((i.lat, i.lon)), '%r')
+        self.test('intersections', m, '[False, False]', '%r')
+        d, m = K.intersections([np], nq, nq, 32.44)
+        i = p.intersection(q, q, 32.44)
+        self.test('intersections', d[0], repr((i.lat, i.lon)), '%r')
+        d, m = K.intersections(np, [nq], nq, [nq])  # coincident
+        self.test('intersections', m, '[True]', '%r')
+
+        p, q = LatLon("47°18.228'N", "002°34.326'W"), LatLon("47°18.664'N", "002°31.717'W")
+        np, nq = K.nvectors((p.lat, q.lat), (p.lon, q.lon))
+        d, m = K.triangulates([np, np], [7, 90], nq, [295, 90])
+        i = p.triangulate(7, q, 295)
+        self.test('triangulates', d[0], repr((i.lat, i.lon)), '%r')
+        self.test('triangulates', m, '[False, False]', '%r')
+        d, m = K.triangulates([(1.0, 0, 0)], 90, (0, 1.0, 0), 90)  # same
+        self.test('triangulates', m, '[True]', '%r')
+
+        p, q, r = LatLon(0, 0), LatLon(0, 1), LatLon(1, 0)
+        t = K.nvectors((p.lat, q.lat, r.lat), (p.lon, q.lon, r.lon))
+        d, m = K.trilaterates(t[0], [71900, 1e3], t[1], [71900, 1], t[2], [87700, 1])
+        i = p.trilaterate(71900, q, 71900, r, 87700)
+        self.test('trilaterates', '(%.6f, %.6f)' % d[0], '(0.397998, 0.500000)')
+        self.test('trilaterates', d[0], repr((i.lat, i.lon)), '%r')
+        self.test('trilaterates', m, '[False, True]', '%r')
+
+        x = LatLon(0.4, 0.5)
+        ps = [LatLon(a, b) for a, b in ((0, 0), (0, 1), (1, 0), (1, 1), (0.5, 0.2))]
+        t = K.nvectors([p.lat for p in ps], [p.lon for p in ps])
+        d = [p.distanceTo(x) for p in ps]
+        ll, rs, cs, m = K.multilaterates([t, t[:2], t], [d, d[:2], [r + e for r, e in zip(d, (10, -10, 10, -10, 0))]])
+        self.test('multilaterates', '(%.9f, %.9f)' % ll[0], '(0.400000000, 0.500000000)')
+        self.test('multilaterates', max(abs(r) for r in rs[0]) < 1e-6, 'True')
+        self.test('multilaterates', '%.3f' % x.distanceTo(LatLon(*ll[2])), '9.919')
+        self.test('multilaterates', ', '.join('%.1f' % r for r in rs[2]), '1.4, -3.2, 4.8, -2.6, -8.9')
+        self.test('multilaterates', ', '.join('%.1f' % c for c in cs[2][0] + cs[2][1]), '19.9, 2.0, 2.0, 13.9')
+        self.test('multilaterates', m, '[False, True, False]', '%r')
+
+        # starting at the mean of these points converges
+        # to the mirror image, 221 Km north of x
+        ps = [LatLon(a, b) for a, b in ((-77.029, -128.384), (-77.028, -128.748), (-77.037, -128.573))]
+        t = K.nvectors([p.lat for p in ps], [p.lon for p in ps])
+        x = LatLon(-78.025, -129.07)
+        d = [p.distanceTo(x) for p in ps]
+        ll, rs, _, m = K.multilaterates([t, t], [d, (d[0] + 20e3, d[1], d[2])])
+        self.test('multilaterates', '(%.6f, %.6f)' % ll[0], '(-78.025000, -129.070000)')
+        self.test('multilaterates', max(abs(r) for r in rs[0]) < 1e-6, 'True')
+        self.test('multilaterates', m, '[False, True]', '%r')  # no solution
+
+        # beacons 20 m apart, range noise 0.1 m
+        b = LatLon(52, 13)
+        ps = b, b.destination(20, 90), b.destination(20, 0), b.destination(20, 0).destination(20, 90)
+        t = K.nvectors([p.lat for p in ps], [p.lon for p in ps])
+        x = b.destination(14, 45).destination(3, 0)
+        d = [p.distanceTo(x) + e for p, e in zip(ps, (0.08, -0.1, 0.05, -0.02))]
+        ll, rs, _, m = K.multilaterates([t, t], [d, d[:3] + [d[3] + 2]], tolerance=0.3)
+        self.test('multilaterates', '%.3f' % x.distanceTo(LatLon(*ll[0])), '0.082')
+        self.test('multilaterates', ', '.join('%.3f' % r for r in rs[0]), '0.044, -0.037, -0.025, 0.036')
+        self.test('multilaterates', m, '[False, True]', '%r')  # RMS over tolerance
+
+    def testPolyline(self, LatLon, Polyline):
+        r = LatLon(51, 1), LatLon(51, 2), LatLon(52, 3), LatLon(52, 4)
+        p = Polyline(r, leaf=2)
+        self.test('Polyline', len(p), '3')
+
+        s = LatLon(51.0, 1.9)
+        t = p.nearest(s)
+        self.test('nearest', '%d, %.6f, %.2f, %.1f, %.2f' % t, '0, 0.900001, 42.71, 62979.2, 42.71')
+        self.test('nearest', t[4], '%.6f' % (s.nearestOn(r[0], r[1]).distanceTo(s),), '%.6f')
+        self.test('nearest', t[2], '%.6f' % (s.crossTrackDistanceTo(r[0], r[1]),), '%.6f')
+        self.test('nearest', t[3], '%.6f' % (s.alongTrackDistanceTo(r[0], r[1]),), '%.6f')
+
+        t = p.nearest(LatLon(51.5, 2.6))
+        self.test('nearest', '%d, %.3f' % t[:2], '1, 0.529')
+        t = p.nearest(LatLon(53, 5))  # beyond the end
+        self.test('nearest', '%d, %.1f, %.1f' % (t[0], t[1], t[4]),
+                             '2, 1.0, %.1f' % (LatLon(53, 5).distanceTo(r[3]),))
+
+        try:
+            t = Polyline(r[:1])
+        except ValueError as x:
+            t = str(x)
+        self.test('Polyline', t, 'too few points: 1')
+
 
 if __name__ == '__main__':
 
-    from pygeodesy import sphericalNvector as N
+    from pygeodesy import nvectorKernels as K, \
+                          sphericalNvector as N
     t = Tests(__file__, __version__, N)
     t.testLatLon(N.LatLon, Sph=True)
     t.testSpherical(N.LatLon, N)
     t.testVectorial(N.LatLon, N.Nvector, N.sumOf)
+    t.testNvectorKernels(N.LatLon, K)
+    t.testPolyline(N.LatLon, N.Polyline)
     t.results()
 
-    from pygeodesy import sphericalTrigonometry as T
+    from pygeodesy import sphericalKernels as K, \
+                          sphericalTrigonometry as T
     t = Tests(__file__, __version__, T)
     t.testLatLon(T.LatLon, Sph=True)
     t.testSpherical(T.LatLon, T)
+    t.testKernels(T.LatLon, K)
     t.results()
     t.exit()
@@ -0,0 +1,44 @@
+
+# -*- coding: utf-8 -*-
+
+# Test utility functions.
+
+__all__ = ('Tests',)
+__version__ = '17.05.16'
+
+from .tests import Tests as _Tests
+
+from pygeodesy import fdot, fdot3, fprecise
+
+
+class Tests(_Tests):
+
+    def testUtils(self):
+        # utils module tests
+        p = fprecise()
+        self.test('fprecise', p, 'False')
+        a = 1e16, 1, -1e16, 1
+        self.test('fdot', fdot(a, 1, 1, 1, 1), '1.0')
+        self.test('fdot', fdot(a, 1, 1, 1, 1, precise=True), '2.0')
+        self.test('fdot3', fdot3(a, (1, 1, 1, 1), (1, 1, 1, 1), precise=True), '2.0')
+        self.test('fdot3', fdot3((1, 2), (3, 4), (5, 6), start=7), '70.0')
+        self.test('fdot', fdot((1, 2, 3), 4, 5, 6), '32.0')
+        try:
+            t = fdot(a, 1, 1, 1, 1, precize=True)
+        except TypeError as x:
+            t = str(x)
+        self.test('fdot', t, 'keyword invalid: precize')
+        self.test('fprecise', fprecise(True), str(p))
+        self.test('fdot', fdot(a, 1, 1, 1, 1), '2.0')
+        self.test('fdot', fdot(a, 1, 1, 1, 1, precise=None), '2.0')
+        self.test('fprecise', fprecise(p), 'True')
+
+
+if __name__ == '__main__':
+
+    from pygeodesy import utils  # private
+
+    t = Tests(__file__, __version__, utils)
+    t.testUtils()
+    t.results()
+    t.exit()
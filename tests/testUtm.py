@@ -4,7 +4,7 @@
 # Test UTM functions and methods.
 
 __all__ = ('Tests',)
-__version__ = '17.04.07'
+__version__ = '17.05.16'
 
 from .tests import Tests as _Tests
 
@@ -83,6 +83,12 @@ class Tests(_Tests):
                     x = u = str(e)
             self.test('toUtm(%s)' % (p,), u, x)
 
+        # toLatLon used to loop forever for these
+        for u, x in (('20 S 342636 3345121', '60.000994°S, 065.821927°W'),
+                     ('51 N 437359 7037892', '63.463901°N, 121.743277°E')):
+            ll = utm.parseUTM(u).toLatLon(LatLon)
+            self.test('Utm.toLatLon(%s)' % (u,), ll, x)
+
 
 if __name__ == '__main__':
 
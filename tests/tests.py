@@ -146,6 +146,10 @@ class Tests(object):
         self.test('lat/lonDMS F_RAD', p.toStr(F_RAD, 6), '0.911144N, 0.002453E')
         q = LatLon(*list(map(degrees, p.to2ab())))
         self.test('equals', q.equals(p), 'True')
+        q = LatLon(0, 90)
+        self.test('to3xyz', q.to3xyz()[0], '0.0', '%.1f')
+        q.lat, q.lon = p.lat, p.lon  # reset cached sin, cos
+        self.test('to3xyz', q.to3xyz() == p.to3xyz(), 'True')
 
         # <http://www.edwilliams.org/avform.htm#XTE>
         LAX = LatLon(33.+57./60, -(118.+24./60))
@@ -313,6 +317,18 @@ class Tests(object):
                 n = '%s (%s)' % (n, o)
             self.test(n, hasattr(m, a), 'True')
 
+    def testLifted(self, pkg, lazily):
+        # check that the generated table of lifted names
+        # matches the __all__ of the sub-modules, if not
+        # regenerate it with  python -m pygeodesy.lazily
+        t = lazily._table() == lazily._lazy_modules
+        self.test('lazily', t, 'True')
+        try:  # missing name, not a failed import
+            t = getattr(pkg, 'noSuchName')
+        except AttributeError as x:
+            t = x.__class__.__name__
+        self.test('noSuchName', t, 'AttributeError')
+
     def testVectorial(self, LatLon, Nvector, sumOf):
         if hasattr(LatLon, 'crossTrackDistanceTo'):
             p = LatLon(53.2611, -0.7972)
@@ -392,21 +408,22 @@ class Tests(object):
 if __name__ == '__main__':
 
     from pygeodesy import datum, dms, \
-                          ellipsoidalNvector, ellipsoidalVincenty, \
-                          lcc, mgrs, nvector, osgr, simplify, \
-                          sphericalNvector, sphericalTrigonometry, \
-                          vector3d, utm, utils  # PYCHOK expected
+                          ellipsoidalNvector, ellipsoidalVincenty, instrument, \
+                          lazily, lcc, mgrs, nvector, nvectorKernels, osgr, simplify, \
+                          sphericalKernels, sphericalNvector, \
+                          sphericalTrigonometry, vector3d, utm, utils  # PYCHOK expected
     import pygeodesy  # PYCHOK expected
 
     t = Tests(__file__, __version__)
     # check that __all__ names exist in each module
     t.testModule(pygeodesy, 'pygeodesy')
     for m in (datum, dms,
-              ellipsoidalNvector, ellipsoidalVincenty,
-              lcc, mgrs, nvector, osgr, simplify,
-              sphericalNvector, sphericalTrigonometry,
+              ellipsoidalNvector, ellipsoidalVincenty, instrument,
+              lcc, mgrs, nvector, nvectorKernels, osgr, simplify,
+              sphericalKernels, sphericalNvector, sphericalTrigonometry,
               vector3d, utm, utils):
         t.testModule(m)
+    t.testLifted(pygeodesy, lazily)
     t.testLatLonAttr(ellipsoidalNvector, ellipsoidalVincenty,
                      sphericalNvector, sphericalTrigonometry)
     t.results(nl=1)